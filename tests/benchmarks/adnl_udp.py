@@ -0,0 +1,77 @@
+"""Benchmark ADNL-UDP packet building and decryption.
+
+Run with ``python -m tests.benchmarks.adnl_udp``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import typing as t
+from unittest.mock import MagicMock
+
+from ton_core import Client, Server
+
+from tonutils.transports.adnl.channel import AdnlChannel
+from tonutils.transports.adnl.udp import AdnlUdpTransport
+
+PACKETS = 5_000
+
+
+def make_transport() -> tuple[AdnlUdpTransport, list[bytes]]:
+    """Create a transport whose socket records sent datagrams."""
+    transport = AdnlUdpTransport()
+    sent: list[bytes] = []
+    transport._shards[0].udp = MagicMock(sendto=lambda packet, _: sent.append(packet))
+    transport._bound = True
+    return transport, sent
+
+
+def report(name: str, elapsed: float) -> None:
+    print(f"{name:>24}: {elapsed:7.3f} s ({PACKETS / elapsed:9.0f} datagrams/s)")  # noqa: T201
+
+
+async def main() -> None:
+    """Send and decrypt init and channel packets between two in-memory transports."""
+    sender, sent = make_transport()
+    receiver, _ = make_transport()
+    query: dict[str, t.Any] = {"@type": "adnl.message.query", "query_id": "00" * 32, "query": b"\x00" * 40}
+
+    for name, cold in (("init send+recv (cold)", True), ("init send+recv (cached)", False)):
+        sent.clear()
+        started = time.perf_counter()
+        for _ in range(PACKETS):
+            if cold:
+                sender._shared_keys.clear()
+                receiver._shared_keys.clear()
+            await sender.send_init_packet_raw(host="127.0.0.1", port=1, pub_key=receiver._local_pub, messages=[query])
+            receiver.decrypt_incoming(sent[-1])
+        report(name, time.perf_counter() - started)
+
+    sender_key = Client(Client.generate_ed25519_private_key())
+    receiver_key = Client(Client.generate_ed25519_private_key())
+    peer = sender.get_or_create_peer_raw(host="127.0.0.1", port=1, pub_key=receiver._local_pub)
+    sender.set_channel(
+        peer,
+        AdnlChannel(
+            sender_key, Server("", 0, bytes(receiver_key.ed25519_public)), sender.local_key_id, receiver.local_key_id
+        ),
+    )
+    back = receiver.get_or_create_peer_raw(host="127.0.0.1", port=2, pub_key=sender._local_pub)
+    receiver.set_channel(
+        back,
+        AdnlChannel(
+            receiver_key, Server("", 0, bytes(sender_key.ed25519_public)), receiver.local_key_id, sender.local_key_id
+        ),
+    )
+
+    sent.clear()
+    started = time.perf_counter()
+    for _ in range(PACKETS):
+        await sender.send_channel_packet(peer, {"messages": [query]})
+        receiver.decrypt_incoming(sent[-1])
+    report("channel send+recv", time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
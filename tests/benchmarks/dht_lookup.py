@@ -0,0 +1,62 @@
+"""Benchmark DHT priority list construction over a large routing table.
+
+Run with ``python -m tests.benchmarks.dht_lookup``.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from tonutils.clients.dht import DhtNode, PriorityList, RoutingTable
+from tonutils.clients.dht.models import affinity
+
+NODES = 5_000
+LOOKUPS = 2_000
+K = 10
+
+
+def full_scan(nodes: list[DhtNode], target: bytes) -> PriorityList:
+    """Previous approach: score and sort every known node per lookup."""
+    good_count, bad_count = K + K // 2, K // 2
+    good = sorted(((affinity(n.adnl_id, target), n) for n in nodes if n.bad_score == 0), key=lambda x: -x[0])
+    bad = sorted(((affinity(n.adnl_id, target), n) for n in nodes if n.bad_score > 0), key=lambda x: -x[0])
+    plist = PriorityList(max_len=good_count, target_id=target)
+    for _, node in good[:good_count] + bad[:bad_count]:
+        plist.add(node)
+    return plist
+
+
+def indexed(table: RoutingTable, target: bytes) -> PriorityList:
+    """Indexed approach: walk outward from the target's position in ID order."""
+    good_count, bad_count = K + K // 2, K // 2
+    good, bad = table.closest(target, good_count, bad_count)
+    plist = PriorityList(max_len=good_count, target_id=target)
+    for node in good + bad:
+        plist.add(node)
+    return plist
+
+
+def main() -> None:
+    """Build both priority lists for random targets and report lookups per second."""
+    # Bucket capacity large enough to keep every node; lookups still use ``K``.
+    table = RoutingTable(os.urandom(32), k=NODES)
+    for n in range(NODES):
+        node = DhtNode(adnl_id=os.urandom(32), addr="127.0.0.1:1", server_key=os.urandom(32))
+        if n % 5 == 0:
+            node.update_status(False)
+        table.add(node)
+    nodes = table.get_nodes()
+    targets = [os.urandom(32) for _ in range(LOOKUPS)]
+
+    print(f"{len(nodes)} known nodes, {LOOKUPS} lookups")  # noqa: T201
+    for name, lookup, source in (("full scan", full_scan, nodes), ("indexed", indexed, table)):
+        started = time.perf_counter()
+        for target in targets:
+            lookup(source, target)  # type: ignore[operator]
+        elapsed = time.perf_counter() - started
+        print(f"{name:>10}: {elapsed:7.3f} s ({LOOKUPS / elapsed:9.0f} lookups/s)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Benchmark ``WalletHighloadV3R1`` out-action packing.
+
+Run with ``python -m tests.benchmarks.highload_packing``.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+from ton_core import WalletHighloadV3Params, WalletMessage
+
+from tonutils.contracts.wallet import InternalMessage, WalletHighloadV3R1
+
+SIZES = (1_000, 10_000, 64_516)
+
+
+def main() -> None:
+    """Pack batches of increasing size and report timings."""
+    wallet, _, _, _ = WalletHighloadV3R1.create(MagicMock())
+    params = WalletHighloadV3Params(query_id=1)
+
+    for size in SIZES:
+        messages = [
+            WalletMessage(send_mode=3, message=InternalMessage(dest=wallet.address, value=n + 1)) for n in range(size)
+        ]
+        started = time.perf_counter()
+        wallet._build_msg_to_send(messages, params)
+        elapsed = time.perf_counter() - started
+        print(f"{size:>6} messages: {elapsed:8.3f} s ({elapsed / size * 1e6:7.1f} us/message)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark bulk external message signing for many wallets.
+
+Run with ``python -m tests.benchmarks.wallet_signing``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from unittest.mock import MagicMock
+
+from ton_core import NetworkGlobalID, PrivateKey, WalletV4Params, WalletV5Params
+
+from tonutils.contracts.wallet import TONTransferBuilder, WalletV4R2, WalletV5R1, sign_external_messages
+
+WALLETS = 2_000
+
+
+async def main() -> None:
+    """Sign one transfer per wallet sequentially and in a process pool and report throughput."""
+    client = MagicMock()
+    client.network = NetworkGlobalID.MAINNET
+
+    jobs = []
+    for n in range(WALLETS):
+        wallet_class, params_model = (WalletV5R1, WalletV5Params) if n % 2 else (WalletV4R2, WalletV4Params)
+        wallet = wallet_class.from_private_key(client, PrivateKey(os.urandom(32)))
+        params = params_model(seqno=0, valid_until=1_900_000_000)
+        jobs.append((wallet, [TONTransferBuilder(destination=wallet.address, amount=n + 1)], params))
+
+    for processes in sorted({1, 2, os.cpu_count() or 1}):
+        started = time.perf_counter()
+        await sign_external_messages(jobs, processes=processes)
+        elapsed = time.perf_counter() - started
+        print(f"{processes:>3} process(es): {elapsed:7.3f} s ({WALLETS / elapsed:9.0f} messages/s)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
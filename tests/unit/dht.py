@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import typing as t
+from types import SimpleNamespace
+
+from nacl.signing import SigningKey
+
+from tonutils.clients.dht import DhtKey, DhtKeyDescription, DhtNetwork, DhtNode, DhtUpdateRule, DhtValue
+
+if t.TYPE_CHECKING:
+    from tonutils.providers.dht.codec import DhtCodec
+
+
+def address_list(port: int = 3000) -> dict[str, t.Any]:
+    return {
+        "addrs": [{"@type": "adnl.address.udp", "ip": 2130706433, "port": port}],
+        "version": 1,
+        "reinit_date": 1,
+        "priority": 0,
+        "expire_at": 0,
+    }
+
+
+def signed_record(codec: DhtCodec, port: int = 3000) -> dict[str, t.Any]:
+    signing_key = SigningKey.generate()
+    record: dict[str, t.Any] = {
+        "id": {"@type": "pub.ed25519", "key": signing_key.verify_key.encode().hex()},
+        "addr_list": address_list(port),
+        "version": 1,
+        "signature": b"",
+    }
+    record["signature"] = signing_key.sign(codec.serialize_node(record)).signature
+    return record
+
+
+def signed_node(codec: DhtCodec, port: int = 3000) -> DhtNode:
+    node = codec.parse_node(signed_record(codec, port))
+    assert node is not None
+    return node
+
+
+def make_node(prefix: bytes = b"") -> DhtNode:
+    return DhtNode(adnl_id=prefix + os.urandom(32 - len(prefix)), addr="127.0.0.1:1", server_key=os.urandom(32))
+
+
+class FakeProvider:
+    """Answers queries with nodes sharing a longer key prefix on every reply.
+
+    ``find_value_on_node`` returns the value once ``hops`` queries were made,
+    ``find_nodes`` runs dry after ``hops * 3`` queries, and the first
+    ``reject`` stores are refused.
+    """
+
+    k = 7
+    request_timeout = 1.0
+    connected = True
+
+    def __init__(self, hops: int = 3, delay: float = 0.001, fail: bool = False, reject: int = 0) -> None:
+        self.hops = hops
+        self.delay = delay
+        self.fail = fail
+        self.reject = reject
+        self.codec = SimpleNamespace(parse_node=lambda node: node)
+        self.queries = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.stored: list[DhtNode] = []
+        self.store_attempts = 0
+        self.first_store_at_query: int | None = None
+
+    async def find_value_on_node(self, node: DhtNode, key: bytes, k: int) -> DhtValue | list[DhtNode]:
+        self.queries += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise asyncio.TimeoutError
+            if self.queries >= self.hops:
+                description = DhtKeyDescription(
+                    key=DhtKey(key, "address"), id_public_key=b"", update_rule=DhtUpdateRule.SIGNATURE
+                )
+                return DhtValue(key_description=description, value=key, ttl=int(time.time()) + 60)
+            return [make_node(key[: min(self.queries, 31)]) for _ in range(k)]
+        finally:
+            self.in_flight -= 1
+
+    async def find_nodes(self, node: DhtNode, key: bytes, k: int) -> list[DhtNode]:
+        self.queries += 1
+        await asyncio.sleep(self.delay)
+        depth = min(self.queries, self.hops)
+        return [make_node(key[:depth]) for _ in range(k)] if self.queries <= self.hops * 3 else []
+
+    async def store_value_on_node(self, node: DhtNode, value: dict[str, t.Any]) -> bool:
+        self.store_attempts += 1
+        attempt = self.store_attempts
+        if self.first_store_at_query is None:
+            self.first_store_at_query = self.queries
+        await asyncio.sleep(self.delay)
+        if attempt <= self.reject:
+            return False
+        self.stored.append(node)
+        return True
+
+
+def make_network(provider: FakeProvider, **kwargs: t.Any) -> DhtNetwork:
+    network = DhtNetwork(nodes=[], **kwargs)
+    network._connected = True
+    network._provider = t.cast("t.Any", provider)
+    for _ in range(10):
+        network.routing_table.add(make_node())
+    return network
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+from ton_core import Address, begin_cell
+
+from tonutils.contracts.jetton import JettonMasterStablecoin, JettonMasterStablecoinV2, JettonMasterStandard
+from tonutils.contracts.nft import NFTCollectionStandard
+
+MASTER = Address("EQCxE6mUtQJKFnGfaROTKOt1lZbDiiX1kCixRv7Nw2Id_sDs")
+CODE = begin_cell().store_uint(0xC0DE, 16).store_ref(begin_cell().store_uint(1, 8).end_cell()).end_cell()
+OWNERS = [Address((0, bytes([n]) * 32)) for n in range(0, 256, 37)]
+
+
+class TestBatchDerivation:
+    @pytest.mark.parametrize("master_class", [JettonMasterStandard, JettonMasterStablecoin, JettonMasterStablecoinV2])
+    def test_jetton_wallets_match_single(self, master_class):
+        batch = master_class.calculate_user_jetton_wallet_addresses(OWNERS, MASTER, CODE)
+        single = [master_class.calculate_user_jetton_wallet_address(owner, MASTER, CODE) for owner in OWNERS]
+        assert batch == single
+
+    def test_nft_items_match_single(self):
+        indexes = [0, 1, 255, 2**40]
+        batch = NFTCollectionStandard.calculate_nft_item_addresses(indexes, CODE, MASTER)
+        single = [NFTCollectionStandard.calculate_nft_item_address(i, CODE, MASTER) for i in indexes]
+        assert batch == single
+
+    def test_process_pool(self):
+        batch = JettonMasterStablecoinV2.calculate_user_jetton_wallet_addresses(OWNERS, MASTER, CODE, processes=2)
+        assert batch == JettonMasterStablecoinV2.calculate_user_jetton_wallet_addresses(OWNERS, MASTER, CODE)
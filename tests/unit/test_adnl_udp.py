@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import typing as t
+from unittest.mock import MagicMock
+
+import pytest
+from ton_core import Server, get_shared_key
+
+from tonutils.transports.adnl import udp
+from tonutils.transports.adnl.udp import AdnlUdpTransport
+
+QUERY: dict[str, t.Any] = {"@type": "adnl.message.query", "query_id": "00" * 32, "query": b"\x01\x02\x03"}
+
+
+def make_transport() -> tuple[AdnlUdpTransport, list[bytes]]:
+    transport = AdnlUdpTransport()
+    sent: list[bytes] = []
+    transport._shards[0].udp = MagicMock(sendto=lambda packet, _: sent.append(packet))
+    transport._bound = True
+    return transport, sent
+
+
+class TestInitPacket:
+    def test_signature_splice_matches_full_serialization(self):
+        transport = AdnlUdpTransport()
+        for rand1_len, rand2_len in ((7, 15), (15, 7)):
+            data: dict[str, t.Any] = {
+                "rand1": b"\x01" * rand1_len,
+                "from": transport._local_from,
+                "messages": [QUERY],
+                "seqno": 1,
+                "confirm_seqno": 0,
+                "reinit_date": 5,
+                "dst_reinit_date": 0,
+                "rand2": b"\x02" * rand2_len,
+            }
+            unsigned = transport._serialize_packet(dict(data))
+            signature = transport._client.sign(unsigned)
+            expected = transport._serialize_packet({**data, "signature": signature})
+            assert transport._with_signature(unsigned, rand1_len, rand2_len, signature) == expected
+
+    async def test_round_trip_reuses_shared_keys(self):
+        sender, sent = make_transport()
+        receiver, _ = make_transport()
+
+        for _ in range(2):
+            await sender.send_init_packet_raw(host="127.0.0.1", port=1, pub_key=receiver._local_pub, messages=[QUERY])
+            plaintext, peer = receiver.decrypt_incoming(sent[-1])
+            assert peer is None
+            contents, _ = receiver.tl_schemas.deserialize(plaintext, boxed=True)
+            assert contents["messages"][0]["query_id"] == QUERY["query_id"]
+            assert contents["signature"]
+
+        expected = get_shared_key(
+            sender._client.x25519_private.encode(),
+            Server("", 0, receiver._local_pub).x25519_public.encode(),
+        )
+        assert list(sender._shared_keys.items()) == [(receiver._local_pub, expected)]
+        assert list(receiver._shared_keys) == [sender._local_pub]
+
+    def test_shared_key_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(udp, "_SHARED_KEY_CACHE_SIZE", 2)
+        transport = AdnlUdpTransport()
+        keys = [AdnlUdpTransport()._local_pub for _ in range(3)]
+        for key in keys:
+            transport._shared_key(key)
+        assert list(transport._shared_keys) == keys[1:]
+
+
+class TestReceivePath:
+    async def test_ring_is_bounded_and_drained_in_batches(self):
+        transport = AdnlUdpTransport(receive_buffer=3)
+        for n in range(5):
+            transport._on_datagram(transport._shards[0], bytes([n]) * 64, ("127.0.0.1", n))
+
+        assert await transport.recv_batch() == [(bytes([n]) * 64, ("127.0.0.1", n)) for n in range(3)]
+        stats = transport.receive_stats
+        assert (stats.received, stats.queued, stats.dropped, stats.inline) == (5, 3, 2, 0)
+
+        transport._on_datagram(transport._shards[0], b"\x09" * 64, ("127.0.0.1", 9))
+        assert await transport.recv_raw() == (b"\x09" * 64, ("127.0.0.1", 9))
+
+    async def test_channel_datagrams_bypass_full_ring(self):
+        transport = AdnlUdpTransport(receive_buffer=1)
+        handled: list[bytes] = []
+        transport.set_inline_handler(lambda data, _: handled.append(data))
+        channel = MagicMock(recv_id=b"\x01" * 32)
+        transport.set_channel(transport.get_or_create_peer_raw(host="127.0.0.1", port=1, pub_key=b"\x02" * 32), channel)
+
+        transport._on_datagram(transport._shards[0], b"\x03" * 64, ("127.0.0.1", 1))
+        transport._on_datagram(transport._shards[0], b"\x01" * 64, ("127.0.0.1", 1))
+        transport._on_datagram(transport._shards[0], b"\x04" * 64, ("127.0.0.1", 1))
+
+        assert handled == [b"\x01" * 64]
+        stats = transport.receive_stats
+        assert (stats.inline, stats.queued, stats.dropped) == (1, 1, 1)
+
+
+class TestSockets:
+    async def test_peers_are_sharded_across_sockets(self):
+        sender = AdnlUdpTransport(sockets=2)
+        receiver = AdnlUdpTransport()
+        await sender.bind("127.0.0.1")
+        await receiver.bind("127.0.0.1")
+        try:
+            ports = {shard.udp.get_extra_info("sockname")[1] for shard in sender._shards}
+            assert len(ports) == 2
+
+            peers = [
+                sender.get_or_create_peer_raw(host="127.0.0.1", port=n, pub_key=AdnlUdpTransport()._local_pub)
+                for n in range(16)
+            ]
+            assert {peer.shard for peer in peers} == {0, 1}
+
+            receiver_port = receiver._shards[0].udp.get_extra_info("sockname")[1]
+            await sender.send_init_packet_raw(
+                host="127.0.0.1", port=receiver_port, pub_key=receiver._local_pub, messages=[QUERY]
+            )
+            (raw, addr), *_ = await asyncio.wait_for(receiver.recv_batch(), timeout=5)
+            peer = sender.get_peer(f"127.0.0.1:{receiver_port}")
+            assert addr[1] == sender._shards[peer.shard].udp.get_extra_info("sockname")[1]
+            assert receiver.decrypt_incoming(raw)[0]
+        finally:
+            await sender.close()
+            await receiver.close()
+
+    @pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT not available")
+    async def test_reuse_port_shares_one_port(self):
+        transport = AdnlUdpTransport(sockets=3, reuse_port=True)
+        await transport.bind("127.0.0.1")
+        try:
+            ports = {shard.udp.get_extra_info("sockname")[1] for shard in transport._shards}
+            assert len(ports) == 1
+        finally:
+            await transport.close()
+
+    def test_rejects_zero_sockets(self):
+        with pytest.raises(ValueError):
+            AdnlUdpTransport(sockets=0)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from ton_core import ContractState, NetworkGlobalID, begin_cell
+
+from tonutils.contracts import WalletV4R2, WalletV5R1
+from tonutils.types import ContractInfo
+
+
+def _make_client() -> MagicMock:
+    client = MagicMock()
+    client.network = NetworkGlobalID.MAINNET
+    return client
+
+
+class TestContractInfo:
+    def test_parses_raw_once(self):
+        cell = begin_cell().store_uint(42, 32).end_cell()
+        info = ContractInfo(code_raw=cell.to_boc().hex())
+
+        assert info.code is info.code
+        assert info.code is not None
+        assert info.code.hash == cell.hash
+        assert info.data is None
+
+    def test_serializes_cell_lazily(self):
+        cell = begin_cell().store_uint(7, 8).end_cell()
+        info = ContractInfo(data=cell)
+
+        assert info.data is cell
+        assert info.data_raw == cell.to_boc().hex()
+
+    def test_setters_replace_other_form(self):
+        first = begin_cell().store_uint(1, 8).end_cell()
+        second = begin_cell().store_uint(2, 8).end_cell()
+        info = ContractInfo(data=first)
+
+        info.data_raw = second.to_boc().hex()
+        assert info.data is not None
+        assert info.data.hash == second.hash
+
+        info.data = first
+        assert info.data_raw == first.to_boc().hex()
+
+
+class TestStateDataMemo:
+    async def test_cached_until_refresh(self):
+        client = _make_client()
+        wallet = WalletV4R2.create(client)[0]
+        state_init = wallet.state_init
+        assert state_init is not None
+        wallet._info = ContractInfo(state=ContractState.ACTIVE, data=state_init.data)
+
+        first = wallet.state_data
+        assert wallet.state_data is first
+
+        client.get_info = AsyncMock(return_value=ContractInfo(state=ContractState.ACTIVE, data=state_init.data))
+        await wallet.refresh()
+        assert wallet.state_data is not first
+        assert wallet.state_data.public_key == first.public_key
+
+    def test_v5_uses_network(self):
+        client = _make_client()
+        wallet = WalletV5R1.create(client)[0]
+        state_init = wallet.state_init
+        assert state_init is not None
+        wallet._info = ContractInfo(state=ContractState.ACTIVE, data=state_init.data)
+
+        assert wallet.state_data is wallet.state_data
+        assert wallet.state_data.public_key == wallet.public_key
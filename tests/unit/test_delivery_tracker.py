@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from ton_core import Address, begin_cell
+
+from tonutils.contracts.wallet import ExternalMessage, SeqnoGuard
+from tonutils.exceptions import ClientError, ContractError
+from tonutils.tools.delivery_tracker import DeliveryTracker
+
+ADDRESS = Address("EQCD39VS5jcptHL8vMjEXrzGaRcCVYto7HUn4bpAOg8xqB2N")
+
+
+def _make_message(n: int) -> ExternalMessage:
+    return ExternalMessage(dest=ADDRESS, body=begin_cell().store_uint(n, 32).end_cell())
+
+
+def _make_transaction(message: ExternalMessage | None) -> MagicMock:
+    transaction = MagicMock()
+    transaction.in_msg = message
+    return transaction
+
+
+async def _start(tracker: DeliveryTracker) -> None:
+    stop = asyncio.Event()
+
+    async def start() -> None:
+        await stop.wait()
+
+    async def stop_scanner() -> None:
+        stop.set()
+
+    tracker._scanner.start = start  # type: ignore[method-assign]
+    tracker._scanner.stop = stop_scanner  # type: ignore[method-assign]
+    await tracker.start()
+
+
+async def _deliver(tracker: DeliveryTracker, *messages: ExternalMessage | None) -> None:
+    event = MagicMock()
+    event.transactions = [_make_transaction(m) for m in messages]
+    await tracker._on_transactions(event)
+
+
+def _make_tracker(**kwargs: float | int) -> DeliveryTracker:
+    client = MagicMock()
+    client.provider.last_mc_block = object()
+    return DeliveryTracker(client, **kwargs)  # type: ignore[arg-type]
+
+
+class TestDeliveryTracker:
+    async def test_requires_running(self):
+        tracker = _make_tracker()
+        with pytest.raises(ClientError):
+            tracker.track(_make_message(1))
+
+    async def test_resolves_many(self):
+        tracker = _make_tracker()
+        await _start(tracker)
+        try:
+            messages = [_make_message(n) for n in range(3)]
+            waiter = asyncio.create_task(tracker.wait_many(messages, timeout=1.0))
+            await asyncio.sleep(0)
+            assert tracker.pending == 3
+
+            await _deliver(tracker, None, messages[2], messages[0])
+            await _deliver(tracker, messages[1])
+            transactions = await waiter
+
+            assert [tx.in_msg for tx in transactions] == messages
+            assert tracker.pending == 0
+        finally:
+            await tracker.stop()
+
+    async def test_tracked_after_delivery(self):
+        tracker = _make_tracker()
+        await _start(tracker)
+        try:
+            message = _make_message(7)
+            await _deliver(tracker, message)
+            transaction = await tracker.wait(message.normalized_hash, timeout=0.1)
+            assert transaction.in_msg is message
+        finally:
+            await tracker.stop()
+
+    async def test_history_is_bounded(self):
+        tracker = _make_tracker(history=2)
+        await _start(tracker)
+        try:
+            await _deliver(tracker, *(_make_message(n) for n in range(3)))
+            assert len(tracker._seen) == 2
+            assert _make_message(0).normalized_hash not in tracker._seen
+        finally:
+            await tracker.stop()
+
+    async def test_timeout(self):
+        tracker = _make_tracker()
+        await _start(tracker)
+        try:
+            with pytest.raises(ClientError):
+                await tracker.wait(_make_message(1), timeout=0.01)
+            assert tracker.pending == 0
+        finally:
+            await tracker.stop()
+
+    async def test_shared_message_survives_shorter_wait(self):
+        tracker = _make_tracker()
+        await _start(tracker)
+        try:
+            message = _make_message(1)
+            long_wait = asyncio.create_task(tracker.wait(message, timeout=1.0))
+            await asyncio.sleep(0)
+            with pytest.raises(ClientError):
+                await tracker.wait(message, timeout=0.01)
+            assert tracker.pending == 1
+
+            await _deliver(tracker, message)
+            transaction = await long_wait
+            assert transaction.in_msg is message
+            assert tracker.pending == 0
+        finally:
+            await tracker.stop()
+
+    async def test_guard_timeout_raises_contract_error(self):
+        tracker = _make_tracker()
+        await _start(tracker)
+        try:
+            guard = SeqnoGuard(MagicMock(), timeout=0.01, tracker=tracker)
+
+            async def send() -> ExternalMessage:
+                return _make_message(1)
+
+            with pytest.raises(ContractError, match="not delivered"):
+                await guard._send(send())
+            assert tracker.pending == 0
+        finally:
+            await tracker.stop()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tonutils.clients.dht import DhtKey, DhtKeyDescription, DhtNetwork, DhtUpdateRule, DhtValue, DhtValueCache
+
+
+def make_value(key: DhtKey, ttl: int) -> DhtValue:
+    description = DhtKeyDescription(key=key, id_public_key=os.urandom(32), update_rule=DhtUpdateRule.SIGNATURE)
+    return DhtValue(key_description=description, value=b"value", ttl=ttl)
+
+
+def make_network(cache: DhtValueCache | None = None) -> DhtNetwork:
+    network = DhtNetwork(nodes=[], cache=cache)
+    network._connected = True
+    network._provider = MagicMock(connected=True)
+    return network
+
+
+class TestDhtValueCache:
+    def test_honors_value_ttl(self):
+        key = DhtKey(os.urandom(32), "address")
+        cache = DhtValueCache()
+        value = make_value(key, int(time.time()) + 60)
+        cache.put(key.key_id, value)
+        assert cache.get(key.key_id) == (True, value)
+
+        cache.put(key.key_id, make_value(key, int(time.time()) - 1))
+        assert cache.get(key.key_id) == (False, None)
+
+    def test_negative_ttl_and_max_ttl(self, monkeypatch: pytest.MonkeyPatch):
+        key = DhtKey(os.urandom(32), "address")
+        cache = DhtValueCache(negative_ttl=5.0, max_ttl=10.0)
+        now = time.time()
+        cache.put(b"missing", None)
+        cache.put(key.key_id, make_value(key, int(now) + 3600))
+        assert cache.get(b"missing") == (True, None)
+
+        monkeypatch.setattr(time, "time", lambda: now + 6)
+        assert cache.get(b"missing") == (False, None)
+        assert cache.get(key.key_id)[0]
+
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        assert cache.get(key.key_id) == (False, None)
+
+    def test_evicts_least_recently_used(self):
+        cache = DhtValueCache(max_size=2)
+        cache.put(b"a", None)
+        cache.put(b"b", None)
+        cache.get(b"a")
+        cache.put(b"c", None)
+        assert len(cache) == 2
+        assert not cache.get(b"b")[0]
+        assert cache.get(b"a")[0]
+
+
+class TestFindValueCaching:
+    async def test_coalesces_and_caches(self):
+        key = DhtKey(os.urandom(32), "address")
+        value = make_value(key, int(time.time()) + 60)
+        network = make_network()
+        started = asyncio.Event()
+
+        async def lookup(*_: object) -> DhtValue:
+            started.set()
+            await asyncio.sleep(0.01)
+            return value
+
+        network._lookup_value = AsyncMock(side_effect=lookup)  # type: ignore[method-assign]
+        results = await asyncio.gather(*(network.find_value(key) for _ in range(5)))
+        assert results == [value] * 5
+        assert await network.find_value(key) is value
+        assert network._lookup_value.await_count == 1
+
+    async def test_caches_misses_and_not_errors(self):
+        key = DhtKey(os.urandom(32), "address")
+        network = make_network()
+        network._lookup_value = AsyncMock(side_effect=[ConnectionError, None])  # type: ignore[method-assign]
+
+        with pytest.raises(ConnectionError):
+            await network.find_value(key)
+        assert await network.find_value(key) is None
+        assert await network.find_value(key) is None
+        assert network._lookup_value.await_count == 2
+
+    async def test_continuation_bypasses_cache(self):
+        key = DhtKey(os.urandom(32), "address")
+        network = make_network()
+        network._lookup_value = AsyncMock(return_value=None)  # type: ignore[method-assign]
+        continuation = MagicMock()
+
+        await network.find_value(key, continuation)
+        await network.find_value(key, continuation)
+        assert network._lookup_value.await_count == 2
+        assert len(network.cache) == 0
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import copy
+import os
+
+from tests.unit.dht import address_list, signed_record
+from tonutils.providers.dht.codec import DhtCodec
+
+
+class TestSignatureCache:
+    def test_node_verified_once(self):
+        codec = DhtCodec()
+        record = signed_record(codec)
+
+        assert codec.parse_node(record) is not None
+        assert codec.parse_node(dict(record)) is not None
+        assert (codec.signature_cache_hits, codec.signature_cache_misses) == (1, 1)
+        assert codec.signature_cache_hit_rate == 0.5
+
+    def test_tampered_record_is_not_served_from_cache(self):
+        codec = DhtCodec()
+        record = signed_record(codec)
+        assert codec.parse_node(record) is not None
+
+        tampered = copy.deepcopy(record)
+        tampered["addr_list"]["addrs"][0]["port"] = 4000
+        assert codec.parse_node(tampered) is None
+        assert codec.signature_cache_hits == 0
+
+    def test_value_verified_once(self):
+        codec = DhtCodec()
+        value_tl, target = codec.build_store_address(address_list(), 2_000_000_000, os.urandom(32))
+        value = codec.parse_value(value_tl)
+        assert value is not None
+
+        assert codec.verify_value(value, target)
+        assert codec.verify_value(value, target)
+        assert (codec.signature_cache_hits, codec.signature_cache_misses) == (2, 2)
+
+    def test_cache_is_bounded(self):
+        codec = DhtCodec(signature_cache_size=2)
+        records = [signed_record(codec) for _ in range(3)]
+        for record in records:
+            codec.parse_node(record)
+        codec.parse_node(records[0])
+        assert codec.signature_cache_hits == 0
+        assert len(codec._verified) == 2
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import io
+import json
+import typing as t
+
+from tests.unit.dht import signed_record
+from tonutils.clients.dht import DhtNetwork
+from tonutils.exceptions import ClientError, ProviderTimeoutError
+from tonutils.tools.dht_crawler import DhtCrawler
+
+
+def make_crawl_network(size: int, error: Exception | None = None) -> DhtNetwork:
+    """Network whose node ``i`` answers with the records of nodes ``i+1..i+3``; node 5 fails with ``error``."""
+    network = DhtNetwork(nodes=[])
+    network._connected = True
+    network.provider._connected = True
+    network.provider.transport._bound = True
+
+    records = [signed_record(network.provider.codec, 3000 + n) for n in range(size)]
+    index = {network.provider.codec.parse_node(r).adnl_id: n for n, r in enumerate(records)}  # type: ignore[union-attr]
+
+    async def find_nodes(node: t.Any, key: bytes, k: int) -> list[dict[str, t.Any]]:
+        n = index[node.adnl_id]
+        if n == 5:
+            raise error or ProviderTimeoutError(timeout=1.0, endpoint=node.addr, operation="query")
+        return [records[(n + step) % size] for step in (1, 2, 3)]
+
+    network.provider.find_nodes = find_nodes  # type: ignore[method-assign]
+    network.routing_table.add(network.provider.codec.parse_node(records[0]))  # type: ignore[arg-type]
+    return network
+
+
+class TestDhtCrawler:
+    async def test_discovers_every_node_once(self):
+        network = make_crawl_network(30)
+        sink = io.StringIO()
+        crawler = DhtCrawler(network, concurrency=4, queries_per_node=1, sink=sink)
+
+        stats = await crawler.crawl(timeout=10)
+
+        assert stats.discovered == len(crawler.nodes) == 30
+        assert stats.verified == 30
+        assert stats.failed == 1
+        assert stats.duplicates == stats.queried * 3 - 29
+        assert stats.rate > 0
+        lines = [json.loads(line) for line in sink.getvalue().splitlines()]
+        assert len({line["adnl_id"] for line in lines}) == 30
+        assert lines[0]["via"] is None
+        assert len(network.routing_table) == 30
+
+    async def test_stops_at_max_nodes(self, tmp_path):
+        network = make_crawl_network(30)
+        path = tmp_path / "nodes.ndjson"
+        crawler = DhtCrawler(network, concurrency=2, sink=path)
+
+        stats = await crawler.crawl(max_nodes=10, timeout=10)
+
+        assert stats.discovered == 10
+        assert len(path.read_text().splitlines()) == 10
+
+    async def test_survives_client_errors(self):
+        network = make_crawl_network(30, error=ClientError("no channel for node"))
+        crawler = DhtCrawler(network, concurrency=2, queries_per_node=2)
+
+        def on_progress(_: t.Any) -> None:
+            raise RuntimeError("progress callback failed")
+
+        stats = await asyncio.wait_for(crawler.crawl(on_progress=on_progress), timeout=10)
+
+        assert stats.discovered == 30
+        assert stats.failed == 2
+
+    def test_forged_copy_does_not_shadow_genuine_record(self):
+        network = make_crawl_network(3)
+        crawler = DhtCrawler(network)
+        genuine = signed_record(network.provider.codec, 4000)
+        forged = copy.deepcopy(genuine)
+        forged["addr_list"]["addrs"][0]["port"] = 4001
+
+        assert crawler._accept(forged) is None
+        dht_node = crawler._accept(genuine)
+        assert dht_node is not None
+        assert dht_node.addr == "127.0.0.1:4000"
+        assert crawler.stats.duplicates == 0
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.unit.dht import FakeProvider, make_network
+from tonutils.clients.dht import DhtKey, DhtNetwork
+
+
+class TestLookupParallelism:
+    async def test_fixed_alpha(self):
+        provider = FakeProvider(hops=30)
+        network = make_network(provider, alpha=2)
+        value = await network.find_value(DhtKey(os.urandom(32), "address"))
+        assert value is not None
+        assert provider.max_in_flight == 2
+
+    async def test_adaptive_grows_on_fast_progress(self):
+        provider = FakeProvider(hops=30)
+        network = make_network(provider, alpha=1, max_alpha=6)
+        assert await network.find_value(DhtKey(os.urandom(32), "address")) is not None
+        assert provider.max_in_flight > 1
+
+    async def test_adaptive_does_not_grow_on_timeouts(self):
+        provider = FakeProvider(hops=30, fail=True)
+        network = make_network(provider, alpha=1, max_alpha=6)
+        assert await network.find_value(DhtKey(os.urandom(32), "address")) is None
+        assert provider.max_in_flight == 1
+        assert provider.queries == 10
+
+    def test_rejects_bad_alpha(self):
+        with pytest.raises(ValueError):
+            DhtNetwork(nodes=[], alpha=0)
+        with pytest.raises(ValueError):
+            DhtNetwork(nodes=[], alpha=3, max_alpha=2)
+
+
+class TestFindMany:
+    async def test_returns_values_in_key_order(self):
+        provider = FakeProvider(hops=3)
+        network = make_network(provider)
+        keys = [DhtKey(os.urandom(32), "address") for _ in range(20)]
+
+        values = await network.find_many(keys, concurrency=4)
+        assert [v.value for v in values if v is not None] == [key.key_id for key in keys]
+        assert provider.max_in_flight <= 4 * 3
+
+    async def test_requires_connection(self):
+        network = DhtNetwork(nodes=[])
+        network._provider = MagicMock(connected=False)
+        with pytest.raises(Exception, match="find_many"):
+            await network.find_many([])
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+
+from tonutils.clients.dht import DhtNode, PriorityList, RoutingTable
+from tonutils.clients.dht.models import affinity
+
+
+def make_node(adnl_id: bytes | None = None) -> DhtNode:
+    return DhtNode(adnl_id=adnl_id or os.urandom(32), addr="127.0.0.1:1", server_key=os.urandom(32))
+
+
+def brute_force(nodes: list[DhtNode], target: bytes, good_count: int, bad_count: int) -> list[int]:
+    """Affinities selected by a full scan and sort of every known node."""
+    good = sorted((affinity(n.adnl_id, target) for n in nodes if n.bad_score == 0), reverse=True)
+    bad = sorted((affinity(n.adnl_id, target) for n in nodes if n.bad_score > 0), reverse=True)
+    return sorted(good[:good_count] + bad[:bad_count], reverse=True)[:good_count]
+
+
+def selected(table: RoutingTable, target: bytes, good_count: int, bad_count: int) -> list[int]:
+    plist = PriorityList(max_len=good_count, target_id=target)
+    good, bad = table.closest(target, good_count, bad_count)
+    for node in good + bad:
+        plist.add(node)
+    return [affinity(n.adnl_id, target) for n in plist._nodes]
+
+
+class TestRoutingTable:
+    def test_closest_matches_full_scan(self):
+        table = RoutingTable(os.urandom(32), k=10)
+        for n in range(500):
+            node = make_node()
+            if n % 3 == 0:
+                node.update_status(False)
+            table.add(node)
+        nodes = table.get_nodes()
+
+        for n in range(50):
+            target = os.urandom(32)
+            # Share a prefix with a known node to exercise high affinities.
+            if n % 2:
+                target = nodes[n].adnl_id[:8] + target[8:]
+            assert selected(table, target, 15, 5) == brute_force(nodes, target, 15, 5)
+
+    def test_iter_closest_is_best_first(self):
+        table = RoutingTable(os.urandom(32), k=100)
+        for _ in range(200):
+            table.add(make_node())
+        target = os.urandom(32)
+        affinities = [affinity(n.adnl_id, target) for n in table.iter_closest(target)]
+        assert affinities == sorted(affinities, reverse=True)
+        assert len(affinities) == 200
+
+    def test_bucket_eviction_updates_index(self):
+        local_id = bytes(32)
+        table = RoutingTable(local_id, k=1)
+        # All share bucket 0 (first bit differs from the local ID).
+        nodes = [make_node(b"\x80" + os.urandom(31)) for _ in range(6)]
+        nodes[0].update_status(False)
+        for node in nodes:
+            table.add(node)
+
+        assert len(table) == 5
+        assert table.find_node(nodes[0].adnl_id) is None
+        assert {n.adnl_id for n in table.get_nodes()} == {n.adnl_id for n in nodes[1:]}
+
+    def test_ignores_local_and_replaces_duplicates(self):
+        local_id = os.urandom(32)
+        table = RoutingTable(local_id, k=10)
+        table.add(make_node(local_id))
+        node = make_node()
+        table.add(node)
+        replacement = make_node(node.adnl_id)
+        table.add(replacement)
+
+        assert len(table) == 1
+        assert table.find_node(node.adnl_id) is replacement
+
+
+class TestPriorityList:
+    def test_keeps_best_and_tracks_used(self):
+        target = bytes(32)
+        plist = PriorityList(max_len=2, target_id=target)
+        far = make_node(b"\x80" + bytes(31))
+        mid = make_node(b"\x01" + bytes(31))
+        near = make_node(b"\x00\x01" + bytes(30))
+
+        assert plist.add(far)
+        assert plist.add(mid)
+        assert plist.add(near)
+        assert not plist.add(make_node(b"\xff" * 32))
+        assert [n.id for n in plist._nodes] == [near.id, mid.id]
+
+        node, best = plist.get()
+        assert node is near
+        assert best == affinity(near.adnl_id, target)
+        assert plist.get()[0] is mid
+        assert plist.get()[0] is None
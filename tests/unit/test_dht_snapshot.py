@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import typing as t
+from unittest.mock import AsyncMock
+
+from tests.unit.dht import signed_node
+from tonutils.clients.dht import DhtNetwork
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestRoutingSnapshot:
+    def test_round_trip(self, tmp_path: Path):
+        path = tmp_path / "dht.json"
+        network = DhtNetwork(nodes=[])
+        nodes = [signed_node(network.provider.codec, 3000 + n) for n in range(5)]
+        nodes[0].ping = 42
+        nodes[1].update_status(False)
+        for _ in range(3):
+            nodes[2].update_status(False)
+        for node in nodes:
+            network.routing_table.add(node)
+        assert network.save_snapshot(path) == 4
+
+        restored = DhtNetwork(nodes=[])
+        assert restored.load_snapshot(path) == 4
+        assert restored.routing_table.find_node(nodes[2].adnl_id) is None
+        first = restored.routing_table.find_node(nodes[0].adnl_id)
+        assert first is not None
+        assert (first.addr, first.ping) == ("127.0.0.1:3000", 42)
+        second = restored.routing_table.find_node(nodes[1].adnl_id)
+        assert second is not None
+        assert second.bad_score == 1
+
+    def test_skips_tampered_and_outdated(self, tmp_path: Path):
+        path = tmp_path / "dht.json"
+        network = DhtNetwork(nodes=[])
+        network.routing_table.add(signed_node(network.provider.codec, 3000))
+        network.save_snapshot(path)
+
+        snapshot = json.loads(path.read_text())
+        record = bytearray.fromhex(snapshot["nodes"][0]["record"])
+        record[-70] ^= 1
+        snapshot["nodes"][0]["record"] = record.hex()
+        path.write_text(json.dumps(snapshot))
+        assert DhtNetwork(nodes=[]).load_snapshot(path) == 0
+
+        network.save_snapshot(path)
+        snapshot = json.loads(path.read_text())
+        snapshot["saved_at"] -= 7 * 24 * 60 * 60
+        path.write_text(json.dumps(snapshot))
+        assert DhtNetwork(nodes=[]).load_snapshot(path) == 0
+        assert DhtNetwork(nodes=[]).load_snapshot(tmp_path / "missing.json") == 0
+
+    async def test_warm_start_connects_lazily(self, tmp_path: Path):
+        path = tmp_path / "dht.json"
+        seed = DhtNetwork(nodes=[], k=3)
+        for n in range(3):
+            seed.routing_table.add(signed_node(seed.provider.codec, 3000 + n))
+        seed.save_snapshot(path)
+
+        network = DhtNetwork(nodes=[], k=3, snapshot_path=path)
+        network.provider.connect = AsyncMock(return_value=[])  # type: ignore[method-assign]
+        network.provider.close = AsyncMock()  # type: ignore[method-assign]
+        await network.connect()
+        network.provider.connect.assert_awaited_once_with(lazy=True)
+        assert len(network.routing_table) == 3
+
+        path.unlink()
+        await network.close()
+        assert json.loads(path.read_text())["nodes"]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from tests.unit.dht import FakeProvider, make_network
+
+
+class TestStore:
+    async def test_stores_on_closest_nodes(self):
+        target = os.urandom(32)
+        provider = FakeProvider()
+        network = make_network(provider)
+
+        report = await network.store_with_report({}, target)
+        assert report.stored == provider.k
+        assert report.queried == provider.queries
+        assert all(result.ok and result.elapsed >= 0 for result in report.results)
+        assert report.elapsed >= max(result.elapsed for result in report.results)
+
+        assert len({node.id for node in provider.stored}) == provider.k
+
+    async def test_stores_before_walk_finishes(self):
+        target = os.urandom(32)
+        provider = FakeProvider(hops=6)
+        network = make_network(provider, alpha=1)
+
+        await network.store({}, target)
+        assert provider.first_store_at_query is not None
+        assert provider.first_store_at_query < provider.queries
+
+    async def test_stops_at_replication_factor(self):
+        target = os.urandom(32)
+        provider = FakeProvider()
+        network = make_network(provider)
+
+        assert await network.store({}, target, replicas=2) == 2
+        assert provider.store_attempts == 2
+
+    async def test_replaces_rejected_nodes(self):
+        target = os.urandom(32)
+        provider = FakeProvider(reject=3)
+        network = make_network(provider)
+
+        report = await network.store_with_report({}, target, replicas=4)
+        assert report.stored == 4
+        assert [result.ok for result in report.results].count(False) == 3
+        assert len({result.node.id for result in report.results}) == 7
+
+    async def test_invalidates_cached_value(self):
+        target = os.urandom(32)
+        network = make_network(FakeProvider())
+        network.cache.put(target, None)
+
+        await network.store({}, target, replicas=1)
+        assert network.cache.get(target) == (False, None)
+
+    async def test_rejects_bad_replicas(self):
+        network = make_network(FakeProvider())
+        with pytest.raises(ValueError):
+            await network.store({}, os.urandom(32), replicas=0)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from ton_core import Cell, OpCode, OutActionSendMsg, WalletHighloadV3Params, WalletMessage, begin_cell
+
+from tonutils.contracts.wallet import InternalMessage, WalletHighloadV3R1
+
+mock_client = MagicMock()
+
+
+def _make_messages(count: int, dest: object) -> list[WalletMessage]:
+    return [WalletMessage(send_mode=3, message=InternalMessage(dest=dest, value=n + 1)) for n in range(count)]
+
+
+def _reference_pack(wallet: WalletHighloadV3R1, messages: list[WalletMessage], params) -> WalletMessage:
+    """Recursive packing as originally implemented, kept to pin the wire format."""
+    if len(messages) > 253:
+        rest = _reference_pack(wallet, messages[253:], params)
+        messages = [*messages[:253], rest]
+
+    actions_cell, amount = Cell.empty(), 0
+    for msg in messages:
+        action_cell = begin_cell()
+        action_cell.store_ref(actions_cell)
+        action_cell.store_cell(OutActionSendMsg(msg).serialize())
+        actions_cell = action_cell.end_cell()
+        amount += msg.message.info.value.grams
+
+    body = begin_cell().store_uint(OpCode.INTERNAL_TRANSFER, 32).store_uint(params.query_id, 64)
+    body = body.store_ref(actions_cell).end_cell()
+    message = InternalMessage(dest=wallet.address, value=amount, body=body)
+    return WalletMessage(send_mode=params.send_mode, message=message)
+
+
+class TestHighloadPacking:
+    @pytest.mark.parametrize("count", [2, 253, 254, 506, 700])
+    def test_matches_recursive_layout(self, count: int):
+        wallet, _, _, _ = WalletHighloadV3R1.create(mock_client)
+        params = WalletHighloadV3Params(query_id=7)
+        messages = _make_messages(count, wallet.address)
+
+        packed = wallet._build_msg_to_send(messages, params)
+        expected = _reference_pack(wallet, messages, params)
+        assert packed.serialize().hash == expected.serialize().hash
+        assert len(messages) == count
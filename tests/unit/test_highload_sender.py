@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+import typing as t
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from ton_core import Builder, HashMap, WalletHighloadV3Config
+
+from tonutils.contracts.wallet import HighloadSender
+from tonutils.exceptions import ContractError
+
+
+def _make_wallet(*, queries: dict[int, str] | None = None) -> MagicMock:
+    wallet = MagicMock()
+    wallet.config = WalletHighloadV3Config(timeout=300)
+    wallet.refresh = AsyncMock()
+    wallet.is_active = queries is not None
+    wallet.state_data.timeout = 300
+    wallet.state_data.old_queries = None
+    wallet.state_data.queries = _make_queries(queries or {})
+
+    async def batch_transfer_message(messages, params):
+        return params
+
+    wallet.batch_transfer_message = AsyncMock(side_effect=batch_transfer_message)
+    return wallet
+
+
+def _make_queries(bitmaps: dict[int, str]) -> t.Any:
+    def value_serializer(src: str, dest: Builder) -> Builder:
+        return dest.store_uint(int(src, 2), len(src))
+
+    cell_dict = HashMap(key_size=13, value_serializer=value_serializer)
+    for shift, bitmap in bitmaps.items():
+        cell_dict.set_int_key(shift, bitmap)
+    return cell_dict.serialize()
+
+
+class TestParseQueries:
+    def test_bitmap_positions(self):
+        queries = _make_queries({0: "101", 3: "0" * 900 + "1"})
+        assert HighloadSender._parse_queries(queries) == {0, 2, 3 << 10 | 900}
+
+    def test_empty(self):
+        assert HighloadSender._parse_queries(None) == set()
+
+
+class TestAllocate:
+    async def test_sequential_skips_reserved_bit(self):
+        sender = HighloadSender(_make_wallet(), query_id=1022)
+        ids = [(await sender.allocate()).query_id for _ in range(2)]
+        assert ids == [1022, 1024]
+        assert sender.next_query_id == 1025
+
+    async def test_skips_onchain_queries(self):
+        sender = HighloadSender(_make_wallet(queries={0: "11"}))
+        assert (await sender.allocate()).query_id == 2
+
+    async def test_rejects_timeout_mismatch(self):
+        wallet = _make_wallet(queries={})
+        wallet.state_data.timeout = 600
+        with pytest.raises(ContractError):
+            await HighloadSender(wallet).sync()
+
+    async def test_window_exhausted(self):
+        sender = HighloadSender(_make_wallet())
+        await sender.allocate()
+        sender._cursor = 0
+        with pytest.raises(ContractError):
+            await sender.allocate()
+
+    async def test_reuses_expired(self):
+        wallet = _make_wallet()
+        sender = HighloadSender(wallet)
+        await sender.allocate()
+        sender._used[0] = int(time.time()) - 1000
+        sender._cursor = 0
+        assert (await sender.allocate()).query_id == 0
+        assert wallet.refresh.await_count == 2
+
+    async def test_send_many_unique(self):
+        sender = HighloadSender(_make_wallet(), concurrency=4)
+        sent = await sender.send_many([[]] * 50)
+        assert len({params.query_id for params in sent}) == 50
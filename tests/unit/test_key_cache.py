@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+import typing as t
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ton_core import PrivateKey, WalletV4Config, mnemonic_new
+
+from tonutils.contracts import KeyCache, WalletV4R2
+from tonutils.contracts.wallet import keys
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+mock_client = MagicMock()
+
+
+class TestKeyCache:
+    def test_round_trip(self, tmp_path: Path):
+        secret = os.urandom(32)
+        mnemonic = mnemonic_new(24)
+        private_key = PrivateKey(os.urandom(32))
+
+        cache = KeyCache(tmp_path / "keys.bin", secret)
+        cache.set(mnemonic, private_key)
+        cache.save()
+        assert mnemonic[0].encode() not in (tmp_path / "keys.bin").read_bytes()
+
+        reloaded = KeyCache(tmp_path / "keys.bin", secret)
+        assert mnemonic in reloaded
+        assert reloaded.get(mnemonic) == private_key
+        assert reloaded.get(mnemonic_new(24)) is None
+
+    def test_rejects_bad_secret(self, tmp_path: Path):
+        cache = KeyCache(tmp_path / "keys.bin", os.urandom(32))
+        cache.set(mnemonic_new(24), PrivateKey(os.urandom(32)))
+        cache.save()
+
+        with pytest.raises(ValueError):
+            KeyCache(tmp_path / "keys.bin", os.urandom(32))
+        with pytest.raises(ValueError):
+            KeyCache(tmp_path / "other.bin", b"short")
+
+
+class TestFromMnemonics:
+    async def test_matches_from_mnemonic(self):
+        mnemonics = [mnemonic_new(24) for _ in range(3)]
+        config = WalletV4Config(subwallet_id=7)
+
+        result = await WalletV4R2.from_mnemonics(mock_client, mnemonics, config=config, processes=2)
+        for mnemonic, (wallet, public_key, private_key, words) in zip(mnemonics, result):
+            expected, expected_public, _, _ = WalletV4R2.from_mnemonic(
+                mock_client, mnemonic, config=WalletV4Config(subwallet_id=7)
+            )
+            assert wallet.address == expected.address
+            assert words == mnemonic
+            assert public_key == expected_public
+            assert private_key.public_key == expected_public
+            assert wallet.config.subwallet_id == 7
+            assert wallet.config.public_key == expected_public
+        assert config.public_key is None
+
+    async def test_cache_skips_derivation(self, tmp_path: Path):
+        secret = os.urandom(32)
+        mnemonics = [" ".join(mnemonic_new(24)) for _ in range(2)]
+        cache = KeyCache(tmp_path / "keys.bin", secret)
+        first = await WalletV4R2.from_mnemonics(mock_client, mnemonics, processes=1, key_cache=cache)
+
+        with patch.object(keys, "_derive_private_keys", side_effect=AssertionError):
+            cache = KeyCache(tmp_path / "keys.bin", secret)
+            second = await WalletV4R2.from_mnemonics(mock_client, mnemonics, processes=1, key_cache=cache)
+
+        assert [w.address for w, *_ in first] == [w.address for w, *_ in second]
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from nacl.signing import SigningKey
+from ton_core import MASTERCHAIN_SHARD, BlockIdExt, NetworkGlobalID, WorkchainID
+
+from tonutils.clients import LiteBalancer, LiteClient
+from tonutils.clients.lite.balancer import HistoryFrontier
+from tonutils.exceptions import BalancerError, ClientError, ProviderResponseError
+from tonutils.types import LITESERVER_BLOCK_NOT_IN_DB_CODE
+
+
+def _make_block(seqno: int, workchain: int = -1) -> BlockIdExt:
+    return BlockIdExt(
+        workchain=workchain, shard=MASTERCHAIN_SHARD, seqno=seqno, root_hash=bytes(32), file_hash=bytes(32)
+    )
+
+
+def _make_client(*, archive: bool, rtt: float, tip: int = 1000) -> LiteClient:
+    client = LiteClient(
+        NetworkGlobalID.MAINNET,
+        ip="127.0.0.1",
+        port=1,
+        public_key=bytes(SigningKey.generate().verify_key),
+    )
+    provider = MagicMock()
+    provider.connected = True
+    provider.last_mc_block = _make_block(tip)
+    provider.last_ping_rtt = rtt
+    provider.last_ping_age = 0.0
+
+    async def lookup_block(**kwargs: t.Any) -> t.Any:
+        if not archive:
+            raise ProviderResponseError(code=LITESERVER_BLOCK_NOT_IN_DB_CODE, message="not in db", endpoint="test")
+        return _make_block(kwargs["seqno"]), None
+
+    provider.lookup_block = AsyncMock(side_effect=lookup_block)
+    client._provider = provider
+    return client
+
+
+class TestHistoryPoint:
+    def test_lookup_block_dimensions(self):
+        point = LiteBalancer._history_point
+        assert point("lookup_block", (), {"workchain": -1, "utime": 5}) == (("utime", 0), 5)
+        assert point("lookup_block", (), {"workchain": 0, "lt": 7}) == (("lt", 0), 7)
+        assert point("lookup_block", (), {"workchain": 0, "seqno": 9}) == (("seqno", 0), 9)
+
+    def test_block_argument(self):
+        block = _make_block(42, workchain=0)
+        assert LiteBalancer._history_point("get_block_transactions", (block,), {}) == (("seqno", 0), 42)
+
+    def test_tip_queries(self):
+        assert LiteBalancer._history_point("get_all_shards_info", (None,), {}) is None
+        assert LiteBalancer._history_point("get_info", (), {}) is None
+
+
+class TestArchiveRouting:
+    async def test_learns_archive_gap(self):
+        fast = _make_client(archive=False, rtt=0.01)
+        archive = _make_client(archive=True, rtt=0.5)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, archive])
+
+        await balancer.lookup_block(WorkchainID.MASTERCHAIN, MASTERCHAIN_SHARD, seqno=10)
+        assert fast.provider.lookup_block.await_count == 1
+        assert archive.provider.lookup_block.await_count == 1
+
+        await balancer.lookup_block(WorkchainID.MASTERCHAIN, MASTERCHAIN_SHARD, seqno=5)
+        assert fast.provider.lookup_block.await_count == 1
+        assert archive.provider.lookup_block.await_count == 2
+
+    async def test_recent_blocks_keep_default_routing(self):
+        fast = _make_client(archive=False, rtt=0.01)
+        archive = _make_client(archive=True, rtt=0.5)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, archive])
+
+        await balancer.lookup_block(WorkchainID.MASTERCHAIN, MASTERCHAIN_SHARD, seqno=10)
+        fast.provider.lookup_block.side_effect = None
+        fast.provider.lookup_block.return_value = (_make_block(900), None)
+
+        await balancer.lookup_block(WorkchainID.MASTERCHAIN, MASTERCHAIN_SHARD, seqno=900)
+        assert fast.provider.lookup_block.await_count == 2
+
+    async def test_lag_is_not_archive_gap(self):
+        fast = _make_client(archive=False, rtt=0.01, tip=1000)
+        archive = _make_client(archive=True, rtt=0.5, tip=1001)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, archive])
+
+        balancer._mark_missing(fast, (("seqno", -1), 1000))
+        assert balancer._get_state(fast).missing == {}
+
+    async def test_lagging_server_keeps_fresh_transactions(self):
+        lagging = _make_client(archive=False, rtt=0.01)
+        healthy = _make_client(archive=True, rtt=0.5)
+        not_in_db = ProviderResponseError(code=LITESERVER_BLOCK_NOT_IN_DB_CODE, message="not in db", endpoint="test")
+        lagging.provider.get_transactions = AsyncMock(side_effect=not_in_db)
+        healthy.provider.get_transactions = AsyncMock(return_value=[])
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[lagging, healthy])
+
+        await balancer._adnl_call("get_transactions", account=None, count=16, from_lt=50_000_000, from_hash="00")
+        assert lagging.provider.get_transactions.await_count == 1
+        assert healthy.provider.get_transactions.await_count == 1
+        assert balancer._get_state(lagging).missing == {}
+
+    async def test_lagging_server_keeps_fresh_shard_blocks(self):
+        lagging = _make_client(archive=False, rtt=0.01)
+        healthy = _make_client(archive=True, rtt=0.5)
+        not_in_db = ProviderResponseError(code=LITESERVER_BLOCK_NOT_IN_DB_CODE, message="not in db", endpoint="test")
+        lagging.provider.get_block_transactions = AsyncMock(side_effect=not_in_db)
+        healthy.provider.get_block_transactions = AsyncMock(return_value=[])
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[lagging, healthy])
+
+        await balancer.get_block_transactions(_make_block(42, workchain=0))
+        assert lagging.provider.get_block_transactions.await_count == 1
+        assert healthy.provider.get_block_transactions.await_count == 1
+        assert balancer._get_state(lagging).missing == {}
+
+    async def test_learns_gap_below_settled_point(self):
+        fast = _make_client(archive=False, rtt=0.01)
+        archive = _make_client(archive=True, rtt=0.5)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, archive])
+        balancer._frontiers[("lt", 0)] = HistoryFrontier(settled=1_000)
+
+        assert not balancer._mark_missing(fast, (("lt", 0), 1_001))
+        assert balancer._mark_missing(fast, (("lt", 0), 900))
+        assert balancer._pick_client((("lt", 0), 800)) is archive
+
+    def test_frontier_settles_after_window(self):
+        frontier = HistoryFrontier()
+        frontier.observe(10, now=0.0)
+        frontier.observe(20, now=0.5)
+        frontier.observe(30, now=2.0)
+
+        assert frontier.settle(30.0, window=60.0) is None
+        assert frontier.settle(60.0, window=60.0) == 10
+        assert frontier.settle(62.0, window=60.0) == 30
+
+    async def test_probed_depth_routes_utime(self):
+        fast = _make_client(archive=False, rtt=0.01)
+        archive = _make_client(archive=True, rtt=0.5)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, archive])
+        balancer._get_state(fast).archive_from = 1_700_000_000
+        balancer._get_state(archive).archive_from = 1_600_000_000
+
+        assert balancer._pick_client((("utime", 0), 1_650_000_000)) is archive
+        assert balancer._pick_client((("utime", 0), 1_750_000_000)) is fast
+
+
+def _make_lazy_client(delay: float) -> LiteClient:
+    client = _make_client(archive=True, rtt=delay)
+    provider = client.provider
+    provider.connected = False
+    provider.last_ping_rtt = None
+
+    async def connect() -> None:
+        await asyncio.sleep(delay)
+        provider.connected = True
+
+    async def close() -> None:
+        provider.connected = False
+
+    provider.connect = AsyncMock(side_effect=connect)
+    provider.close = AsyncMock(side_effect=close)
+    return client
+
+
+class TestHotLimit:
+    def test_rejects_non_positive(self):
+        with pytest.raises(ClientError):
+            LiteBalancer(NetworkGlobalID.MAINNET, clients=[_make_lazy_client(0)], hot_limit=0)
+
+    async def test_keeps_fastest_hot(self):
+        slow, fast, mid = _make_lazy_client(0.06), _make_lazy_client(0.0), _make_lazy_client(0.03)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[slow, fast, mid], hot_limit=1)
+        try:
+            await balancer.connect()
+            assert balancer.alive_clients == (fast,)
+            assert set(balancer.standby_clients) == {slow, mid}
+            assert not slow.connected
+            assert not mid.connected
+        finally:
+            await balancer.close()
+
+    async def test_promotes_on_failure(self):
+        fast, mid = _make_lazy_client(0.0), _make_lazy_client(0.02)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, mid], hot_limit=1)
+        try:
+            await balancer.connect()
+            fast.provider.connected = False
+
+            await balancer.lookup_block(WorkchainID.MASTERCHAIN, MASTERCHAIN_SHARD, seqno=900)
+            assert mid.provider.lookup_block.await_count == 1
+            assert mid in balancer.alive_clients
+        finally:
+            await balancer.close()
+
+    async def test_rebalance_trims_surplus(self):
+        fast, mid = _make_lazy_client(0.0), _make_lazy_client(0.02)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, mid], hot_limit=1)
+        try:
+            await balancer.connect()
+            balancer._mark_error(fast, is_rate_limit=True)
+            await balancer._rebalance_tiers()
+            assert balancer.alive_clients == (mid,)
+
+            balancer._mark_success(fast)
+            await balancer._rebalance_tiers()
+            assert balancer.alive_clients == (fast,)
+            assert balancer.standby_clients == (mid,)
+        finally:
+            await balancer.close()
+
+    async def test_probed_standby_is_not_picked(self):
+        fast, mid = _make_lazy_client(0.0), _make_lazy_client(0.05)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, mid], hot_limit=1)
+        released = asyncio.Event()
+
+        async def close() -> None:
+            await released.wait()
+            mid.provider.connected = False
+
+        try:
+            await balancer.connect()
+            mid.provider.close = AsyncMock(side_effect=close)
+            probe = asyncio.create_task(balancer._probe_standby())
+            await asyncio.sleep(0.1)
+
+            assert mid.connected
+            assert balancer.alive_clients == (fast,)
+            assert balancer._pick_client() is fast
+
+            released.set()
+            await probe
+            assert not mid.connected
+            assert not balancer._get_state(mid).probing
+        finally:
+            released.set()
+            await balancer.close()
+
+
+def _make_sender(delay: float, *, accept: bool = True) -> LiteClient:
+    client = _make_client(archive=True, rtt=delay)
+
+    async def send_message(body: bytes, priority: bool = False) -> None:
+        await asyncio.sleep(delay)
+        if not accept:
+            raise ProviderResponseError(code=0, message="rejected", endpoint="test")
+
+    client.provider.send_message = AsyncMock(side_effect=send_message)
+    return client
+
+
+class TestBroadcast:
+    async def test_returns_first_acceptance(self):
+        fast, slow, unused = _make_sender(0.0), _make_sender(0.05), _make_sender(0.1)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[slow, unused, fast])
+
+        result = await balancer.broadcast_message("00", count=2)
+        assert result.accepted_by is fast
+        assert slow not in result.latencies
+
+        await result.wait()
+        assert set(result.latencies) == {fast, slow}
+        assert unused.provider.send_message.await_count == 0
+
+    async def test_ignores_partial_rejection(self):
+        bad, good = _make_sender(0.0, accept=False), _make_sender(0.02)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[bad, good])
+
+        result = await balancer.broadcast_message("00", count=2)
+        assert result.accepted_by is good
+        assert bad in result.errors
+
+    async def test_all_rejected(self):
+        clients = [_make_sender(0.0, accept=False), _make_sender(0.01, accept=False)]
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=clients)
+
+        with pytest.raises(BalancerError):
+            await balancer.broadcast_message("00", count=2)
+
+    async def test_send_message_broadcast(self):
+        a, b = _make_sender(0.0), _make_sender(0.0)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[a, b])
+
+        await balancer.send_message("00", broadcast=2)
+        assert a.provider.send_message.await_count == 1
+        assert b.provider.send_message.await_count == 1
+
+    async def test_send_message_holds_background_sends(self):
+        fast, slow = _make_sender(0.0), _make_sender(0.05)
+        balancer = LiteBalancer(NetworkGlobalID.MAINNET, clients=[fast, slow])
+
+        await balancer.send_message("00", broadcast=2)
+        assert len(balancer._broadcast_tasks) == 1
+
+        await asyncio.gather(*balancer._broadcast_tasks)
+        assert not balancer._broadcast_tasks
+        assert slow.provider.send_message.await_count == 1
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+from nacl.signing import SigningKey
+from ton_core import BlockIdExt, LiteServerConfig
+
+from tonutils.providers.lite import LiteProvider
+
+
+def _make_provider() -> LiteProvider:
+    pub = bytes(SigningKey.generate().verify_key)
+    return LiteProvider(LiteServerConfig(ip="127.0.0.1", port=1, id=pub), request_timeout=4.0)
+
+
+def _make_block(seqno: int) -> BlockIdExt:
+    return BlockIdExt(workchain=-1, shard=-(2**63), seqno=seqno, root_hash=bytes(32), file_hash=bytes(32))
+
+
+def _decode(provider: LiteProvider, query: bytes) -> t.Any:
+    root, _ = provider.tl_schemas.deserialize(query, boxed=True)
+    return root["data"]
+
+
+class TestBuildQuery:
+    def test_plain_query(self):
+        provider = _make_provider()
+        data = _decode(provider, provider._build_liteserver_query("getTime"))
+        assert data["@type"] == "liteServer.getTime"
+
+    def test_wait_prefix(self):
+        provider = _make_provider()
+        query = provider._build_liteserver_query("getTime", wait_seqno=42)
+        wait, inner = _decode(provider, query)
+        assert wait["@type"] == "liteServer.waitMasterchainSeqno"
+        assert wait["seqno"] == 42
+        assert wait["timeout_ms"] == provider.wait_timeout_ms == 2000
+        assert inner["@type"] == "liteServer.getTime"
+
+
+class TestResolveMcBlock:
+    async def test_known_block_is_reused(self, monkeypatch: pytest.MonkeyPatch):
+        provider = _make_provider()
+        provider.updater.advance(_make_block(100))
+
+        async def fail(*_: t.Any, **__: t.Any) -> t.Any:
+            raise AssertionError("unexpected query")
+
+        monkeypatch.setattr(provider, "send_adnl_query", fail)
+        block = await provider._resolve_mc_block(min_seqno=100)
+        assert block.seqno == 100
+
+    async def test_waits_for_newer_block(self, monkeypatch: pytest.MonkeyPatch):
+        provider = _make_provider()
+        provider.updater.advance(_make_block(100))
+        sent: list[bytes] = []
+
+        async def send(query: bytes, priority: bool = False) -> dict[str, t.Any]:
+            sent.append(query)
+            block = _make_block(105).to_dict()
+            return {"last": block, "init": block, "state_root_hash": bytes(32)}
+
+        monkeypatch.setattr(provider, "send_adnl_query", send)
+        block = await provider._resolve_mc_block(min_seqno=105)
+
+        assert block.seqno == 105
+        assert provider.last_mc_block is not None
+        assert provider.last_mc_block.seqno == 105
+        wait, inner = _decode(provider, sent[0])
+        assert wait["seqno"] == 105
+        assert inner["@type"] == "liteServer.getMasterchainInfo"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from ton_core import Address, NetworkGlobalID, begin_cell
+
+from tonutils.contracts.jetton import JettonMasterStablecoinV2, JettonMasterStandard, JettonWalletResolver
+from tonutils.contracts.wallet import JettonTransferBuilder, TONTransferBuilder, WalletHighloadV3R1
+from tonutils.exceptions import ContractError
+from tonutils.types import ContractInfo
+
+MASTER_A = Address("EQCxE6mUtQJKFnGfaROTKOt1lZbDiiX1kCixRv7Nw2Id_sDs")
+MASTER_B = Address("EQAvlWFDxGF2lXm67y4yzC17wYKD9A0guwPkMs1gOsM__NOT")
+
+
+def _make_wallet() -> tuple[WalletHighloadV3R1, AsyncMock]:
+    client = MagicMock()
+    client.network = NetworkGlobalID.MAINNET
+    client.get_info = AsyncMock(return_value=ContractInfo())
+
+    async def run_get_method(address, method_name, stack=None):
+        await asyncio.sleep(0.01)
+        return [Address((0, Address(address).hash_part))]
+
+    client.run_get_method = AsyncMock(side_effect=run_get_method)
+    wallet, _, _, _ = WalletHighloadV3R1.create(client)
+    return wallet, client.run_get_method
+
+
+class TestBuilderResolution:
+    async def test_dedups_jetton_wallet_lookups(self):
+        wallet, run_get_method = _make_wallet()
+        builders = [
+            JettonTransferBuilder(destination=wallet.address, jetton_amount=n, jetton_master_address=master)
+            for n in range(250)
+            for master in (MASTER_A, MASTER_B)
+        ]
+
+        await wallet.build_external_message(builders)
+        assert run_get_method.await_count == 2
+
+        await wallet.build_external_message(builders[:10])
+        assert run_get_method.await_count == 2
+
+    async def test_keeps_message_order(self):
+        wallet, _ = _make_wallet()
+        messages = [
+            JettonTransferBuilder(destination=wallet.address, jetton_amount=1, jetton_master_address=MASTER_A),
+            await TONTransferBuilder(destination=wallet.address, amount=2).build(wallet),
+            TONTransferBuilder(destination=wallet.address, amount=3),
+        ]
+
+        resolved = await wallet._resolve_messages(messages)
+        assert resolved[0].message.info.dest == Address((0, MASTER_A.hash_part))
+        assert resolved[1] is messages[1]
+        assert resolved[2].message.info.value.grams == 3
+
+
+class TestJettonWalletResolver:
+    def test_derives_registered_master(self):
+        code = begin_cell().store_uint(1, 8).end_cell()
+        resolver = JettonWalletResolver()
+        resolver.register(MASTER_A, code, JettonMasterStablecoinV2)
+
+        owner = Address("EQCD39VS5jcptHL8vMjEXrzGaRcCVYto7HUn4bpAOg8xqB2N")
+        expected = JettonMasterStablecoinV2.calculate_user_jetton_wallet_address(owner, MASTER_A, code)
+        assert resolver.derive(owner, MASTER_A.to_str()) == expected
+        assert resolver.derive(owner, MASTER_B) is None
+
+    async def test_wallet_skips_get_method(self):
+        wallet, run_get_method = _make_wallet()
+        code = begin_cell().store_uint(1, 8).end_cell()
+        wallet.jetton_resolver = JettonWalletResolver()
+        wallet.jetton_resolver.register(MASTER_A, code)
+
+        builders = [
+            JettonTransferBuilder(destination=wallet.address, jetton_amount=1, jetton_master_address=master)
+            for master in (MASTER_A, MASTER_B)
+        ]
+        resolved = await wallet._resolve_messages(builders)
+
+        expected = JettonMasterStandard.calculate_user_jetton_wallet_address(wallet.address, MASTER_A, code)
+        assert resolved[0].message.info.dest == expected
+        assert run_get_method.await_count == 1
+
+    async def test_load_rejects_wrong_layout(self, monkeypatch: pytest.MonkeyPatch):
+        wallet, _ = _make_wallet()
+        master = MagicMock()
+        master.address = MASTER_A
+        master.jetton_wallet_code = begin_cell().store_uint(1, 8).end_cell()
+        monkeypatch.setattr(JettonMasterStandard, "from_address", AsyncMock(return_value=master))
+
+        resolver = JettonWalletResolver()
+        with pytest.raises(ContractError):
+            await resolver.load(wallet.client, MASTER_A)
+        assert MASTER_A not in resolver
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from ton_core import Cell, ContractState, MessageAny, NetworkGlobalID
+
+from tonutils.contracts import OptimisticSender, WalletHighloadV3R1, WalletV4R2
+from tonutils.exceptions import ClientError, ContractError
+from tonutils.types import ContractInfo
+
+
+def _make_wallet() -> WalletV4R2:
+    client = MagicMock()
+    client.network = NetworkGlobalID.MAINNET
+    client.send_message = AsyncMock()
+    wallet = WalletV4R2.create(client)[0]
+    state_init = wallet.state_init
+    assert state_init is not None
+    client.get_info = AsyncMock(return_value=ContractInfo(state=ContractState.ACTIVE, data=state_init.data))
+    return wallet
+
+
+def _sent_seqnos(wallet: WalletV4R2) -> list[int]:
+    seqnos = []
+    for call in wallet.client.send_message.await_args_list:
+        message = MessageAny.deserialize(Cell.one_from_boc(call.args[0]).begin_parse())
+        body = message.body.begin_parse()
+        body.skip_bits(512 + 32 + 32)
+        seqnos.append(body.load_uint(32))
+    return seqnos
+
+
+class TestOptimisticSender:
+    def test_rejects_highload(self):
+        wallet = WalletHighloadV3R1.create(MagicMock())[0]
+        with pytest.raises(ContractError):
+            OptimisticSender(wallet)  # type: ignore[arg-type]
+
+    async def test_increments_locally(self):
+        wallet = _make_wallet()
+        sender = OptimisticSender(wallet)
+
+        for n in range(3):
+            await sender.transfer(wallet.address, n + 1)
+
+        assert wallet.client.get_info.await_count == 1
+        assert _sent_seqnos(wallet) == [0, 1, 2]
+        assert sender.seqno == 3
+
+    async def test_resyncs_after_failure(self):
+        wallet = _make_wallet()
+        sender = OptimisticSender(wallet)
+        await sender.transfer(wallet.address, 1)
+
+        wallet.client.send_message.side_effect = ClientError("rejected")
+        with pytest.raises(ClientError):
+            await sender.transfer(wallet.address, 1)
+        assert sender.seqno is None
+
+        wallet.client.send_message.side_effect = None
+        await sender.transfer(wallet.address, 1)
+        assert wallet.client.get_info.await_count == 2
+        assert _sent_seqnos(wallet)[-1] == 0
+
+    async def test_resyncs_when_stale(self):
+        wallet = _make_wallet()
+        sender = OptimisticSender(wallet, max_age=0.0)
+        await sender.transfer(wallet.address, 1)
+        await asyncio.sleep(0.01)
+        await sender.transfer(wallet.address, 1)
+        assert wallet.client.get_info.await_count == 2
+
+    @pytest.mark.parametrize(
+        ("outcome", "diverged"),
+        [
+            (MagicMock(description=MagicMock(aborted=False)), False),
+            (MagicMock(description=MagicMock(aborted=True)), True),
+            (ClientError("not delivered"), True),
+        ],
+    )
+    async def test_delivery_outcome(self, outcome: object, diverged: bool):
+        wallet = _make_wallet()
+        tracker = MagicMock()
+        tracker.wait = AsyncMock(side_effect=[outcome])
+        sender = OptimisticSender(wallet, tracker=tracker)
+
+        await sender.transfer(wallet.address, 1)
+        await asyncio.gather(*sender._watchers)
+        assert (sender.seqno is None) is diverged
+        await sender.close()
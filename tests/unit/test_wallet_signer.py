@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from ton_core import NetworkGlobalID, WalletV4Params, WalletV5Params
+
+from tonutils.contracts import (
+    TONTransferBuilder,
+    WalletV4R2,
+    WalletV5R1,
+    sign_external_messages,
+)
+from tonutils.exceptions import ContractError
+from tonutils.types import ContractInfo, ContractState
+
+
+def _make_client() -> MagicMock:
+    client = MagicMock()
+    client.network = NetworkGlobalID.MAINNET
+    return client
+
+
+class TestSignExternalMessages:
+    @pytest.mark.parametrize("processes", [1, 2])
+    async def test_matches_build_external_message(self, processes: int):
+        client = _make_client()
+        wallets = [WalletV4R2.create(client)[0] for _ in range(3)] + [WalletV5R1.create(client)[0]]
+        jobs = []
+        for n, wallet in enumerate(wallets):
+            wallet._info = ContractInfo(state=ContractState.ACTIVE if n % 2 else ContractState.UNINIT)
+            wallet.refresh = MagicMock(side_effect=_noop)  # type: ignore[method-assign]
+            params_model = WalletV5Params if isinstance(wallet, WalletV5R1) else WalletV4Params
+            params = params_model(seqno=n, valid_until=1_900_000_000)
+            jobs.append((wallet, [TONTransferBuilder(destination=wallet.address, amount=n + 1)], params))
+
+        bocs = await sign_external_messages(jobs, processes=processes)
+        for (wallet, messages, params), boc in zip(jobs, bocs):
+            expected = await wallet.build_external_message(messages, params)
+            assert boc == expected.to_boc()
+
+    async def test_requires_private_key(self):
+        client = _make_client()
+        wallet = WalletV4R2(client, WalletV4R2.create(client)[0].address)
+        with pytest.raises(ContractError):
+            await sign_external_messages([(wallet, [], None)])
+
+
+async def _noop() -> None:
+    return None
@@ -1,3 +1,4 @@
+from .cache import DhtValueCache
 from .client import DhtClient
 from .models import (
     Bucket,
@@ -8,6 +9,9 @@ from .models import (
     DhtUpdateRule,
     DhtValue,
     PriorityList,
+    RoutingTable,
+    StoreReport,
+    StoreResult,
 )
 from .network import DhtNetwork
 
@@ -21,5 +25,9 @@ __all__ = [
     "DhtNode",
     "DhtUpdateRule",
     "DhtValue",
+    "DhtValueCache",
     "PriorityList",
+    "RoutingTable",
+    "StoreReport",
+    "StoreResult",
 ]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+import typing as t
+from collections import OrderedDict
+
+if t.TYPE_CHECKING:
+    from tonutils.clients.dht.models import DhtValue
+
+
+class DhtValueCache:
+    """Bounded LRU cache of DHT lookup results keyed by ``DhtKey.key_id``.
+
+    Found values are kept until their own ``ttl`` (optionally capped by
+    ``max_ttl``); missing values are remembered for ``negative_ttl``
+    seconds so repeated lookups of absent keys do not walk the DHT.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        negative_ttl: float = 5.0,
+        max_ttl: float | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        :param max_size: Maximum number of entries; ``0`` disables caching.
+        :param negative_ttl: Seconds a "not found" result is kept; ``0`` disables negative caching.
+        :param max_ttl: Upper bound in seconds on how long a found value is kept, or ``None``.
+        """
+        self._max_size = max_size
+        self._negative_ttl = negative_ttl
+        self._max_ttl = max_ttl
+        self._entries: OrderedDict[bytes, tuple[float, DhtValue | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def get(self, key_id: bytes) -> tuple[bool, DhtValue | None]:
+        """Look up a cached result.
+
+        :param key_id: 32-byte DHT key ID.
+        :return: ``(hit, value)``; ``value`` is ``None`` for a cached miss.
+        """
+        entry = self._entries.get(key_id)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key_id]
+            return False, None
+        self._entries.move_to_end(key_id)
+        return True, value
+
+    def put(self, key_id: bytes, value: DhtValue | None) -> None:
+        """Cache a lookup result, evicting the least recently used entries.
+
+        An expired value drops any cached entry for the key.
+
+        :param key_id: 32-byte DHT key ID.
+        :param value: Found value, or ``None`` for a miss.
+        """
+        now = time.time()
+        if value is None:
+            expires_at = now + self._negative_ttl
+        else:
+            expires_at = float(value.ttl)
+            if self._max_ttl is not None:
+                expires_at = min(expires_at, now + self._max_ttl)
+        if expires_at <= now or self._max_size <= 0:
+            self._entries.pop(key_id, None)
+            return
+
+        self._entries[key_id] = (expires_at, value)
+        self._entries.move_to_end(key_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key_id: bytes) -> None:
+        """Drop the cached result for a key.
+
+        :param key_id: 32-byte DHT key ID.
+        """
+        self._entries.pop(key_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
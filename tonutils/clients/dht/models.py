@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import hashlib
 import time
 import typing as t
@@ -18,6 +19,7 @@ __all__ = [
     "DhtValue",
     "KeyLike",
     "PriorityList",
+    "RoutingTable",
     "affinity",
     "compute_key_id",
     "normalize_key",
@@ -167,10 +169,12 @@ class DhtNode:
         adnl_id: bytes,
         addr: str,
         server_key: bytes,
+        record: dict[str, t.Any] | None = None,
     ) -> None:
         self._adnl_id = adnl_id
         self._addr = addr
         self._server_key = server_key
+        self._record = record
         self._bad_score: int = 0
         self._ping: int = 0
         self._in_fly_queries: int = 0
@@ -190,11 +194,21 @@ class DhtNode:
         """Return the server public key."""
         return self._server_key
 
+    @property
+    def record(self) -> dict[str, t.Any] | None:
+        """Return the signed ``dht.node`` record, or ``None`` for config nodes."""
+        return self._record
+
     @property
     def bad_score(self) -> int:
         """Return the current failure score of this node."""
         return self._bad_score
 
+    @bad_score.setter
+    def bad_score(self, value: int) -> None:
+        """Set the failure score, clamped to ``0..3``."""
+        self._bad_score = max(0, min(value, self._MAX_FAIL_COUNT))
+
     @property
     def ping(self) -> int:
         """Return the last measured ping latency in milliseconds."""
@@ -245,47 +259,147 @@ class Bucket:
 
     def __init__(self, k: int) -> None:
         self._capacity = k * 5
-        self._nodes: list[DhtNode] = []
+        self._nodes: dict[bytes, DhtNode] = {}
+
+    def add_node(self, node: DhtNode) -> DhtNode | None:
+        """Add or replace a node, evicting the least healthy one when full.
 
-    def add_node(self, node: DhtNode) -> None:
-        """Add or replace a node in the bucket, maintaining sorted order."""
-        for i, existing in enumerate(self._nodes):
-            if existing.adnl_id == node.adnl_id:
-                self._nodes[i] = node
-                self._sort()
-                return
-        self._nodes.append(node)
-        self._sort()
-        if len(self._nodes) > self._capacity:
-            self._nodes = self._nodes[: self._capacity]
+        :param node: Node to add.
+        :return: Evicted node (possibly ``node`` itself), or ``None``.
+        """
+        self._nodes[node.adnl_id] = node
+        if len(self._nodes) <= self._capacity:
+            return None
+        # Ties evict the most recently added node, matching a stable sort + truncate.
+        evicted = max(reversed(list(self._nodes.values())), key=lambda n: n.sort_key())
+        del self._nodes[evicted.adnl_id]
+        return evicted
 
     def find_node(self, adnl_id: bytes) -> DhtNode | None:
         """Find a node by its ADNL ID, or return ``None``."""
-        for node in self._nodes:
-            if node.adnl_id == adnl_id:
-                return node
-        return None
+        return self._nodes.get(adnl_id)
 
     def get_nodes(self) -> list[DhtNode]:
-        """Return a shallow copy of all nodes in the bucket."""
-        return list(self._nodes)
-
-    def _sort(self) -> None:
-        self._nodes.sort(key=lambda n: n.sort_key())
+        """Return the nodes in the bucket, healthiest first."""
+        return sorted(self._nodes.values(), key=lambda n: n.sort_key())
 
     def __len__(self) -> int:
         return len(self._nodes)
 
 
+class RoutingTable:
+    """Kademlia buckets with an ID-ordered index for closest-node queries.
+
+    Affinity to a target (common prefix length) never increases while
+    moving away from the target's position in ID order, so the index
+    yields nodes best-first by merging the two neighbours of that
+    position. A lookup costs one binary search plus the nodes it visits.
+    """
+
+    def __init__(self, local_id: bytes, k: int, bucket_count: int = 256) -> None:
+        self._local_id = local_id
+        self._buckets = [Bucket(k=k) for _ in range(bucket_count)]
+        self._ids: list[int] = []
+        self._nodes: dict[int, DhtNode] = {}
+
+    def add(self, node: DhtNode) -> None:
+        """Add or replace a node in its bucket and the index.
+
+        :param node: Node to add; the local node is ignored.
+        """
+        if node.adnl_id == self._local_id:
+            return
+        bucket_idx = min(affinity(self._local_id, node.adnl_id), len(self._buckets) - 1)
+        evicted = self._buckets[bucket_idx].add_node(node)
+        if evicted is node:
+            return
+
+        node_key = int.from_bytes(node.adnl_id[:32], "big")
+        if node_key not in self._nodes:
+            bisect.insort(self._ids, node_key)
+        self._nodes[node_key] = node
+
+        if evicted is not None:
+            evicted_key = int.from_bytes(evicted.adnl_id[:32], "big")
+            del self._nodes[evicted_key]
+            del self._ids[bisect.bisect_left(self._ids, evicted_key)]
+
+    def find_node(self, adnl_id: bytes) -> DhtNode | None:
+        """Find a node by its ADNL ID, or return ``None``."""
+        return self._nodes.get(int.from_bytes(adnl_id[:32], "big"))
+
+    def get_nodes(self) -> list[DhtNode]:
+        """Return all nodes in ID order."""
+        return [self._nodes[node_key] for node_key in self._ids]
+
+    def iter_closest(self, target_id: bytes) -> t.Iterator[DhtNode]:
+        """Yield nodes in order of decreasing affinity to the target.
+
+        :param target_id: 256-bit lookup target.
+        :return: Iterator over nodes, best first.
+        """
+        target = int.from_bytes(target_id[:32], "big")
+        ids = self._ids
+        hi = bisect.bisect_left(ids, target)
+        lo = hi - 1
+        while lo >= 0 or hi < len(ids):
+            if hi >= len(ids) or (lo >= 0 and (ids[lo] ^ target).bit_length() <= (ids[hi] ^ target).bit_length()):
+                node_key, lo = ids[lo], lo - 1
+            else:
+                node_key, hi = ids[hi], hi + 1
+            yield self._nodes[node_key]
+
+    def closest(
+        self,
+        target_id: bytes,
+        good_count: int,
+        bad_count: int,
+    ) -> tuple[list[DhtNode], list[DhtNode]]:
+        """Return the closest healthy and unhealthy nodes to a target.
+
+        Stops once ``good_count`` healthy nodes are found: every later
+        node has no higher affinity than the worst of them.
+
+        :param target_id: 256-bit lookup target.
+        :param good_count: Maximum number of nodes with ``bad_score == 0``.
+        :param bad_count: Maximum number of nodes with ``bad_score > 0``.
+        :return: Tuple of (good, bad) nodes, best first.
+        """
+        good: list[DhtNode] = []
+        bad: list[DhtNode] = []
+        for node in self.iter_closest(target_id):
+            if node.bad_score == 0:
+                good.append(node)
+                if len(good) >= good_count:
+                    break
+            elif len(bad) < bad_count:
+                bad.append(node)
+        return good, bad
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
 class PriorityList:
-    """Fixed-size, affinity-sorted node list with ``used`` tracking."""
+    """Fixed-size, affinity-sorted node list with ``used`` tracking.
+
+    Affinities are computed once per node and kept in a parallel
+    ascending key list, so inserts are a binary search.
+    """
 
     def __init__(self, max_len: int, target_id: bytes) -> None:
         self._max_len = max_len
         self._target_id = target_id
         self._nodes: list[DhtNode] = []
+        self._keys: list[int] = []
         self._used: dict[str, bool] = {}
 
+    def _insert(self, node: DhtNode, node_aff: int) -> None:
+        """Insert after nodes of equal affinity, keeping descending order."""
+        i = bisect.bisect_right(self._keys, -node_aff)
+        self._keys.insert(i, -node_aff)
+        self._nodes.insert(i, node)
+
     def add(self, node: DhtNode) -> bool:
         """Add a node if it improves the list.
 
@@ -297,26 +411,23 @@ class PriorityList:
         if node_id in self._used:
             for i, existing in enumerate(self._nodes):
                 if existing.id == node_id:
-                    existing_aff = affinity(existing.adnl_id, self._target_id)
-                    if node_aff <= existing_aff:
+                    if node_aff <= -self._keys[i]:
                         return False
-                    self._nodes[i] = node
+                    del self._nodes[i], self._keys[i]
+                    self._insert(node, node_aff)
                     self._used[node_id] = False
-                    self._sort()
                     return True
             return False
 
         if len(self._nodes) >= self._max_len:
-            worst = self._nodes[-1]
-            worst_aff = affinity(worst.adnl_id, self._target_id)
-            if node_aff <= worst_aff:
+            if node_aff <= -self._keys[-1]:
                 return False
             evicted = self._nodes.pop()
+            self._keys.pop()
             self._used.pop(evicted.id, None)
 
-        self._nodes.append(node)
+        self._insert(node, node_aff)
         self._used[node_id] = False
-        self._sort()
         return True
 
     def get(self) -> tuple[DhtNode | None, int]:
@@ -332,7 +443,7 @@ class PriorityList:
         """Return the highest affinity value among all nodes."""
         if not self._nodes:
             return 0
-        return affinity(self._nodes[0].adnl_id, self._target_id)
+        return -self._keys[0]
 
     def mark_used(self, node: DhtNode, used: bool) -> None:
         """Go parity: ``MarkUsed`` calls ``Add`` first."""
@@ -341,16 +452,37 @@ class PriorityList:
         if node_id in self._used:
             self._used[node_id] = used
 
-    def _sort(self) -> None:
-        self._nodes.sort(
-            key=lambda n: affinity(n.adnl_id, self._target_id),
-            reverse=True,
-        )
-
     def __len__(self) -> int:
         return len(self._nodes)
 
 
+@dataclass
+class StoreResult:
+    """Outcome of a ``dht.store`` query on one node."""
+
+    node: DhtNode
+    ok: bool
+    elapsed: float
+    """Seconds from sending the store query to its reply or failure."""
+
+
+@dataclass
+class StoreReport:
+    """Per-node outcome of a replicated DHT store."""
+
+    results: list[StoreResult] = field(default_factory=list)
+    """Store attempts in completion order."""
+    queried: int = 0
+    """Number of ``dht.findNodes`` queries sent while locating the closest nodes."""
+    elapsed: float = 0.0
+    """Seconds from the start of the store to its last completed attempt."""
+
+    @property
+    def stored(self) -> int:
+        """Number of nodes that accepted the value."""
+        return sum(1 for result in self.results if result.ok)
+
+
 @dataclass
 class Continuation:
     """Carries state between iterative DHT lookup rounds."""
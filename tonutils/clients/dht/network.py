@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import json
+import os
+import time
 import typing as t
 from contextlib import suppress
 
@@ -14,14 +18,17 @@ from ton_core import (
 )
 
 from tonutils.clients.config import resolve_config
+from tonutils.clients.dht.cache import DhtValueCache
 from tonutils.clients.dht.models import (
-    Bucket,
     Continuation,
     DhtKey,
     DhtNode,
     DhtValue,
     KeyLike,
     PriorityList,
+    RoutingTable,
+    StoreReport,
+    StoreResult,
     affinity,
     normalize_key,
 )
@@ -37,6 +44,10 @@ if t.TYPE_CHECKING:
     from tonutils.providers.dht import DhtProvider
 
 _BUCKET_COUNT = 256
+_FAST_RTT_RATIO = 0.25
+"""Replies faster than this share of ``request_timeout`` let adaptive lookups add a worker."""
+_SNAPSHOT_MAX_AGE = 24 * 60 * 60
+"""Snapshots older than this many seconds are ignored on connect."""
 
 
 class DhtNetwork:
@@ -53,7 +64,30 @@ class DhtNetwork:
         k: int = 7,
         connect_timeout: float = 5.0,
         request_timeout: float = 3.0,
+        cache: DhtValueCache | None = None,
+        alpha: int = 3,
+        max_alpha: int | None = None,
+        snapshot_path: str | os.PathLike[str] | None = None,
+        sockets: int = 1,
     ) -> None:
+        """Initialize the DHT network.
+
+        :param nodes: Bootstrap DHT nodes.
+        :param k: Kademlia replication parameter.
+        :param connect_timeout: Connection timeout in seconds.
+        :param request_timeout: Per-query timeout in seconds.
+        :param cache: Lookup result cache, or ``None`` for a default ``DhtValueCache``.
+        :param alpha: Number of nodes queried in parallel per lookup.
+        :param max_alpha: Upper bound for adaptive parallelism, or ``None`` to keep ``alpha`` fixed.
+        :param snapshot_path: Routing table snapshot file loaded on ``connect()``
+            and written on ``close()``, or ``None``.
+        :param sockets: Number of UDP sockets to spread peers over.
+        :raises ValueError: If ``alpha`` is below 1 or ``max_alpha`` is below ``alpha``.
+        """
+        if alpha < 1:
+            raise ValueError(f"alpha must be at least 1, got {alpha}")
+        if max_alpha is not None and max_alpha < alpha:
+            raise ValueError(f"max_alpha must be at least alpha ({alpha}), got {max_alpha}")
         from tonutils.providers.dht import DhtProvider
 
         self._provider = DhtProvider(
@@ -61,9 +95,15 @@ class DhtNetwork:
             k=k,
             connect_timeout=connect_timeout,
             request_timeout=request_timeout,
+            sockets=sockets,
         )
         self._gateway_id: bytes = self._provider.local_key_id
-        self._buckets: list[Bucket] = [Bucket(k=k) for _ in range(_BUCKET_COUNT)]
+        self._routing = RoutingTable(self._gateway_id, k=k, bucket_count=_BUCKET_COUNT)
+        self._cache = cache if cache is not None else DhtValueCache()
+        self._lookups: dict[bytes, asyncio.Task[DhtValue | None]] = {}
+        self._alpha = alpha
+        self._max_alpha = alpha if max_alpha is None else max_alpha
+        self._snapshot_path = snapshot_path
         self._connected = False
 
     @property
@@ -71,6 +111,16 @@ class DhtNetwork:
         """Return the underlying DHT provider."""
         return self._provider
 
+    @property
+    def routing_table(self) -> RoutingTable:
+        """Return the routing table of known DHT nodes."""
+        return self._routing
+
+    @property
+    def cache(self) -> DhtValueCache:
+        """Return the lookup result cache."""
+        return self._cache
+
     @property
     def connected(self) -> bool:
         """Return whether the network is connected."""
@@ -84,6 +134,11 @@ class DhtNetwork:
         k: int = 7,
         connect_timeout: float = 5.0,
         request_timeout: float = 3.0,
+        cache: DhtValueCache | None = None,
+        alpha: int = 3,
+        max_alpha: int | None = None,
+        snapshot_path: str | os.PathLike[str] | None = None,
+        sockets: int = 1,
     ) -> DhtNetwork:
         """Create a network instance from a global config."""
         config = resolve_config(config)
@@ -94,6 +149,11 @@ class DhtNetwork:
             k=k,
             connect_timeout=connect_timeout,
             request_timeout=request_timeout,
+            cache=cache,
+            alpha=alpha,
+            max_alpha=max_alpha,
+            snapshot_path=snapshot_path,
+            sockets=sockets,
         )
 
     @classmethod
@@ -104,6 +164,11 @@ class DhtNetwork:
         k: int = 7,
         connect_timeout: float = 5.0,
         request_timeout: float = 3.0,
+        cache: DhtValueCache | None = None,
+        alpha: int = 3,
+        max_alpha: int | None = None,
+        snapshot_path: str | os.PathLike[str] | None = None,
+        sockets: int = 1,
     ) -> DhtNetwork:
         """Create a network instance for mainnet or testnet."""
         config_getters = {
@@ -116,25 +181,107 @@ class DhtNetwork:
             k=k,
             connect_timeout=connect_timeout,
             request_timeout=request_timeout,
+            cache=cache,
+            alpha=alpha,
+            max_alpha=max_alpha,
+            snapshot_path=snapshot_path,
+            sockets=sockets,
         )
 
     async def connect(self) -> None:
-        """Connect to DHT bootstrap nodes and populate routing buckets."""
+        """Connect to DHT bootstrap nodes and populate routing buckets.
+
+        With at least ``k`` nodes restored from the snapshot, bootstrap
+        channels are not opened up front: every node is revalidated by
+        its first query instead.
+        """
         if self._connected:
             return
-        connected_nodes = await self._provider.connect()
-        for adnl_id, dht_node in connected_nodes:
-            bucket_idx = affinity(self._gateway_id, adnl_id)
-            self._buckets[min(bucket_idx, _BUCKET_COUNT - 1)].add_node(dht_node)
-        if not any(len(b) > 0 for b in self._buckets):
+        restored = 0
+        if self._snapshot_path is not None:
+            try:
+                restored = self.load_snapshot(self._snapshot_path)
+            except (OSError, ValueError):
+                restored = 0
+        connected_nodes = await self._provider.connect(lazy=restored >= self._provider.k)
+        for _, dht_node in connected_nodes:
+            self._routing.add(dht_node)
+        if len(self._routing) == 0:
             raise ClientError("DhtNetwork: all DHT nodes failed to connect")
         self._connected = True
 
     async def close(self) -> None:
-        """Close the network and disconnect from all nodes."""
+        """Close the network, saving the snapshot if configured."""
+        if self._snapshot_path is not None and self._connected:
+            with suppress(OSError):
+                self.save_snapshot(self._snapshot_path)
         self._connected = False
+        lookups, self._lookups = list(self._lookups.values()), {}
+        for lookup in lookups:
+            lookup.cancel()
+        await asyncio.gather(*lookups, return_exceptions=True)
         await self._provider.close()
 
+    def save_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """Write verified routing table nodes to a file.
+
+        Stores each node's signed ``dht.node`` record with its ping and
+        ``bad_score``; bootstrap nodes from the config are skipped.
+
+        :param path: Snapshot file path; written atomically.
+        :return: Number of nodes saved.
+        """
+        codec = self._provider.codec
+        nodes = [
+            {
+                "record": codec.serialize_node(node.record).hex(),
+                "ping": node.ping,
+                "bad_score": node.bad_score,
+            }
+            for node in self._routing.get_nodes()
+            if node.record is not None and node.bad_score < DhtNode._MAX_FAIL_COUNT
+        ]
+        snapshot = {"saved_at": int(time.time()), "nodes": nodes}
+
+        tmp = f"{os.fspath(path)}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp, path)
+        return len(nodes)
+
+    def load_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """Add nodes from a snapshot file to the routing table.
+
+        Signatures are verified again; ping and ``bad_score`` are restored.
+        A missing or outdated snapshot loads nothing.
+
+        :param path: Snapshot file path.
+        :return: Number of nodes added.
+        :raises ValueError: If the file is not a valid snapshot.
+        """
+        if not os.path.exists(path):
+            return 0
+        with open(path) as f:
+            snapshot = json.load(f)
+        if not isinstance(snapshot, dict) or not isinstance(snapshot.get("nodes"), list):
+            raise ValueError(f"Invalid DHT snapshot: {os.fspath(path)}")
+        if time.time() - snapshot.get("saved_at", 0) > _SNAPSHOT_MAX_AGE:
+            return 0
+
+        added = 0
+        for entry in snapshot["nodes"]:
+            record = entry.get("record") if isinstance(entry, dict) else None
+            if not isinstance(record, str):
+                continue
+            dht_node = self._provider.codec.parse_node_bytes(bytes.fromhex(record))
+            if dht_node is None or dht_node.adnl_id == self._gateway_id:
+                continue
+            dht_node.ping = entry.get("ping", 0)
+            dht_node.bad_score = entry.get("bad_score", 0)
+            self._routing.add(dht_node)
+            added += 1
+        return added
+
     async def __aenter__(self) -> DhtNetwork:
         await self.connect()
         return self
@@ -153,40 +300,24 @@ class DhtNetwork:
         dht_node = self._provider.codec.parse_node(node_tl)
         if dht_node is None or dht_node.adnl_id == self._gateway_id:
             return None
-        bucket_idx = affinity(self._gateway_id, dht_node.adnl_id)
-        self._buckets[min(bucket_idx, _BUCKET_COUNT - 1)].add_node(dht_node)
+        self._routing.add(dht_node)
         return dht_node
 
     def _add_parsed_node(self, dht_node: DhtNode) -> None:
         """Add an already-parsed DhtNode to routing buckets."""
-        if dht_node.adnl_id == self._gateway_id:
-            return
-        bucket_idx = affinity(self._gateway_id, dht_node.adnl_id)
-        self._buckets[min(bucket_idx, _BUCKET_COUNT - 1)].add_node(dht_node)
+        self._routing.add(dht_node)
 
     def _build_priority_list(self, target_id: bytes) -> PriorityList:
         k = self._provider.k
         good_count = k + k // 2
         bad_count = k // 2
 
-        good: list[tuple[int, DhtNode]] = []
-        bad: list[tuple[int, DhtNode]] = []
-
-        for bucket in self._buckets:
-            for node in bucket.get_nodes():
-                aff = affinity(node.adnl_id, target_id)
-                if node.bad_score == 0:
-                    good.append((aff, node))
-                else:
-                    bad.append((aff, node))
-
-        good.sort(key=lambda x: x[0], reverse=True)
-        bad.sort(key=lambda x: x[0], reverse=True)
+        good, bad = self._routing.closest(target_id, good_count, bad_count)
 
         plist = PriorityList(max_len=good_count, target_id=target_id)
-        for _, node in good[:good_count]:
+        for node in good:
             plist.add(node)
-        for _, node in bad[:bad_count]:
+        for node in bad:
             plist.add(node)
 
         return plist
@@ -196,14 +327,53 @@ class DhtNetwork:
         key: DhtKey,
         continuation: Continuation | None = None,
     ) -> DhtValue | None:
-        """Perform iterative ``dht.findValue`` with 3 concurrent workers.
+        """Find a value, serving repeated lookups from the cache.
 
-        Provider returns ``DhtValue | list[DhtNode] | None``, so
-        this method works entirely with models — no TL.
+        Concurrent lookups of the same key share one iterative walk.
+        A ``continuation`` always bypasses the cache.
+
+        :param key: DHT key to look up.
+        :param continuation: State carried over from a previous round, or ``None``.
+        :return: Found ``DhtValue``, or ``None``.
         """
         if not self.connected:
             raise NotConnectedError(component="DhtNetwork", operation="find_value")
+        if continuation is not None:
+            return await self._lookup_value(key, continuation)
+
+        key_id = key.key_id
+        hit, value = self._cache.get(key_id)
+        if hit:
+            return value
+
+        lookup = self._lookups.get(key_id)
+        if lookup is None:
+            lookup = asyncio.create_task(self._lookup_value(key))
+            self._lookups[key_id] = lookup
+            lookup.add_done_callback(lambda task: self._finish_lookup(key_id, task))
+        return await asyncio.shield(lookup)
+
+    def _finish_lookup(self, key_id: bytes, task: asyncio.Task[DhtValue | None]) -> None:
+        """Cache the result of a shared lookup and release its slot."""
+        if self._lookups.get(key_id) is task:
+            del self._lookups[key_id]
+        if not task.cancelled() and task.exception() is None:
+            self._cache.put(key_id, task.result())
+
+    async def _lookup_value(
+        self,
+        key: DhtKey,
+        continuation: Continuation | None = None,
+    ) -> DhtValue | None:
+        """Perform iterative ``dht.findValue`` with ``alpha`` concurrent workers.
 
+        In adaptive mode (``max_alpha > alpha``) a worker is added each
+        time a fast reply brings closer nodes, and workers above
+        ``alpha`` retire when their node times out.
+
+        Provider returns ``DhtValue | list[DhtNode] | None``, so
+        this method works entirely with models — no TL.
+        """
         target = key.key_id
         plist = self._build_priority_list(target)
 
@@ -216,15 +386,22 @@ class DhtNetwork:
 
         k = self._provider.k
         timeout = self._provider.request_timeout
+        fast_rtt = timeout * _FAST_RTT_RATIO
         result_value: DhtValue | None = None
         checked_nodes: list[DhtNode] = []
         found = False
         cond = asyncio.Condition()
         waiting_count = 0
-        worker_count = 3
+        worker_count = 0
+        tasks: list[asyncio.Task[None]] = []
+
+        def spawn() -> None:
+            nonlocal worker_count
+            worker_count += 1
+            tasks.append(asyncio.create_task(worker()))
 
         async def worker() -> None:
-            nonlocal result_value, found, waiting_count
+            nonlocal result_value, found, waiting_count, worker_count
 
             while not found:
                 async with cond:
@@ -243,10 +420,19 @@ class DhtNetwork:
                         continue
                     checked_nodes.append(node)
 
+                started = time.monotonic()
                 try:
                     result = await self._provider.find_value_on_node(node, target, k)
-                except (OSError, ProviderError, TransportError, asyncio.TimeoutError):
+                except asyncio.TimeoutError:
+                    async with cond:
+                        if worker_count > self._alpha:
+                            worker_count -= 1
+                            cond.notify_all()
+                            return
+                    continue
+                except (OSError, ProviderError, TransportError):
                     continue
+                rtt = time.monotonic() - started
 
                 if isinstance(result, DhtValue):
                     result_value = result
@@ -263,11 +449,16 @@ class DhtNetwork:
                             if plist.add(dht_node):
                                 added_any = True
                         if added_any:
+                            if rtt <= fast_rtt and worker_count < self._max_alpha:
+                                spawn()
                             cond.notify_all()
 
-        tasks = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        for _ in range(self._alpha):
+            spawn()
         try:
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # Workers may spawn more workers; wait until every one has finished.
+            while not all(task.done() for task in tasks):
+                await asyncio.wait([task for task in tasks if not task.done()])
         finally:
             found = True
             for task in tasks:
@@ -280,87 +471,168 @@ class DhtNetwork:
 
         return result_value
 
+    async def find_many(
+        self,
+        keys: t.Iterable[DhtKey],
+        concurrency: int = 32,
+    ) -> list[DhtValue | None]:
+        """Find many values concurrently.
+
+        Lookups share the routing table, so nodes discovered by one walk
+        shorten the others, and go through the cache like ``find_value``.
+
+        :param keys: DHT keys to look up.
+        :param concurrency: Maximum number of lookups in flight.
+        :return: Found values (or ``None``) in key order.
+        """
+        if not self.connected:
+            raise NotConnectedError(component="DhtNetwork", operation="find_many")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def find_one(key: DhtKey) -> DhtValue | None:
+            async with semaphore:
+                return await self.find_value(key)
+
+        return list(await asyncio.gather(*(find_one(key) for key in keys)))
+
     async def store(
         self,
         value: dict[str, t.Any],
         target: bytes,
+        replicas: int | None = None,
     ) -> int:
-        """Store a value on K closest nodes.
+        """Store a value on the K closest nodes.
 
-        Go parity: ``checked`` set, rebuild plist each iteration,
-        expansion via affinity comparison.
+        :param value: TL ``dht.value`` to store.
+        :param target: 32-byte DHT key ID.
+        :param replicas: Number of accepted stores to stop at, or ``None`` for ``k``.
+        :return: Number of nodes that accepted the value.
+        """
+        report = await self.store_with_report(value, target, replicas)
+        return report.stored
+
+    async def store_with_report(
+        self,
+        value: dict[str, t.Any],
+        target: bytes,
+        replicas: int | None = None,
+    ) -> StoreReport:
+        """Store a value on the K closest nodes and report per-node timings.
+
+        The closest nodes are walked with ``alpha`` concurrent
+        ``dht.findNodes`` queries. A node that answers while it is among
+        the closest known nodes is sent ``dht.store`` right away instead
+        of after the walk settles; nodes that fail make room for the next
+        closest one. The walk stops once ``replicas`` nodes accepted the
+        value or no closer nodes are left.
+
+        :param value: TL ``dht.value`` to store.
+        :param target: 32-byte DHT key ID.
+        :param replicas: Number of accepted stores to stop at, or ``None`` for ``k``.
+        :return: ``StoreReport`` with one ``StoreResult`` per store attempt.
+        :raises ValueError: If ``replicas`` is below 1.
         """
         if not self.connected:
             raise NotConnectedError(component="DhtNetwork", operation="store")
-
         k = self._provider.k
-        checked: set[str] = set()
-        final = PriorityList(max_len=k, target_id=target)
-
-        while True:
-            plist = self._build_priority_list(target)
+        replicas = k if replicas is None else replicas
+        if replicas < 1:
+            raise ValueError(f"replicas must be at least 1, got {replicas}")
+
+        self._cache.invalidate(target)
+        started = time.monotonic()
+        width = max(k, replicas)
+        report = StoreReport()
+        # Live candidates by ID: failed nodes are dropped so closer-ranked ones move up.
+        candidates: dict[str, tuple[int, DhtNode]] = {}
+        failed: set[str] = set()
+        queried: set[str] = set()
+        answered: dict[str, DhtNode] = {}
+        queries: dict[asyncio.Task[t.Any], DhtNode] = {}
+        stores: set[asyncio.Task[t.Any]] = set()
+        stored = 0
+
+        def consider(node: DhtNode) -> None:
+            if node.id not in candidates and node.id not in failed:
+                candidates[node.id] = (affinity(node.adnl_id, target), node)
+
+        def drop(node: DhtNode) -> None:
+            failed.add(node.id)
+            candidates.pop(node.id, None)
+
+        def cutoff() -> int:
+            """Return the affinity of the ``width``-th closest candidate, or -1 while fewer are known."""
+            if len(candidates) < width:
+                return -1
+            return heapq.nlargest(width, (aff for aff, _ in candidates.values()))[-1]
+
+        async def query(node: DhtNode) -> list[dict[str, t.Any]] | None:
+            try:
+                return await self._provider.find_nodes(node, target, k)
+            except Exception:
+                return None
+
+        async def store_on(node: DhtNode) -> StoreResult:
+            sent = time.monotonic()
+            try:
+                ok = await self._provider.store_value_on_node(node, value) is True
+            except Exception:
+                ok = False
+            return StoreResult(node=node, ok=ok, elapsed=time.monotonic() - sent)
+
+        good, bad = self._routing.closest(target, k + k // 2, k // 2)
+        for node in (*good, *bad):
+            consider(node)
 
-            nodes_to_query: list[DhtNode] = []
-            while True:
-                node, _ = plist.get()
-                if node is None:
+        try:
+            while stored < replicas:
+                threshold = cutoff()
+                ranked = sorted(candidates.values(), key=lambda item: item[0], reverse=True)
+                for aff, node in ranked:
+                    if aff < threshold or stored + len(stores) >= replicas:
+                        break
+                    if answered.pop(node.id, None) is not None:
+                        stores.add(asyncio.create_task(store_on(node)))
+                for aff, node in ranked:
+                    if aff < threshold or len(queries) >= self._alpha:
+                        break
+                    if node.id not in queried:
+                        queried.add(node.id)
+                        queries[asyncio.create_task(query(node))] = node
+
+                if not queries and not stores:
                     break
-                if node.id in checked:
-                    continue
-                checked.add(node.id)
-                nodes_to_query.append(node)
-
-            if not nodes_to_query:
-                break
-
-            async def _query_one(
-                n: DhtNode,
-            ) -> tuple[DhtNode, list[dict[str, t.Any]] | None]:
-                try:
-                    r = await self._provider.find_nodes(n, target, k)
-                    return n, r
-                except Exception:
-                    return n, None
-
-            results = await asyncio.gather(
-                *[_query_one(n) for n in nodes_to_query],
-                return_exceptions=True,
-            )
-
-            expansion = False
-            for result in results:
-                if isinstance(result, BaseException) or not isinstance(result, tuple):
-                    continue
-                queried_node, nodes_list = result
-                if nodes_list is not None:
-                    final.add(queried_node)
-                    for nd in nodes_list:
-                        dht_node = self._add_node(nd)
-                        if dht_node is not None:
-                            best = final.get_best_affinity()
-                            if affinity(dht_node.adnl_id, target) >= best:
-                                expansion = True
-
-            if not expansion:
-                break
-
-        store_tasks: list[t.Coroutine[t.Any, t.Any, bool]] = []
-        seen: set[str] = set()
-
-        while True:
-            node, _ = final.get()
-            if node is None:
-                break
-            if node.id in seen:
-                continue
-            seen.add(node.id)
-            store_tasks.append(self._provider.store_value_on_node(node, value))
-
-        if not store_tasks:
-            return 0
+                done, _ = await asyncio.wait([*queries, *stores], return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task in queries:
+                        node = queries.pop(task)
+                        nodes_list: list[dict[str, t.Any]] | None = task.result()
+                        if nodes_list is None:
+                            drop(node)
+                            continue
+                        answered[node.id] = node
+                        for nd in nodes_list:
+                            dht_node = self._add_node(nd)
+                            if dht_node is not None:
+                                consider(dht_node)
+                    else:
+                        stores.discard(task)
+                        result: StoreResult = task.result()
+                        report.results.append(result)
+                        if result.ok:
+                            stored += 1
+                        else:
+                            drop(result.node)
+        finally:
+            pending = [*queries, *stores]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        store_results = await asyncio.gather(*store_tasks, return_exceptions=True)
-        return sum(1 for r in store_results if r is True)
+        report.queried = len(queried)
+        report.elapsed = time.monotonic() - started
+        return report
 
     async def find_addresses(
         self,
@@ -391,22 +663,32 @@ class DhtNetwork:
         address_list: dict[str, t.Any],
         ttl: int,
         owner_key: bytes,
+        replicas: int | None = None,
     ) -> int:
-        """Store ADNL address in the DHT."""
+        """Store ADNL address in the DHT.
+
+        :param replicas: Number of accepted stores to stop at, or ``None`` for ``k``.
+        :return: Number of nodes that accepted the value.
+        """
         if not self.connected:
             raise NotConnectedError(component="DhtNetwork", operation="store_address")
         value_tl, target = self._provider.codec.build_store_address(address_list, ttl, owner_key)
-        return await self.store(value_tl, target)
+        return await self.store(value_tl, target, replicas)
 
     async def store_overlay_nodes(
         self,
         overlay_key: KeyLike,
         nodes_list: dict[str, t.Any],
         ttl: int,
+        replicas: int | None = None,
     ) -> int:
-        """Store overlay nodes list in the DHT."""
+        """Store overlay nodes list in the DHT.
+
+        :param replicas: Number of accepted stores to stop at, or ``None`` for ``k``.
+        :return: Number of nodes that accepted the value.
+        """
         if not self.connected:
             raise NotConnectedError(component="DhtNetwork", operation="store_overlay_nodes")
         raw_key = normalize_key(overlay_key)
         value_tl, target = self._provider.codec.build_store_overlay(raw_key, nodes_list, ttl)
-        return await self.store(value_tl, target)
+        return await self.store(value_tl, target, replicas)
@@ -14,6 +14,7 @@ from ton_core import (
     norm_stack_cell,
     norm_stack_num,
     parse_stack_config,
+    to_cell,
 )
 
 from tonutils.clients.base import BaseClient
@@ -150,9 +151,9 @@ class TonapiClient(BaseClient):
             last_transaction_hash=result.last_transaction_hash,
         )
         if result.code is not None:
-            contract_info.code_raw = cell_to_hex(result.code)
+            contract_info.code = to_cell(result.code)
         if result.data is not None:
-            contract_info.data_raw = cell_to_hex(result.data)
+            contract_info.data = to_cell(result.data)
 
         return contract_info
 
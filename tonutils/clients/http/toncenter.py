@@ -12,10 +12,10 @@ from ton_core import (
     Slice,
     Transaction,
     cell_to_b64,
-    cell_to_hex,
     norm_stack_cell,
     norm_stack_num,
     parse_stack_config,
+    to_cell,
 )
 
 from tonutils.clients.base import BaseClient
@@ -154,10 +154,10 @@ class ToncenterClient(BaseClient):
             state=ContractState(request.result.state),
         )
         if request.result.code:
-            contract_info.code_raw = cell_to_hex(request.result.code)
+            contract_info.code = to_cell(request.result.code)
 
         if request.result.data:
-            contract_info.data_raw = cell_to_hex(request.result.data)
+            contract_info.data = to_cell(request.result.data)
 
         last_transaction_lt = last_transaction_hash = None
 
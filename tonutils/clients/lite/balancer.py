@@ -3,13 +3,16 @@ from __future__ import annotations
 import asyncio
 import time
 import typing as t
+from collections import deque
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import cycle
 
 from ton_core import (
+    BlockIdExt,
     GlobalConfig,
     NetworkGlobalID,
+    WorkchainID,
     get_mainnet_global_config,
     get_testnet_global_config,
 )
@@ -26,12 +29,15 @@ from tonutils.exceptions import (
     ProviderError,
     ProviderResponseError,
     ProviderTimeoutError,
+    RetryLimitError,
     RunGetMethodError,
     TransportError,
 )
 from tonutils.transports.limiter import RateLimiter
 from tonutils.types import (
+    LITESERVER_BLOCK_NOT_IN_DB_CODE,
     LITESERVER_RATE_LIMIT_CODES,
+    BroadcastResult,
     ClientType,
     RetryPolicy,
 )
@@ -41,6 +47,12 @@ if t.TYPE_CHECKING:
 
 _T = t.TypeVar("_T")
 
+HistoryKey = tuple[str, int]
+"""History dimension: ``("utime", 0)``, ``("lt", 0)`` or ``("seqno", workchain)``."""
+
+HistoryPoint = tuple[HistoryKey, int]
+"""Point in chain history addressed by a query."""
+
 
 @dataclass
 class LiteClientState:
@@ -55,6 +67,92 @@ class LiteClientState:
     error_count: int = 0
     """Consecutive error count."""
 
+    hot: bool = True
+    """``True`` if the client is kept connected, ``False`` if on standby."""
+
+    connect_rtt: float | None = None
+    """Duration of the last successful connect in seconds, or ``None``."""
+
+    probing: bool = False
+    """``True`` while a standby client is briefly connected for an RTT probe."""
+
+    archive_from: int | None = None
+    """Earliest block UNIX time the client is known to serve (probed), or ``None``."""
+
+    served: dict[HistoryKey, int] = field(default_factory=dict)
+    """Oldest historical point successfully served, per dimension."""
+
+    missing: dict[HistoryKey, tuple[int, float]] = field(default_factory=dict)
+    """Newest point answered with 'block is not in db' and monotonic expiry time."""
+
+    def can_serve(self, point: HistoryPoint, now: float) -> bool | None:
+        """Check whether the client is known to serve a historical point.
+
+        :param point: History dimension and value.
+        :param now: Current monotonic time.
+        :return: ``True`` if capable, ``False`` if not, ``None`` if unknown.
+        """
+        key, value = point
+
+        missing = self.missing.get(key)
+        if missing is not None:
+            missing_value, expires_at = missing
+            if expires_at <= now:
+                del self.missing[key]
+            elif value <= missing_value:
+                return False
+
+        served = self.served.get(key)
+        if served is not None and served <= value:
+            return True
+
+        if key[0] == "utime" and self.archive_from is not None:
+            if value >= self.archive_from:
+                return True
+            if value < self.archive_from - 86400:
+                return False
+
+        return None
+
+
+@dataclass
+class HistoryFrontier:
+    """Newest points of one history dimension served through the balancer."""
+
+    settled: int | None = None
+    """Newest point first served at least one recent window ago, or ``None``."""
+
+    recent: deque[tuple[float, int]] = field(default_factory=deque)
+    """Newer points with the monotonic time they were first served, ascending."""
+
+    def observe(self, value: int, now: float) -> None:
+        """Record a served point.
+
+        Points first seen within a second of the newest tracked one are
+        skipped, keeping the deque bounded by the window length.
+
+        :param value: Served point value.
+        :param now: Current monotonic time.
+        """
+        if self.settled is not None and value <= self.settled:
+            return
+        if self.recent:
+            seen_at, newest = self.recent[-1]
+            if value <= newest or now - seen_at < 1.0:
+                return
+        self.recent.append((now, value))
+
+    def settle(self, now: float, window: float) -> int | None:
+        """Promote points older than ``window`` and return the settled point.
+
+        :param now: Current monotonic time.
+        :param window: Age in seconds after which a point is no longer fresh.
+        :return: Newest settled point, or ``None`` if none yet.
+        """
+        while self.recent and now - self.recent[0][0] >= window:
+            self.settled = self.recent.popleft()[1]
+        return self.settled
+
 
 class LiteBalancer(LiteMixin, BaseClient):
     """Multi-client lite-server balancer with automatic failover.
@@ -72,14 +170,24 @@ class LiteBalancer(LiteMixin, BaseClient):
         clients: list[LiteClient],
         connect_timeout: float = 2.0,
         request_timeout: float = 12.0,
+        hot_limit: int | None = None,
     ) -> None:
         """Initialize the balancer.
 
+        With ``hot_limit`` only that many fastest lite-servers stay
+        connected (each running ping and masterchain update workers);
+        the rest are kept on standby without a connection and are
+        promoted when hot servers disconnect, cool down, or fail.
+
         :param network: Target TON network.
         :param clients: ``LiteClient`` instances to balance between.
         :param connect_timeout: Timeout in seconds for connect/reconnect attempts.
         :param request_timeout: Total timeout in seconds including all failover attempts.
+        :param hot_limit: Number of lite-servers kept connected, or ``None`` for all.
         """
+        if hot_limit is not None and hot_limit < 1:
+            raise ClientError(f"hot_limit must be >= 1, got {hot_limit}.")
+
         self.network: NetworkGlobalID = network
 
         self._clients: list[LiteClient] = []
@@ -97,6 +205,17 @@ class LiteBalancer(LiteMixin, BaseClient):
         self._retry_after_base = 1.0
         self._retry_after_max = 10.0
 
+        self._archive_ttl = 600.0
+        self._archive_recent_window = 60
+        self._frontiers: dict[HistoryKey, HistoryFrontier] = {}
+
+        self._hot_limit = hot_limit
+        self._promote_lock = asyncio.Lock()
+        self._standby_probe_interval = 300.0
+        self._standby_probed_at = 0.0
+
+        self._broadcast_tasks: set[asyncio.Task[None]] = set()
+
     @property
     def provider(self) -> LiteProvider:
         """Provider of the currently best lite-server client."""
@@ -106,7 +225,7 @@ class LiteBalancer(LiteMixin, BaseClient):
     @property
     def connected(self) -> bool:
         """``True`` if at least one lite-server client is connected."""
-        return any(c.connected for c in self._clients)
+        return any(state.client.connected and not state.probing for state in self._states)
 
     @property
     def clients(self) -> tuple[LiteClient, ...]:
@@ -115,24 +234,29 @@ class LiteBalancer(LiteMixin, BaseClient):
 
     @property
     def alive_clients(self) -> tuple[LiteClient, ...]:
-        """Connected clients not in cooldown."""
+        """Connected clients not in cooldown or being probed."""
         now = time.monotonic()
         return tuple(
             state.client
             for state in self._states
-            if state.client.connected and (state.retry_after is None or state.retry_after <= now)
+            if state.client.connected and not state.probing and (state.retry_after is None or state.retry_after <= now)
         )
 
     @property
     def dead_clients(self) -> tuple[LiteClient, ...]:
-        """Disconnected or cooldown clients."""
+        """Disconnected or cooldown clients, excluding standby ones."""
         now = time.monotonic()
         return tuple(
             state.client
             for state in self._states
-            if not state.client.connected or (state.retry_after is not None and state.retry_after > now)
+            if state.hot and (not state.client.connected or (state.retry_after is not None and state.retry_after > now))
         )
 
+    @property
+    def standby_clients(self) -> tuple[LiteClient, ...]:
+        """Clients kept on standby without a connection (see ``hot_limit``)."""
+        return tuple(state.client for state in self._states if not state.hot)
+
     @classmethod
     def from_config(
         cls,
@@ -147,6 +271,7 @@ class LiteBalancer(LiteMixin, BaseClient):
         rps_period: float = 1.0,
         rps_per_client: bool = False,
         retry_policy: RetryPolicy | None = None,
+        hot_limit: int | None = None,
     ) -> LiteBalancer:
         """Create a ``LiteBalancer`` from a configuration.
 
@@ -166,6 +291,7 @@ class LiteBalancer(LiteMixin, BaseClient):
         :param rps_period: Time window in seconds for RPS limit.
         :param rps_per_client: Create per-client limiters instead of shared.
         :param retry_policy: Retry policy with per-error-code rules, or ``None``.
+        :param hot_limit: Number of lite-servers kept connected, or ``None`` for all.
         :return: Configured ``LiteBalancer`` instance.
         """
         config = resolve_config(config)
@@ -199,6 +325,7 @@ class LiteBalancer(LiteMixin, BaseClient):
             clients=clients,
             connect_timeout=connect_timeout,
             request_timeout=request_timeout,
+            hot_limit=hot_limit,
         )
 
     @classmethod
@@ -214,6 +341,7 @@ class LiteBalancer(LiteMixin, BaseClient):
         rps_period: float = 1.0,
         rps_per_client: bool = False,
         retry_policy: RetryPolicy | None = None,
+        hot_limit: int | None = None,
     ) -> LiteBalancer:
         """Create a ``LiteBalancer`` using global config from ton.org.
 
@@ -233,6 +361,7 @@ class LiteBalancer(LiteMixin, BaseClient):
         :param rps_period: Time window in seconds for RPS limit.
         :param rps_per_client: Create per-client limiters instead of shared.
         :param retry_policy: Retry policy with per-error-code rules, or ``None``.
+        :param hot_limit: Number of lite-servers kept connected, or ``None`` for all.
         :return: Configured ``LiteBalancer`` instance.
         """
         config_getters = {
@@ -254,25 +383,25 @@ class LiteBalancer(LiteMixin, BaseClient):
             rps_period=rps_period,
             rps_per_client=rps_per_client,
             retry_policy=retry_policy,
+            hot_limit=hot_limit,
         )
 
     async def connect(self) -> None:
-        """Connect all clients and start the health check task."""
+        """Connect all clients and start the health check task.
+
+        With ``hot_limit``, clients beyond the fastest ``hot_limit`` ones
+        are disconnected right after the handshake and put on standby.
+        """
         if self.connected:
             self._ensure_health_task()
             return
 
-        async def _con(client: LiteClient) -> None:
-            with suppress(Exception):
-                await asyncio.wait_for(
-                    client.connect(),
-                    timeout=self._connect_timeout,
-                )
-
-        tasks = [_con(client) for client in self._clients]
+        tasks = [self._connect_state(state) for state in self._states]
         await asyncio.gather(*tasks, return_exceptions=True)
 
         if any(c.connected for c in self._clients):
+            if self._hot_limit is not None:
+                await self._apply_hot_limit()
             self._ensure_health_task()
             return
 
@@ -282,7 +411,7 @@ class LiteBalancer(LiteMixin, BaseClient):
         )
 
     async def close(self) -> None:
-        """Stop the health check task and close all clients."""
+        """Stop the health check task, cancel pending broadcast sends and close all clients."""
         task, self._health_task = self._health_task, None
 
         if task is not None and not task.done():
@@ -290,9 +419,123 @@ class LiteBalancer(LiteMixin, BaseClient):
             with suppress(asyncio.CancelledError):
                 await task
 
+        broadcasts = list(self._broadcast_tasks)
+        for broadcast in broadcasts:
+            broadcast.cancel()
+        await asyncio.gather(*broadcasts, return_exceptions=True)
+
         tasks = [client.close() for client in self._clients]
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def _connect_state(self, state: LiteClientState) -> bool:
+        """Connect a client and record its handshake duration.
+
+        :param state: Client state to connect.
+        :return: ``True`` if connected.
+        """
+        start = time.monotonic()
+        with suppress(Exception):
+            await asyncio.wait_for(
+                state.client.connect(),
+                timeout=self._connect_timeout,
+            )
+        if state.client.connected:
+            state.connect_rtt = time.monotonic() - start
+            return True
+        return False
+
+    @staticmethod
+    def _rtt_rank(state: LiteClientState) -> tuple[bool, float]:
+        """Sort key preferring clients with the lowest known RTT."""
+        rtt = state.client.provider.last_ping_rtt if state.client.connected else None
+        if rtt is None:
+            rtt = state.connect_rtt
+        return rtt is None, rtt or 0.0
+
+    async def _demote(self, state: LiteClientState) -> None:
+        """Move a client to standby and close its connection."""
+        state.hot = False
+        state.error_count = 0
+        state.retry_after = None
+        with suppress(Exception):
+            await state.client.close()
+
+    async def _promote(self, count: int = 1) -> int:
+        """Connect standby clients in RTT order and mark them hot.
+
+        :param count: Number of clients to promote.
+        :return: Number of clients promoted.
+        """
+        promoted = 0
+        async with self._promote_lock:
+            for state in sorted(self._states, key=self._rtt_rank):
+                if promoted >= count:
+                    break
+                if state.hot:
+                    continue
+                if await self._connect_state(state):
+                    state.hot = True
+                    promoted += 1
+        return promoted
+
+    async def _apply_hot_limit(self) -> None:
+        """Keep the fastest ``hot_limit`` connected clients, demote the rest."""
+        assert self._hot_limit is not None
+        hot = sorted(
+            (state for state in self._states if state.hot and state.client.connected),
+            key=self._rtt_rank,
+        )
+        for state in self._states:
+            if state.hot and not state.client.connected:
+                state.hot = False
+
+        tasks = [self._demote(state) for state in hot[self._hot_limit :]]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _rebalance_tiers(self) -> None:
+        """Replace failed hot clients with standby ones and trim extras.
+
+        Disconnected hot clients are demoted, standby clients are promoted
+        while fewer than ``hot_limit`` clients are alive, and surplus
+        clients are demoted once cooled-down ones recover.
+        """
+        assert self._hot_limit is not None
+        for state in self._states:
+            if state.hot and not state.client.connected:
+                state.hot = False
+
+        deficit = self._hot_limit - len(self.alive_clients)
+        if deficit > 0:
+            await self._promote(deficit)
+
+        alive = set(self.alive_clients)
+        hot = sorted(
+            (state for state in self._states if state.hot and state.client in alive),
+            key=self._rtt_rank,
+        )
+        tasks = [self._demote(state) for state in hot[self._hot_limit :]]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _probe_standby(self) -> None:
+        """Refresh handshake RTT of standby clients, then disconnect them.
+
+        Probed clients are kept out of ``alive_clients`` so no request
+        is routed to a connection about to be closed.
+        """
+
+        async def _probe(state: LiteClientState) -> None:
+            state.probing = True
+            try:
+                if await self._connect_state(state) and not state.hot:
+                    with suppress(Exception):
+                        await state.client.close()
+            finally:
+                state.probing = False
+
+        async with self._promote_lock:
+            tasks = [_probe(state) for state in self._states if not state.hot]
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def _init_clients(
         self,
         clients: list[LiteClient],
@@ -311,11 +554,86 @@ class LiteBalancer(LiteMixin, BaseClient):
             self._clients.append(client)
             self._states.append(state)
 
-    def _pick_client(self) -> LiteClient:
+    def _get_state(self, client: LiteClient) -> LiteClientState:
+        """Return the balancer state of a registered client."""
+        for state in self._states:
+            if state.client is client:
+                return state
+        raise ClientError(f"{client!r} is not registered in {self.__class__.__name__}.")
+
+    @staticmethod
+    def _history_point(
+        method: str,
+        args: tuple[t.Any, ...],
+        kwargs: dict[str, t.Any],
+    ) -> HistoryPoint | None:
+        """Extract the point in chain history addressed by a provider call.
+
+        :param method: Provider method name.
+        :param args: Positional arguments.
+        :param kwargs: Keyword arguments.
+        :return: History point, or ``None`` for calls at the chain tip.
+        """
+        if method == "lookup_block":
+            if kwargs.get("utime") is not None:
+                return ("utime", 0), int(kwargs["utime"])
+            if kwargs.get("lt") is not None:
+                return ("lt", 0), int(kwargs["lt"])
+            if kwargs.get("seqno") is not None:
+                return ("seqno", int(kwargs["workchain"])), int(kwargs["seqno"])
+            return None
+
+        if method in {"get_block_header", "get_block_transactions", "get_all_shards_info"}:
+            block = args[0] if args else kwargs.get("block")
+            if isinstance(block, BlockIdExt):
+                return ("seqno", block.workchain), block.seqno
+            return None
+
+        if method == "get_transactions" and kwargs.get("from_lt") is not None:
+            return ("lt", 0), int(kwargs["from_lt"])
+
+        return None
+
+    def _filter_capable(
+        self,
+        clients: list[LiteClient],
+        point: HistoryPoint,
+    ) -> list[LiteClient]:
+        """Narrow clients to those able to serve a historical point.
+
+        Leaves the list unchanged while no client is known to lack the
+        point; otherwise prefers known-capable clients, then unknown ones.
+
+        :param clients: Candidate clients.
+        :param point: History point addressed by the query.
+        :return: Filtered candidate clients.
+        """
+        now = time.monotonic()
+        capable: list[LiteClient] = []
+        unknown: list[LiteClient] = []
+        incapable = False
+
+        for client in clients:
+            verdict = self._get_state(client).can_serve(point, now)
+            if verdict is None:
+                unknown.append(client)
+            elif verdict:
+                capable.append(client)
+            else:
+                incapable = True
+
+        if not incapable:
+            return clients
+        return capable or unknown or clients
+
+    def _pick_client(self, point: HistoryPoint | None = None) -> LiteClient:
         """Select the best available lite-server client.
 
         Prefers highest masterchain seqno, then lowest ping RTT,
-        with round-robin fallback.
+        with round-robin fallback. Queries addressing old blocks are
+        routed to clients known to keep that part of history.
+
+        :param point: History point addressed by the query, or ``None``.
         """
         if not self.connected:
             raise NotConnectedError(component=self.__class__.__name__)
@@ -328,6 +646,9 @@ class LiteBalancer(LiteMixin, BaseClient):
                 hint="Servers may be overloaded or unreachable. Wait and retry, or add more servers.",
             )
 
+        if point is not None:
+            alive = self._filter_capable(alive, point)
+
         height_candidates: list[
             tuple[
                 int,
@@ -362,13 +683,85 @@ class LiteBalancer(LiteMixin, BaseClient):
 
         return alive[0]
 
-    def _mark_success(self, client: LiteClient) -> None:
-        """Reset error state for a successful client."""
-        for state in self._states:
-            if state.client is client:
-                state.error_count = 0
-                state.retry_after = None
-                break
+    def _best_clients(self, count: int) -> list[LiteClient]:
+        """Return up to ``count`` best alive clients.
+
+        Ranked like ``_pick_client``: highest masterchain seqno first,
+        then lowest ping RTT and ping age.
+
+        :param count: Maximum number of clients to return.
+        """
+
+        def _rank(client: LiteClient) -> tuple[int, bool, float, float]:
+            mc_block = client.provider.last_mc_block
+            rtt = client.provider.last_ping_rtt
+            age = client.provider.last_ping_age
+            return (
+                -(mc_block.seqno if mc_block is not None else -1),
+                rtt is None or age is None,
+                rtt or 0.0,
+                age or 0.0,
+            )
+
+        return sorted(self.alive_clients, key=_rank)[:count]
+
+    def _mark_success(self, client: LiteClient, point: HistoryPoint | None = None) -> None:
+        """Reset error state for a successful client.
+
+        :param client: Client that answered.
+        :param point: History point served by the client, or ``None``.
+        """
+        state = self._get_state(client)
+        state.error_count = 0
+        state.retry_after = None
+
+        if point is None:
+            return
+
+        key, value = point
+        self._frontiers.setdefault(key, HistoryFrontier()).observe(value, time.monotonic())
+
+        served = state.served.get(key)
+        if served is None or value < served:
+            state.served[key] = value
+
+        missing = state.missing.get(key)
+        if missing is not None and missing[0] >= value:
+            del state.missing[key]
+
+    def _mark_missing(self, client: LiteClient, point: HistoryPoint) -> bool:
+        """Record that a client lacks a historical point.
+
+        Points at or beyond the client's own chain tip are treated as lag,
+        not as missing history. Logical time and shard seqno points carry
+        no tip reference, so they count as gaps only when not newer than
+        a point served through the balancer at least
+        ``_archive_recent_window`` seconds ago.
+
+        :param client: Client that answered 'block is not in db'.
+        :param point: History point addressed by the query.
+        :return: ``True`` if recorded as an archive gap.
+        """
+        key, value = point
+        if key == ("seqno", WorkchainID.MASTERCHAIN.value):
+            mc_block = client.provider.last_mc_block
+            if mc_block is None or value >= mc_block.seqno:
+                return False
+        elif key[0] == "utime":
+            if value >= int(time.time()) - self._archive_recent_window:
+                return False
+        else:
+            frontier = self._frontiers.get(key)
+            settled = frontier.settle(time.monotonic(), self._archive_recent_window) if frontier else None
+            if settled is None or value > settled:
+                return False
+
+        state = self._get_state(client)
+        missing = state.missing.get(key)
+        if missing is not None:
+            value = max(value, missing[0])
+        state.missing[key] = (value, time.monotonic() + self._archive_ttl)
+        return True
 
     def _mark_error(self, client: LiteClient, is_rate_limit: bool) -> None:
         """Update error state and schedule exponential-backoff cooldown.
@@ -377,16 +770,32 @@ class LiteBalancer(LiteMixin, BaseClient):
         :param is_rate_limit: Whether the error was rate-limit related.
         """
         now = time.monotonic()
-        for state in self._states:
-            if state.client is client:
-                state.error_count += 1
-                base = self._retry_after_base if is_rate_limit else self._retry_after_base / 2
-                cooldown = min(
-                    base * (2 ** (state.error_count - 1)),
-                    self._retry_after_max,
-                )
-                state.retry_after = now + cooldown
-                break
+        state = self._get_state(client)
+        state.error_count += 1
+        base = self._retry_after_base if is_rate_limit else self._retry_after_base / 2
+        cooldown = min(
+            base * (2 ** (state.error_count - 1)),
+            self._retry_after_max,
+        )
+        state.retry_after = now + cooldown
+
+    async def probe_archive_depth(self) -> dict[LiteClient, int]:
+        """Probe how far back each connected client keeps blocks.
+
+        Results are used to route queries for old blocks directly to
+        archive lite-servers. Clients that fail to answer are skipped.
+
+        :return: Mapping of client to earliest served block UNIX time.
+        """
+
+        async def _probe(state: LiteClientState) -> None:
+            with suppress(Exception):
+                state.archive_from = await state.client.find_archive_depth(cached=state.archive_from)
+
+        tasks = [_probe(state) for state in self._states if state.client.connected]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        return {state.client: state.archive_from for state in self._states if state.archive_from is not None}
 
     def _ensure_health_task(self) -> None:
         """Start the background health check task if not already running."""
@@ -414,16 +823,27 @@ class LiteBalancer(LiteMixin, BaseClient):
                 await asyncio.sleep(self._health_interval)
                 tasks = [_recon(client) for client in self.dead_clients if not client.connected]
                 await asyncio.gather(*tasks, return_exceptions=True)
+
+                if self._hot_limit is None:
+                    continue
+
+                await self._rebalance_tiers()
+                now = time.monotonic()
+                if now - self._standby_probed_at >= self._standby_probe_interval:
+                    self._standby_probed_at = now
+                    await self._probe_standby()
         except asyncio.CancelledError:
             return
 
     async def _with_failover(
         self,
         func: t.Callable[[LiteProvider], t.Awaitable[_T]],
+        point: HistoryPoint | None = None,
     ) -> _T:
         """Execute a provider operation with automatic failover.
 
         :param func: Async callable accepting a ``LiteProvider``.
+        :param point: History point addressed by the operation, or ``None``.
         :return: Result of the first successful invocation.
         :raises BalancerError: If all lite-servers fail.
         """
@@ -433,10 +853,10 @@ class LiteBalancer(LiteMixin, BaseClient):
             attempts = 0
 
             for _ in range(len(self._clients)):
-                if not self.alive_clients:
+                if not self.alive_clients and not await self._promote():
                     break
 
-                client = self._pick_client()
+                client = self._pick_client(point)
                 attempts += 1
 
                 if not client.provider.connected:
@@ -449,16 +869,20 @@ class LiteBalancer(LiteMixin, BaseClient):
                 except RunGetMethodError:
                     raise
                 except ProviderResponseError as e:
+                    last_exc = e
+                    if point is not None and self._is_not_in_db(e) and self._mark_missing(client, point):
+                        continue
                     is_rate_limit = e.code in LITESERVER_RATE_LIMIT_CODES
                     self._mark_error(client, is_rate_limit=is_rate_limit)
-                    last_exc = e
                     continue
                 except (TransportError, ProviderError) as e:
-                    self._mark_error(client, is_rate_limit=False)
                     last_exc = e
+                    if point is not None and self._is_not_in_db(e) and self._mark_missing(client, point):
+                        continue
+                    self._mark_error(client, is_rate_limit=False)
                     continue
 
-                self._mark_success(client)
+                self._mark_success(client, point)
                 return result
 
             if last_exc is not None:
@@ -480,6 +904,124 @@ class LiteBalancer(LiteMixin, BaseClient):
                 operation="failover request",
             ) from exc
 
+    async def send_message(
+        self,
+        boc: str,
+        *,
+        broadcast: int | None = None,
+        http_clients: t.Sequence[BaseClient] = (),
+    ) -> None:
+        """Send an external message to the blockchain.
+
+        With ``broadcast``, the remaining sends keep running in the
+        background, held by the balancer until done. No per-server
+        latencies are reported here; call ``broadcast_message()`` for
+        the ``BroadcastResult``.
+
+        :param boc: Serialized BoC string.
+        :param broadcast: Send to this many best lite-servers in parallel
+            (see ``broadcast_message()``), or ``None`` for a single server
+            with failover.
+        :param http_clients: Extra HTTP clients to broadcast to.
+        """
+        if broadcast is None and not http_clients:
+            await self._send_message(boc)
+            return
+        await self.broadcast_message(boc, broadcast or 1, http_clients=http_clients)
+
+    async def broadcast_message(
+        self,
+        boc: str,
+        count: int = 3,
+        *,
+        http_clients: t.Sequence[BaseClient] = (),
+    ) -> BroadcastResult:
+        """Send the same external message to several servers in parallel.
+
+        Returns on the first acceptance; the remaining sends continue in
+        the background and report into the result.
+
+        :param boc: Hex-encoded BoC string.
+        :param count: Number of best alive lite-servers to send to.
+        :param http_clients: Extra HTTP clients to send to.
+        :return: ``BroadcastResult`` with per-client acceptance latency.
+        :raises BalancerError: If every target rejects the message.
+        """
+        if count < 1:
+            raise ClientError(f"broadcast count must be >= 1, got {count}.")
+        if not self.connected and (self._health_task is None or not await self._promote()):
+            raise NotConnectedError(
+                component=self.__class__.__name__,
+                operation="broadcast_message",
+            )
+
+        lite_clients = self._best_clients(count)
+        targets: list[BaseClient] = [*lite_clients, *http_clients]
+        if not targets:
+            raise BalancerError(
+                "no alive lite-servers available",
+                hint="Servers may be overloaded or unreachable. Wait and retry, or add more servers.",
+            )
+
+        body = bytes.fromhex(boc)
+        result = BroadcastResult()
+        loop = asyncio.get_running_loop()
+        accepted: asyncio.Future[BaseClient] = loop.create_future()
+
+        async def _send(client: BaseClient, lite: LiteClient | None) -> None:
+            start = time.monotonic()
+            try:
+                if lite is not None:
+                    await lite.provider.send_message(body, priority=True)
+                else:
+                    await client.send_message(boc)
+            except Exception as e:
+                result.errors[client] = e
+                if lite is not None:
+                    is_rate_limit = isinstance(e, ProviderResponseError) and e.code in LITESERVER_RATE_LIMIT_CODES
+                    self._mark_error(lite, is_rate_limit=is_rate_limit)
+                if len(result.errors) == len(targets) and not accepted.done():
+                    accepted.set_exception(
+                        BalancerError(
+                            f"broadcast rejected by all {len(targets)} server(s): {e}",
+                            hint="Check the message (seqno, signature, balance) or server availability.",
+                        )
+                    )
+                return
+
+            result.latencies[client] = time.monotonic() - start
+            if lite is not None:
+                self._mark_success(lite)
+            if not accepted.done():
+                accepted.set_result(client)
+
+        result.tasks.update(loop.create_task(_send(client, client)) for client in lite_clients)
+        result.tasks.update(loop.create_task(_send(client, None)) for client in http_clients)
+        for task in result.tasks:
+            self._broadcast_tasks.add(task)
+            task.add_done_callback(self._broadcast_tasks.discard)
+
+        try:
+            result.accepted_by = await asyncio.wait_for(
+                asyncio.shield(accepted),
+                timeout=self._request_timeout,
+            )
+        except asyncio.TimeoutError as exc:
+            accepted.cancel()
+            raise ProviderTimeoutError(
+                timeout=self._request_timeout,
+                endpoint=self.__class__.__name__,
+                operation="broadcast",
+            ) from exc
+        return result
+
+    @staticmethod
+    def _is_not_in_db(exc: BaseException) -> bool:
+        """Check whether an error is a lite-server 'block is not in db' response."""
+        if isinstance(exc, RetryLimitError):
+            exc = exc.last_error
+        return isinstance(exc, ProviderResponseError) and exc.code == LITESERVER_BLOCK_NOT_IN_DB_CODE
+
     async def _adnl_call(self, method: str, /, *args: t.Any, **kwargs: t.Any) -> t.Any:
         """Execute a provider call with failover across lite-servers.
 
@@ -488,7 +1030,7 @@ class LiteBalancer(LiteMixin, BaseClient):
         :param kwargs: Keyword arguments.
         :return: Provider method result.
         """
-        if not self.connected:
+        if not self.connected and (self._health_task is None or not await self._promote()):
             raise NotConnectedError(
                 component=self.__class__.__name__,
                 operation=method,
@@ -498,4 +1040,5 @@ class LiteBalancer(LiteMixin, BaseClient):
             fn = getattr(provider, method)
             return await fn(*args, **kwargs)
 
-        return await self._with_failover(_call)
+        point = self._history_point(method, args, kwargs)
+        return await self._with_failover(_call, point)
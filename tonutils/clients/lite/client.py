@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import time
 import typing as t
 
 from ton_core import (
+    MAINNET_GENESIS_UTIME,
+    MASTERCHAIN_SHARD,
     BinaryLike,
     GlobalConfig,
     LiteServerConfig,
     NetworkGlobalID,
+    WorkchainID,
     get_mainnet_global_config,
     get_testnet_global_config,
 )
@@ -209,6 +213,57 @@ class LiteClient(LiteMixin, BaseClient):
         """Close the lite-server connection."""
         await self.provider.close()
 
+    async def find_archive_depth(
+        self,
+        now: int | None = None,
+        cached: int | None = None,
+    ) -> int:
+        """Find the earliest archived block timestamp via binary search.
+
+        Probes masterchain ``lookup_block`` by UNIX time with one-day
+        granularity to find how far back the lite-server keeps blocks.
+
+        :param now: Current UNIX timestamp, or ``None`` for wall-clock time.
+        :param cached: Previously found timestamp, or ``None``.
+        :return: Earliest archive UNIX timestamp.
+        """
+        if now is None:
+            now = int(time.time())
+
+        seconds_per_day = 86400
+        seconds_diff = now - MAINNET_GENESIS_UTIME
+        right = seconds_diff // seconds_per_day
+
+        if cached is not None:
+            cached_days = (now - cached) // seconds_per_day
+            left = cached_days
+            best_days = cached_days
+        else:
+            left = 0
+            best_days = 0
+
+        async def probe(days: int) -> bool:
+            utime = now - days * seconds_per_day
+            try:
+                _, block = await self.provider.lookup_block(
+                    workchain=WorkchainID.MASTERCHAIN,
+                    shard=MASTERCHAIN_SHARD,
+                    utime=utime,
+                )
+                return abs(block.info.gen_utime - utime) <= seconds_per_day
+            except Exception:
+                return False
+
+        while left <= right:
+            mid = (left + right) // 2
+            if await probe(mid):
+                best_days = mid
+                left = mid + 1
+            else:
+                right = mid - 1
+
+        return now - best_days * seconds_per_day
+
     async def _adnl_call(self, method: str, /, *args: t.Any, **kwargs: t.Any) -> t.Any:
         """Execute a provider call, raising if not connected.
 
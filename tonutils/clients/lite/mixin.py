@@ -90,24 +90,29 @@ class LiteMixin:
         method = "send_message"
         await self._adnl_call(method, bytes.fromhex(boc))
 
-    async def _get_config(self) -> dict[int, t.Any]:
+    async def _get_config(self, min_seqno: int | None = None) -> dict[int, t.Any]:
         """Fetch raw blockchain configuration via the lite-server.
 
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: Mapping of config parameter IDs to values.
         """
         method = "get_config"
-        return t.cast("dict[int, t.Any]", await self._adnl_call(method))
+        return t.cast(
+            "dict[int, t.Any]",
+            await self._adnl_call(method, min_seqno=min_seqno),
+        )
 
-    async def _get_info(self, address: str) -> ContractInfo:
+    async def _get_info(self, address: str, min_seqno: int | None = None) -> ContractInfo:
         """Fetch contract state via the lite-server.
 
         :param address: Raw (non-user-friendly) address string.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: ``ContractInfo`` snapshot.
         """
         method = "get_info"
         return t.cast(
             "ContractInfo",
-            await self._adnl_call(method, Address(address)),
+            await self._adnl_call(method, Address(address), min_seqno=min_seqno),
         )
 
     async def _run_get_method(
@@ -115,12 +120,14 @@ class LiteMixin:
         address: str,
         method_name: str,
         stack: list[t.Any] | None = None,
+        min_seqno: int | None = None,
     ) -> list[t.Any]:
         """Execute a contract get-method via the lite-server.
 
         :param address: Raw (non-user-friendly) address string.
         :param method_name: Name of the get-method.
         :param stack: TVM stack arguments, or ``None``.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: Decoded TVM stack result.
         """
         method = "run_get_method"
@@ -129,6 +136,7 @@ class LiteMixin:
             address=Address(address),
             method_name=method_name,
             stack=self._encode_stack(stack or []),
+            min_seqno=min_seqno,
         )
         return self._decode_stack(res or [])
 
@@ -138,6 +146,7 @@ class LiteMixin:
         limit: int = 100,
         from_lt: int | None = None,
         to_lt: int | None = None,
+        min_seqno: int | None = None,
     ) -> list[Transaction]:
         """Fetch transaction history via the lite-server with pagination.
 
@@ -145,12 +154,13 @@ class LiteMixin:
         :param limit: Maximum number of transactions to return.
         :param from_lt: Upper-bound logical time (inclusive), or ``None``.
         :param to_lt: Lower-bound logical time (exclusive), or ``None``.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: List of ``Transaction`` objects.
         """
         method = "get_transactions"
 
         to_lt_i = 0 if to_lt is None else to_lt
-        state = await self._get_info(address)
+        state = await self._get_info(address, min_seqno=min_seqno)
         account = Address(address).to_tl_account_id()
 
         if state.last_transaction_lt is None or state.last_transaction_hash is None:
@@ -193,6 +203,87 @@ class LiteMixin:
 
         return out[:limit]
 
+    async def get_config(self, *, min_seqno: int | None = None) -> dict[int, t.Any]:
+        """Fetch global blockchain configuration.
+
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
+        :return: Mapping of config parameter IDs to values.
+        """
+        return await self._get_config(min_seqno=min_seqno)
+
+    async def get_info(
+        self,
+        address: AddressLike,
+        *,
+        min_seqno: int | None = None,
+    ) -> ContractInfo:
+        """Fetch contract state information.
+
+        Pass ``min_seqno`` (e.g. the masterchain seqno observed after
+        sending a message) to read state no older than that block; a
+        lagging server waits for it instead of returning stale data.
+
+        :param address: Contract address.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
+        :return: ``ContractInfo`` snapshot.
+        """
+        if isinstance(address, Address):
+            address = address.to_str(is_user_friendly=False)
+        return await self._get_info(address, min_seqno=min_seqno)
+
+    async def get_transactions(
+        self,
+        address: AddressLike,
+        limit: int = 100,
+        from_lt: int | None = None,
+        to_lt: int | None = None,
+        *,
+        min_seqno: int | None = None,
+    ) -> list[Transaction]:
+        """Fetch transaction history for a contract.
+
+        :param address: Contract address.
+        :param limit: Maximum number of transactions to return.
+        :param from_lt: Upper-bound logical time (inclusive), or ``None``.
+        :param to_lt: Lower-bound logical time (exclusive), or ``None``.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
+        :return: Transactions ordered from newest to oldest.
+        """
+        if isinstance(address, Address):
+            address = address.to_str(is_user_friendly=False)
+        return await self._get_transactions(
+            address=address,
+            limit=limit,
+            from_lt=from_lt,
+            to_lt=to_lt,
+            min_seqno=min_seqno,
+        )
+
+    async def run_get_method(
+        self,
+        address: AddressLike,
+        method_name: str,
+        stack: list[t.Any] | None = None,
+        *,
+        min_seqno: int | None = None,
+    ) -> list[t.Any]:
+        """Execute a contract get-method.
+
+        :param address: Contract address.
+        :param method_name: Name of the get-method.
+        :param stack: TVM stack arguments, or ``None``.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
+        :return: Decoded TVM stack result.
+        """
+        if isinstance(address, Address):
+            address = address.to_str(is_user_friendly=False)
+        return await self._run_get_method(
+            address=address,
+            method_name=method_name,
+            stack=stack,
+            min_seqno=min_seqno,
+        )
+
     async def get_time(self) -> int:
         """Fetch current network time from the lite-server.
 
@@ -251,6 +342,8 @@ class LiteMixin:
         seqno: int | None = None,
         lt: int | None = None,
         utime: int | None = None,
+        *,
+        min_seqno: int | None = None,
     ) -> tuple[BlockIdExt, Block]:
         """Locate a block by workchain/shard and one of seqno, lt, or utime.
 
@@ -259,6 +352,7 @@ class LiteMixin:
         :param seqno: Block sequence number.
         :param lt: Logical time filter.
         :param utime: UNIX time filter.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: Tuple of ``BlockIdExt`` and deserialized ``Block``.
         """
         method = "lookup_block"
@@ -271,63 +365,76 @@ class LiteMixin:
                 seqno=seqno,
                 lt=lt,
                 utime=utime,
+                min_seqno=min_seqno,
             ),
         )
 
     async def get_block_header(
         self,
         block: BlockIdExt,
+        *,
+        min_seqno: int | None = None,
     ) -> tuple[BlockIdExt, Block]:
         """Fetch and deserialize a block header.
 
         :param block: Block identifier to query.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: Tuple of ``BlockIdExt`` and deserialized ``Block``.
         """
         method = "get_block_header"
         return t.cast(
             "tuple[BlockIdExt, Block]",
-            await self._adnl_call(method, block),
+            await self._adnl_call(method, block, min_seqno=min_seqno),
         )
 
     async def get_block_transactions(
         self,
         block: BlockIdExt,
         count: int = 1024,
+        *,
+        min_seqno: int | None = None,
     ) -> list[Transaction]:
         """Fetch all transactions in a block.
 
         :param block: Target block identifier.
         :param count: Maximum transactions per request page.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: List of deserialized ``Transaction`` objects.
         """
         method = "get_block_transactions"
         return t.cast(
             "list[Transaction]",
-            await self._adnl_call(method, block, count=count),
+            await self._adnl_call(method, block, count=count, min_seqno=min_seqno),
         )
 
     async def get_all_shards_info(
         self,
         block: BlockIdExt | None = None,
+        *,
+        min_seqno: int | None = None,
     ) -> list[BlockIdExt]:
         """Fetch shard info for all workchains at a masterchain block.
 
         :param block: Masterchain block ID, or ``None`` for latest.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: List of shard ``BlockIdExt`` objects.
         """
         method = "get_all_shards_info"
         return t.cast(
             "list[BlockIdExt]",
-            await self._adnl_call(method, block),
+            await self._adnl_call(method, block, min_seqno=min_seqno),
         )
 
     async def get_account_state(
         self,
         address: AddressLike,
+        *,
+        min_seqno: int | None = None,
     ) -> tuple[Account | None, ShardAccount | None]:
         """Fetch account state and shard account from the lite-server.
 
         :param address: Contract address.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :return: Tuple of (``Account`` or ``None``, ``ShardAccount`` or ``None``).
         """
         if isinstance(address, str):
@@ -336,5 +443,5 @@ class LiteMixin:
         method = "get_account_state"
         return t.cast(
             "tuple[Account | None, ShardAccount | None]",
-            await self._adnl_call(method, address),
+            await self._adnl_call(method, address, min_seqno=min_seqno),
         )
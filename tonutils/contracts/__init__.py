@@ -13,6 +13,7 @@ from .jetton import (
     JettonMasterStablecoin,
     JettonMasterStablecoinV2,
     JettonMasterStandard,
+    JettonWalletResolver,
     JettonWalletStablecoin,
     JettonWalletStablecoinV2,
     JettonWalletStandard,
@@ -65,9 +66,12 @@ from .wallet import (
     BaseMessageBuilder,
     BaseWallet,
     ExternalMessage,
+    HighloadSender,
     InternalMessage,
     JettonTransferBuilder,
+    KeyCache,
     NFTTransferBuilder,
+    OptimisticSender,
     SeqnoGuard,
     TONTransferBuilder,
     WalletHighloadV2,
@@ -95,6 +99,7 @@ from .wallet import (
     is_signature_allowed_get_method,
     processed_get_method,
     seqno_get_method,
+    sign_external_messages,
 )
 
 __all__ = [
@@ -110,20 +115,24 @@ __all__ = [
     "BaseWallet",
     "ContractProtocol",
     "ExternalMessage",
+    "HighloadSender",
     "InternalMessage",
     "JettonMasterStablecoin",
     "JettonMasterStablecoinV2",
     "JettonMasterStandard",
     "JettonTransferBuilder",
+    "JettonWalletResolver",
     "JettonWalletStablecoin",
     "JettonWalletStablecoinV2",
     "JettonWalletStandard",
+    "KeyCache",
     "NFTCollectionEditable",
     "NFTCollectionStandard",
     "NFTItemEditable",
     "NFTItemSoulbound",
     "NFTItemStandard",
     "NFTTransferBuilder",
+    "OptimisticSender",
     "SeqnoGuard",
     "TONDNSCollection",
     "TONDNSItem",
@@ -184,4 +193,5 @@ __all__ = [
     "processed_get_method",
     "royalty_params_get_method",
     "seqno_get_method",
+    "sign_external_messages",
 ]
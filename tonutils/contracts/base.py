@@ -71,6 +71,7 @@ class BaseContract(ContractProtocol[_D]):
         self._address = address
         self._state_init = state_init
         self._info = info
+        self._state_data: tuple[Cell, _D] | None = None
 
     @property
     def client(self) -> ClientProtocol:
@@ -89,13 +90,26 @@ class BaseContract(ContractProtocol[_D]):
 
     @property
     def state_data(self) -> _D:
-        """Decoded on-chain data in typed form."""
+        """Decoded on-chain data in typed form.
+
+        Decoded once per data cell and reused until ``refresh()``.
+        """
         if not hasattr(self, "_data_model") or self._data_model is None:
             raise ContractError(self, "No `_data_model` defined for contract class.")
-        if not (self._info and self._info.data):
+        data = self._info.data if self._info else None
+        if data is None:
             raise StateNotLoadedError(self, missing="state_data")
-        cs = self._info.data.begin_parse()
-        return t.cast("_D", self._data_model.deserialize(cs))
+        if self._state_data is None or self._state_data[0] is not data:
+            self._state_data = (data, self._decode_state_data(data))
+        return self._state_data[1]
+
+    def _decode_state_data(self, data: Cell) -> _D:
+        """Deserialize the data cell into ``_data_model``.
+
+        :param data: Contract data cell.
+        :return: Decoded state data.
+        """
+        return t.cast("_D", self._data_model.deserialize(data.begin_parse()))
 
     @property
     def info(self) -> ContractInfo:
@@ -173,6 +187,7 @@ class BaseContract(ContractProtocol[_D]):
     async def refresh(self) -> None:
         """Refresh contract state from the blockchain."""
         self._info = await self._load_info(self.client, self.address)
+        self._state_data = None
 
     @classmethod
     def from_state_init(
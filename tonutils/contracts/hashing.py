@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+
+from ton_core import Cell, StateInit
+
+_T = t.TypeVar("_T")
+_R = t.TypeVar("_R")
+
+
+class StateInitHasher:
+    """``StateInit`` hashing with a fixed code cell.
+
+    A ``StateInit`` cell's representation hash depends on the data cell
+    only through the data cell's depth and hash. Everything else (the
+    descriptors, the cell's own bits, the code depth and hash) is
+    computed once, so each address costs a single SHA-256.
+    """
+
+    def __init__(self, code: Cell, template: Cell | None = None) -> None:
+        """Initialize the hasher.
+
+        :param code: Contract code ``Cell``.
+        :param template: ``StateInit`` cell built with ``code`` and any data cell,
+            or ``None`` for a plain ``StateInit(code, data)``.
+        """
+        if template is None:
+            template = StateInit(code=code, data=Cell.empty()).serialize()
+        self._prefix = template.get_descriptors() + template.get_data_bytes() + code.get_depth().to_bytes(2, "big")
+        self._code_hash = code.hash
+
+    def hash(self, data: Cell) -> bytes:
+        """Return the ``StateInit`` cell hash for the given data cell.
+
+        :param data: Contract data ``Cell``.
+        :return: 32-byte representation hash.
+        """
+        return hashlib.sha256(self._prefix + data.get_depth().to_bytes(2, "big") + self._code_hash + data.hash).digest()
+
+
+def map_in_processes(
+    func: t.Callable[..., list[_R]],
+    items: t.Sequence[_T],
+    processes: int,
+    *args: t.Any,
+) -> list[_R]:
+    """Apply a batch function to chunks of items in a process pool.
+
+    :param func: Picklable function called as ``func(chunk, *args)``.
+    :param items: Items to split into chunks.
+    :param processes: Number of worker processes.
+    :param args: Extra picklable arguments passed to every call.
+    :return: Concatenated results in item order.
+    """
+    chunk_size = max(1, -(-len(items) // (processes * 4)))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [
+            pool.submit(func, list(items[start : start + chunk_size]), *args)
+            for start in range(0, len(items), chunk_size)
+        ]
+        return [result for future in futures for result in future.result()]
@@ -11,6 +11,7 @@ from .methods import (
     get_wallet_address_get_method,
     get_wallet_data_get_method,
 )
+from .resolver import JettonWalletResolver
 from .wallet import (
     BaseJettonWallet,
     JettonWalletStablecoin,
@@ -24,6 +25,7 @@ __all__ = [
     "JettonMasterStablecoin",
     "JettonMasterStablecoinV2",
     "JettonMasterStandard",
+    "JettonWalletResolver",
     "JettonWalletStablecoin",
     "JettonWalletStablecoinV2",
     "JettonWalletStandard",
@@ -20,6 +20,7 @@ from ton_core import (
 )
 
 from tonutils.contracts.base import BaseContract
+from tonutils.contracts.hashing import StateInitHasher, map_in_processes
 from tonutils.contracts.jetton.methods import (
     GetJettonDataGetMethod,
     GetNextAdminAddressGetMethod,
@@ -118,6 +119,90 @@ class BaseJettonMaster(
         state_init = StateInit(code=code, data=data)
         return Address((workchain.value, state_init.serialize().hash))
 
+    @classmethod
+    def _jetton_wallet_hasher(
+        cls,
+        jetton_master_address: AddressLike,
+        jetton_wallet_code: Cell,
+    ) -> StateInitHasher:
+        """Build a ``StateInit`` hasher for this master's wallets.
+
+        :param jetton_master_address: Master contract address.
+        :param jetton_wallet_code: Wallet contract code.
+        :return: Hasher bound to the wallet code.
+        """
+        return StateInitHasher(jetton_wallet_code)
+
+    @classmethod
+    def _jetton_wallet_address_from_hash(
+        cls,
+        owner_address: AddressLike,
+        state_init_hash: bytes,
+        workchain: WorkchainID,
+    ) -> Address:
+        """Build a wallet address from its ``StateInit`` hash.
+
+        :param owner_address: Wallet owner's address.
+        :param state_init_hash: ``StateInit`` cell hash.
+        :param workchain: Target workchain.
+        :return: Wallet address.
+        """
+        return Address((workchain.value, state_init_hash))
+
+    @classmethod
+    def _calculate_user_jetton_wallet_addresses(
+        cls,
+        owner_addresses: list[AddressLike],
+        jetton_master_address: AddressLike,
+        jetton_wallet_code: Cell | bytes,
+        workchain: WorkchainID,
+    ) -> list[Address]:
+        """Calculate wallet addresses for a chunk of owners in this process."""
+        code = to_cell(jetton_wallet_code)
+        hasher = cls._jetton_wallet_hasher(jetton_master_address, code)
+        return [
+            cls._jetton_wallet_address_from_hash(
+                owner_address,
+                hasher.hash(cls._pack_jetton_wallet_data(owner_address, jetton_master_address, code)),
+                workchain,
+            )
+            for owner_address in owner_addresses
+        ]
+
+    @classmethod
+    def calculate_user_jetton_wallet_addresses(
+        cls,
+        owner_addresses: t.Iterable[AddressLike],
+        jetton_master_address: AddressLike,
+        jetton_wallet_code: Cell | str,
+        workchain: WorkchainID = WorkchainID.BASECHAIN,
+        processes: int | None = None,
+    ) -> list[Address]:
+        """Calculate Jetton wallet addresses for many owners.
+
+        The wallet code hash and depth are computed once; each owner
+        costs one data cell and one SHA-256.
+
+        :param owner_addresses: Wallet owners' addresses.
+        :param jetton_master_address: Master contract address.
+        :param jetton_wallet_code: Wallet contract code (``Cell`` or hex string).
+        :param workchain: Target workchain.
+        :param processes: Worker processes to fan out over, or ``None`` to run in this process.
+        :return: Calculated wallet addresses in owner order.
+        """
+        owners = list(owner_addresses)
+        code = to_cell(jetton_wallet_code)
+        if processes is None or processes <= 1:
+            return cls._calculate_user_jetton_wallet_addresses(owners, jetton_master_address, code, workchain)
+        return map_in_processes(
+            cls._calculate_user_jetton_wallet_addresses,
+            owners,
+            processes,
+            jetton_master_address,
+            code.to_boc(),
+            workchain,
+        )
+
 
 class JettonMasterStandard(BaseJettonMaster[_DStandard, _CStandard]):
     """Standard Jetton master contract (TEP-74)."""
@@ -278,3 +363,43 @@ class JettonMasterStablecoinV2(JettonMasterStablecoin[_DStablecoin, _CStablecoin
         cell.store_uint(shard_prefix, cls._SHARD_DEPTH)
         cell.store_uint(prefix_less, 256 - cls._SHARD_DEPTH)
         return t.cast("Address", cell.end_cell().begin_parse().load_address())
+
+    @classmethod
+    def _jetton_wallet_hasher(
+        cls,
+        jetton_master_address: AddressLike,
+        jetton_wallet_code: Cell,
+    ) -> StateInitHasher:
+        """Build a sharded ``StateInit`` hasher for this master's wallets.
+
+        :param jetton_master_address: Master contract address.
+        :param jetton_wallet_code: Wallet contract code.
+        :return: Hasher bound to the wallet code.
+        """
+        template = cls._calculate_jetton_wallet_state_init_cell(
+            owner_address=jetton_master_address,
+            jetton_master_address=jetton_master_address,
+            jetton_wallet_code=jetton_wallet_code,
+        )
+        return StateInitHasher(jetton_wallet_code, template)
+
+    @classmethod
+    def _jetton_wallet_address_from_hash(
+        cls,
+        owner_address: AddressLike,
+        state_init_hash: bytes,
+        workchain: WorkchainID,
+    ) -> Address:
+        """Build a sharded wallet address from its ``StateInit`` hash.
+
+        :param owner_address: Wallet owner's address.
+        :param state_init_hash: ``StateInit`` cell hash.
+        :param workchain: Target workchain.
+        :return: Wallet address with the owner's shard prefix.
+        """
+        if isinstance(owner_address, str):
+            owner_address = Address(owner_address)
+        mask = (1 << (256 - cls._SHARD_DEPTH)) - 1
+        owner_id = int.from_bytes(owner_address.hash_part, "big")
+        account_id = (owner_id & ~mask) | (int.from_bytes(state_init_hash, "big") & mask)
+        return Address((workchain.value, account_id.to_bytes(32, "big")))
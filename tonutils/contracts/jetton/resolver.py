@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import typing as t
+
+from ton_core import Address, AddressLike, Cell, WorkchainID, to_cell
+
+from tonutils.contracts.jetton.master import BaseJettonMaster, JettonMasterStandard
+from tonutils.contracts.jetton.methods import get_wallet_address_get_method
+from tonutils.exceptions import ContractError
+
+if t.TYPE_CHECKING:
+    from tonutils.clients.protocol import ClientProtocol
+
+JettonMasterType = type[BaseJettonMaster[t.Any, t.Any]]
+
+
+class JettonWalletResolver:
+    """Registry of jetton masters whose wallet addresses are derived locally.
+
+    Each registered master is stored with its master class, which selects
+    the wallet data layout (standard, stablecoin, or stablecoin v2 with
+    shard prefix), and its cached ``jetton_wallet_code``. Addresses for
+    registered masters are computed offline; unknown masters fall back
+    to the ``get_wallet_address`` get-method.
+    """
+
+    def __init__(self) -> None:
+        self._masters: dict[Address, tuple[JettonMasterType, Cell, WorkchainID]] = {}
+
+    def __contains__(self, jetton_master_address: AddressLike) -> bool:
+        """Return ``True`` if the master is registered."""
+        return self._normalize(jetton_master_address) in self._masters
+
+    def __len__(self) -> int:
+        """Return the number of registered masters."""
+        return len(self._masters)
+
+    @staticmethod
+    def _normalize(address: AddressLike) -> Address:
+        """Convert an address-like value to ``Address``."""
+        return Address(address) if isinstance(address, str) else address
+
+    def register(
+        self,
+        jetton_master_address: AddressLike,
+        jetton_wallet_code: Cell | str,
+        master_class: JettonMasterType = JettonMasterStandard,
+        workchain: WorkchainID = WorkchainID.BASECHAIN,
+    ) -> None:
+        """Register a jetton master for local address derivation.
+
+        :param jetton_master_address: Jetton master address.
+        :param jetton_wallet_code: Jetton wallet code (``Cell`` or hex string).
+        :param master_class: Master class defining the wallet data layout.
+        :param workchain: Workchain of the jetton wallets.
+        """
+        address = self._normalize(jetton_master_address)
+        self._masters[address] = (master_class, to_cell(jetton_wallet_code), workchain)
+
+    def unregister(self, jetton_master_address: AddressLike) -> None:
+        """Remove a registered jetton master.
+
+        :param jetton_master_address: Jetton master address.
+        """
+        self._masters.pop(self._normalize(jetton_master_address), None)
+
+    async def load(
+        self,
+        client: ClientProtocol,
+        jetton_master_address: AddressLike,
+        master_class: JettonMasterType = JettonMasterStandard,
+        workchain: WorkchainID = WorkchainID.BASECHAIN,
+        verify: bool = True,
+    ) -> None:
+        """Fetch a jetton master's wallet code and register it.
+
+        :param client: TON client.
+        :param jetton_master_address: Jetton master address.
+        :param master_class: Master class defining the wallet data layout.
+        :param workchain: Workchain of the jetton wallets.
+        :param verify: Compare one derived address with the get-method result.
+        :raises ContractError: If the derived address does not match the get-method.
+        """
+        master = await master_class.from_address(client, jetton_master_address)
+        self.register(master.address, master.jetton_wallet_code, master_class, workchain)
+        if not verify:
+            return
+
+        derived = t.cast("Address", self.derive(master.address, master.address))
+        expected = await get_wallet_address_get_method(client, master.address, master.address)
+        if derived != expected:
+            self.unregister(master.address)
+            raise ContractError(
+                master,
+                f"Locally derived jetton wallet address does not match `get_wallet_address` "
+                f"for master class {master_class.__name__}.",
+                hint="Pass the master_class matching the jetton master contract "
+                "(JettonMasterStandard, JettonMasterStablecoin, or JettonMasterStablecoinV2).",
+            )
+
+    def derive(
+        self,
+        owner_address: AddressLike,
+        jetton_master_address: AddressLike,
+    ) -> Address | None:
+        """Derive a jetton wallet address offline.
+
+        :param owner_address: Wallet owner's address.
+        :param jetton_master_address: Jetton master address.
+        :return: Jetton wallet address, or ``None`` if the master is not registered.
+        """
+        address = self._normalize(jetton_master_address)
+        entry = self._masters.get(address)
+        if entry is None:
+            return None
+
+        master_class, code, workchain = entry
+        return master_class.calculate_user_jetton_wallet_address(owner_address, address, code, workchain)
+
+    async def resolve(
+        self,
+        client: ClientProtocol,
+        owner_address: AddressLike,
+        jetton_master_address: AddressLike,
+    ) -> Address:
+        """Return a jetton wallet address, derived locally when possible.
+
+        :param client: TON client used for unregistered masters.
+        :param owner_address: Wallet owner's address.
+        :param jetton_master_address: Jetton master address.
+        :return: Jetton wallet address.
+        """
+        derived = self.derive(owner_address, jetton_master_address)
+        if derived is not None:
+            return derived
+        return await get_wallet_address_get_method(client, jetton_master_address, owner_address)
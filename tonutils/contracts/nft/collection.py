@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import typing as t
+
 from ton_core import (
     Address,
     AddressLike,
@@ -14,6 +16,7 @@ from ton_core import (
 )
 
 from tonutils.contracts.base import BaseContract
+from tonutils.contracts.hashing import StateInitHasher, map_in_processes
 from tonutils.contracts.nft.methods import (
     GetCollectionDataGetMethod,
     GetNFTAddressByIndexGetMethod,
@@ -77,6 +80,58 @@ class BaseNFTCollection(
         state_init = StateInit(code=code, data=data.end_cell())
         return Address((workchain.value, state_init.serialize().hash))
 
+    @classmethod
+    def _calculate_nft_item_addresses(
+        cls,
+        indexes: list[int],
+        nft_item_code: Cell | bytes,
+        collection_address: AddressLike,
+        workchain: WorkchainID,
+    ) -> list[Address]:
+        """Calculate item addresses for a chunk of indexes in this process."""
+        hasher = StateInitHasher(to_cell(nft_item_code))
+        addresses: list[Address] = []
+        for index in indexes:
+            data = begin_cell()
+            data.store_uint(index, 64)
+            data.store_address(collection_address)
+            addresses.append(Address((workchain.value, hasher.hash(data.end_cell()))))
+        return addresses
+
+    @classmethod
+    def calculate_nft_item_addresses(
+        cls,
+        indexes: t.Iterable[int],
+        nft_item_code: Cell | str,
+        collection_address: AddressLike,
+        workchain: WorkchainID = WorkchainID.BASECHAIN,
+        processes: int | None = None,
+    ) -> list[Address]:
+        """Calculate NFT item addresses for many indexes.
+
+        The item code hash and depth are computed once; each index
+        costs one data cell and one SHA-256.
+
+        :param indexes: Item indexes in the collection.
+        :param nft_item_code: Item contract code (``Cell`` or hex string).
+        :param collection_address: Parent collection address.
+        :param workchain: Target workchain.
+        :param processes: Worker processes to fan out over, or ``None`` to run in this process.
+        :return: Calculated item addresses in index order.
+        """
+        items = list(indexes)
+        code = to_cell(nft_item_code)
+        if processes is None or processes <= 1:
+            return cls._calculate_nft_item_addresses(items, code, collection_address, workchain)
+        return map_in_processes(
+            cls._calculate_nft_item_addresses,
+            items,
+            processes,
+            code.to_boc(),
+            collection_address,
+            workchain,
+        )
+
 
 class NFTCollectionStandard(BaseNFTCollection):
     """Standard NFT collection (TEP-62)."""
@@ -3,6 +3,7 @@ from .base import (
     BaseWallet,
 )
 from .guard import SeqnoGuard
+from .keys import KeyCache
 from .messages import (
     BaseMessageBuilder,
     ExternalMessage,
@@ -23,7 +24,10 @@ from .methods import (
     processed_get_method,
     seqno_get_method,
 )
+from .optimistic import OptimisticSender
 from .protocol import WalletProtocol
+from .sender import HighloadSender
+from .signer import sign_external_messages
 from .versions import (
     WalletHighloadV2,
     WalletHighloadV3R1,
@@ -46,9 +50,12 @@ __all__ = [
     "BaseMessageBuilder",
     "BaseWallet",
     "ExternalMessage",
+    "HighloadSender",
     "InternalMessage",
     "JettonTransferBuilder",
+    "KeyCache",
     "NFTTransferBuilder",
+    "OptimisticSender",
     "SeqnoGuard",
     "TONTransferBuilder",
     "WalletHighloadV2",
@@ -76,4 +83,5 @@ __all__ = [
     "is_signature_allowed_get_method",
     "processed_get_method",
     "seqno_get_method",
+    "sign_external_messages",
 ]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import copy
 import typing as t
 
 from ton_core import (
@@ -28,6 +30,8 @@ from ton_core import (
 )
 
 from tonutils.contracts.base import BaseContract
+from tonutils.contracts.jetton.methods import get_wallet_address_get_method
+from tonutils.contracts.wallet.keys import derive_private_keys
 from tonutils.contracts.wallet.messages import (
     BaseMessageBuilder,
     ExternalMessage,
@@ -38,6 +42,8 @@ from tonutils.exceptions import ContractError
 
 if t.TYPE_CHECKING:
     from tonutils.clients.protocol import ClientProtocol
+    from tonutils.contracts.jetton.resolver import JettonWalletResolver
+    from tonutils.contracts.wallet.keys import KeyCache
     from tonutils.types import ContractInfo
 
 _D = t.TypeVar("_D", bound=BaseWalletData)
@@ -86,6 +92,9 @@ class BaseWallet(BaseContract[_D], WalletProtocol[_D, _C, _P], abc.ABC):
         self._config = config
         self._private_key: PrivateKey | None = None
         self._public_key: PublicKey | None = None
+        self._jetton_resolver: JettonWalletResolver | None = None
+        self._jetton_wallets: dict[Address, Address] = {}
+        self._jetton_wallet_lookups: dict[Address, asyncio.Task[Address]] = {}
 
         if private_key is not None:
             self._private_key = private_key
@@ -112,6 +121,16 @@ class BaseWallet(BaseContract[_D], WalletProtocol[_D, _C, _P], abc.ABC):
         """Private key, or ``None`` for read-only wallets."""
         return self._private_key if self._private_key else None
 
+    @property
+    def jetton_resolver(self) -> JettonWalletResolver | None:
+        """Registry for local jetton wallet address derivation, or ``None``."""
+        return self._jetton_resolver
+
+    @jetton_resolver.setter
+    def jetton_resolver(self, value: JettonWalletResolver | None) -> None:
+        """Set the registry used by ``get_jetton_wallet_address``."""
+        self._jetton_resolver = value
+
     @abc.abstractmethod
     async def _build_msg_cell(
         self,
@@ -223,6 +242,54 @@ class BaseWallet(BaseContract[_D], WalletProtocol[_D, _C, _P], abc.ABC):
         wallet = cls.from_private_key(client, private_key, workchain, config)
         return wallet, public_key, private_key, mnemonic
 
+    @classmethod
+    async def from_mnemonics(
+        cls: type[_TWallet],
+        client: ClientProtocol,
+        mnemonics: t.Sequence[list[str] | str],
+        validate: bool = True,
+        workchain: WorkchainID = WorkchainID.BASECHAIN,
+        config: _C | None = None,
+        processes: int | None = None,
+        key_cache: KeyCache | None = None,
+    ) -> list[tuple[_TWallet, PublicKey, PrivateKey, list[str]]]:
+        """Create many wallets from mnemonic phrases.
+
+        Keys missing from ``key_cache`` are derived in a process pool off
+        the event loop and then added to the cache, which is saved.
+
+        :param client: TON client.
+        :param mnemonics: BIP39 mnemonics (lists or space-separated strings).
+        :param validate: Validate mnemonic checksums.
+        :param workchain: Target workchain.
+        :param config: Wallet configuration shared as a template, or ``None``.
+        :param processes: Number of worker processes, or ``None`` for all cores.
+        :param key_cache: Encrypted key cache, or ``None``.
+        :return: Tuples of (wallet, public_key, private_key, mnemonic_list) in input order.
+        """
+        normalized = [m.strip().lower().split() if isinstance(m, str) else m for m in mnemonics]
+        if validate:
+            for mnemonic in normalized:
+                cls.validate_mnemonic(mnemonic)
+
+        keys = [key_cache.get(m) if key_cache is not None else None for m in normalized]
+        missing = [i for i, key in enumerate(keys) if key is None]
+        if missing:
+            derived = await derive_private_keys([normalized[i] for i in missing], processes)
+            for i, private_key in zip(missing, derived):
+                keys[i] = private_key
+                if key_cache is not None:
+                    key_cache.set(normalized[i], private_key)
+            if key_cache is not None:
+                key_cache.save()
+
+        result = []
+        for mnemonic, private_key in zip(normalized, t.cast("list[PrivateKey]", keys)):
+            wallet_config = copy.copy(config) if config is not None else None
+            wallet = cls.from_private_key(client, private_key, workchain, wallet_config)
+            result.append((wallet, private_key.public_key, private_key, mnemonic))
+        return result
+
     @classmethod
     def create(
         cls: type[_TWallet],
@@ -245,21 +312,79 @@ class BaseWallet(BaseContract[_D], WalletProtocol[_D, _C, _P], abc.ABC):
         mnemonic = mnemonic_new(mnemonic_length)
         return cls.from_mnemonic(client, mnemonic, True, workchain, config)
 
+    async def get_jetton_wallet_address(self, jetton_master_address: AddressLike) -> Address:
+        """Resolve this wallet's jetton wallet address for a jetton master.
+
+        Masters registered in ``jetton_resolver`` are derived locally.
+        Other results are cached per master, and concurrent lookups for
+        the same master share a single ``get_wallet_address`` call.
+
+        :param jetton_master_address: Jetton master address.
+        :return: Jetton wallet address owned by this wallet.
+        """
+        if isinstance(jetton_master_address, str):
+            jetton_master_address = Address(jetton_master_address)
+
+        if self._jetton_resolver is not None:
+            derived = self._jetton_resolver.derive(self.address, jetton_master_address)
+            if derived is not None:
+                return derived
+
+        cached = self._jetton_wallets.get(jetton_master_address)
+        if cached is not None:
+            return cached
+
+        lookup = self._jetton_wallet_lookups.get(jetton_master_address)
+        if lookup is None:
+            lookup = asyncio.ensure_future(
+                get_wallet_address_get_method(
+                    client=self.client,
+                    address=jetton_master_address,
+                    owner_address=self.address,
+                )
+            )
+            self._jetton_wallet_lookups[jetton_master_address] = lookup
+            lookup.add_done_callback(lambda _: self._jetton_wallet_lookups.pop(jetton_master_address, None))
+
+        address = await asyncio.shield(lookup)
+        self._jetton_wallets[jetton_master_address] = address
+        return address
+
+    async def _resolve_messages(
+        self,
+        messages: t.Sequence[WalletMessage | BaseMessageBuilder],
+    ) -> list[WalletMessage]:
+        """Build message builders concurrently, keeping message order.
+
+        :param messages: Internal messages or message builders.
+        :return: Resolved ``WalletMessage`` list.
+        """
+        resolved = list(messages)
+        builders = [(i, m) for i, m in enumerate(messages) if not isinstance(m, WalletMessage)]
+        built = await asyncio.gather(*(builder.build(self) for _, builder in builders))
+        for (i, _), message in zip(builders, built):
+            resolved[i] = message
+        return t.cast("list[WalletMessage]", resolved)
+
     async def build_external_message(
         self,
         messages: t.Sequence[WalletMessage | BaseMessageBuilder],
         params: _P | None = None,
+        refresh: bool = True,
     ) -> ExternalMessage:
         """Build a signed external message.
 
+        Message builders are resolved concurrently with the state refresh.
+
         :param messages: Internal messages or message builders.
         :param params: Transaction parameters, or ``None``.
+        :param refresh: Refresh wallet state first; ``False`` uses the loaded state.
         :return: Signed ``ExternalMessage``.
         """
-        resolved: list[WalletMessage] = [
-            (message if isinstance(message, WalletMessage) else await message.build(self)) for message in messages
-        ]
-        await self.refresh()
+        if refresh:
+            resolved, _ = await asyncio.gather(self._resolve_messages(messages), self.refresh())
+        else:
+            resolved = await self._resolve_messages(messages)
         self._validate_message_count(resolved)
         self._validate_params_type(params)
         body = await self._build_signed_msg_cell(resolved, params)
@@ -5,13 +5,18 @@ import typing as t
 
 from ton_core import DEFAULT_SENDMODE, AddressLike, SendMode
 
-from tonutils.exceptions import ContractError
+from tonutils.exceptions import ClientError, ContractError
 
 if t.TYPE_CHECKING:
     from ton_core import Cell, StateInit, WalletMessage
 
     from tonutils.contracts.wallet.base import BaseWallet
     from tonutils.contracts.wallet.messages import BaseMessageBuilder, ExternalMessage
+    from tonutils.tools.delivery_tracker import DeliveryTracker
+
+_NOT_CONFIRMED_HINT = (
+    "Transaction may have expired or failed. Check wallet balance, valid_until, and contract state on-chain."
+)
 
 
 class SeqnoGuard:
@@ -19,10 +24,13 @@ class SeqnoGuard:
 
     Wraps a wallet and mirrors its transfer methods, ensuring each
     send is confirmed on-chain (seqno advances) before the next.
+    With a running ``DeliveryTracker``, confirmation waits for the
+    transaction carrying the sent message instead of polling ``seqno``.
 
     :param wallet: Wallet with ``seqno`` get-method support.
     :param timeout: Maximum seqno wait time in seconds per send.
     :param poll_interval: Delay between seqno polls in seconds.
+    :param tracker: Running delivery tracker, or ``None`` to poll ``seqno``.
     :raises ContractError: If the wallet does not support ``seqno``.
     """
 
@@ -31,6 +39,7 @@ class SeqnoGuard:
         wallet: BaseWallet[t.Any, t.Any, t.Any],
         timeout: float = 30.0,
         poll_interval: float = 1.5,
+        tracker: DeliveryTracker | None = None,
     ) -> None:
         if not hasattr(wallet, "seqno"):
             raise ContractError(
@@ -42,6 +51,7 @@ class SeqnoGuard:
         self._lock = asyncio.Lock()
         self._timeout = timeout
         self._poll_interval = poll_interval
+        self._tracker = tracker
 
     async def _wait_seqno(self, current_seqno: int) -> None:
         """Poll until seqno advances or timeout is reached."""
@@ -54,13 +64,30 @@ class SeqnoGuard:
         raise ContractError(
             self._wallet,
             f"seqno did not change within {self._timeout}s (stuck at {current_seqno}).",
-            hint="Transaction may have expired or failed. "
-            "Check wallet balance, valid_until, and contract state on-chain.",
+            hint=_NOT_CONFIRMED_HINT,
         )
 
+    async def _wait_delivery(self, message: ExternalMessage) -> None:
+        """Wait for the tracker to see the message or timeout is reached."""
+        assert self._tracker is not None
+        try:
+            await self._tracker.wait(message, self._timeout)
+        except ClientError as exc:
+            if not self._tracker.running:
+                raise
+            raise ContractError(
+                self._wallet,
+                f"message {message.normalized_hash} was not delivered within {self._timeout}s.",
+                hint=_NOT_CONFIRMED_HINT,
+            ) from exc
+
     async def _send(self, coro: t.Awaitable[ExternalMessage]) -> ExternalMessage:
-        """Acquire lock, send, wait for seqno confirmation."""
+        """Acquire lock, send, wait for seqno or delivery confirmation."""
         async with self._lock:
+            if self._tracker is not None:
+                message = await coro
+                await self._wait_delivery(message)
+                return message
             seqno = await self._wallet.seqno()
             result = await coro
             await self._wait_seqno(seqno)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import typing as t
+from pathlib import Path
+
+from nacl.exceptions import CryptoError
+from nacl.secret import SecretBox
+from ton_core import PrivateKey, mnemonic_to_private_key
+
+from tonutils.contracts.hashing import map_in_processes
+
+KEY_CACHE_SECRET_SIZE: t.Final[int] = 32
+"""Length of the ``KeyCache`` secret in bytes."""
+
+
+def _derive_private_keys(mnemonics: list[list[str]]) -> list[bytes]:
+    """Derive 32-byte private key seeds for a chunk of mnemonics.
+
+    :param mnemonics: Normalized mnemonic word lists.
+    :return: Private key seeds in input order.
+    """
+    return [mnemonic_to_private_key(mnemonic)[1][:32] for mnemonic in mnemonics]
+
+
+async def derive_private_keys(
+    mnemonics: t.Sequence[list[str]],
+    processes: int | None = None,
+) -> list[PrivateKey]:
+    """Derive private keys for many mnemonics without blocking the event loop.
+
+    Key derivation is deliberately slow (PBKDF2), so mnemonics are split
+    across a process pool that runs in a worker thread.
+
+    :param mnemonics: Normalized mnemonic word lists.
+    :param processes: Number of worker processes, or ``None`` for all cores.
+    :return: Private keys in input order.
+    """
+    if not mnemonics:
+        return []
+
+    processes = min(processes or os.cpu_count() or 1, len(mnemonics))
+    if processes == 1:
+        seeds = await asyncio.to_thread(_derive_private_keys, list(mnemonics))
+    else:
+        seeds = await asyncio.to_thread(map_in_processes, _derive_private_keys, mnemonics, processes)
+    return [PrivateKey(seed) for seed in seeds]
+
+
+class KeyCache:
+    """Encrypted on-disk cache of mnemonic-derived private keys.
+
+    Entries are keyed by a keyed BLAKE2b hash of the mnemonic, so the
+    file never holds a mnemonic. The whole store is sealed with
+    ``SecretBox`` (XSalsa20-Poly1305) under a 32-byte secret the caller
+    keeps outside the cache file (e.g. in a secrets manager).
+    """
+
+    def __init__(self, path: str | os.PathLike[str], secret: bytes) -> None:
+        """Initialize the key cache and load existing entries.
+
+        :param path: Cache file path; created on ``save()`` if missing.
+        :param secret: 32-byte secret, e.g. ``os.urandom(32)``.
+        :raises ValueError: If the secret has the wrong length or the file cannot be decrypted.
+        """
+        if len(secret) != KEY_CACHE_SECRET_SIZE:
+            raise ValueError(f"Key cache secret must be {KEY_CACHE_SECRET_SIZE} bytes, got {len(secret)}")
+
+        self._path = Path(path)
+        self._box = SecretBox(self._subkey(secret, b"box"))
+        self._id_key = self._subkey(secret, b"id")
+        self._entries: dict[str, str] = {}
+        self._dirty = False
+
+        if self._path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        """Return the number of cached keys."""
+        return len(self._entries)
+
+    def __contains__(self, mnemonic: list[str]) -> bool:
+        """Return ``True`` if a key is cached for the mnemonic."""
+        return self._entry_id(mnemonic) in self._entries
+
+    @staticmethod
+    def _subkey(secret: bytes, purpose: bytes) -> bytes:
+        """Derive a purpose-bound 32-byte subkey from the secret."""
+        return hashlib.blake2b(purpose, key=secret, person=b"tonutils-keys", digest_size=32).digest()
+
+    def _entry_id(self, mnemonic: list[str]) -> str:
+        """Return the cache key for a normalized mnemonic."""
+        return hashlib.blake2b(" ".join(mnemonic).encode(), key=self._id_key, digest_size=32).hexdigest()
+
+    def _load(self) -> None:
+        """Read and decrypt the cache file."""
+        try:
+            raw = self._box.decrypt(self._path.read_bytes())
+        except CryptoError as exc:
+            raise ValueError(f"Cannot decrypt key cache {self._path}: wrong secret or corrupted file") from exc
+        self._entries = json.loads(raw)
+
+    def get(self, mnemonic: list[str]) -> PrivateKey | None:
+        """Return the cached private key for a mnemonic.
+
+        :param mnemonic: Normalized mnemonic word list.
+        :return: ``PrivateKey``, or ``None`` if not cached.
+        """
+        seed = self._entries.get(self._entry_id(mnemonic))
+        return None if seed is None else PrivateKey(bytes.fromhex(seed))
+
+    def set(self, mnemonic: list[str], private_key: PrivateKey) -> None:
+        """Cache the private key for a mnemonic.
+
+        :param mnemonic: Normalized mnemonic word list.
+        :param private_key: Private key derived from the mnemonic.
+        """
+        self._entries[self._entry_id(mnemonic)] = private_key.as_bytes.hex()
+        self._dirty = True
+
+    def save(self) -> None:
+        """Encrypt and atomically write the cache file if it changed."""
+        if not self._dirty:
+            return
+
+        sealed = self._box.encrypt(json.dumps(self._entries).encode())
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(sealed)
+        os.replace(tmp, self._path)
+        self._dirty = False
@@ -24,7 +24,6 @@ from ton_core import (
 )
 from ton_core import MessageAny as MessageAnyBase
 
-from tonutils.contracts.jetton.methods import get_wallet_address_get_method
 from tonutils.contracts.wallet.protocol import WalletProtocol
 
 
@@ -324,11 +323,7 @@ class JettonTransferBuilder(BaseMessageBuilder):
         jetton_wallet_address = self.jetton_wallet_address
         if self.jetton_wallet_address is None:
             assert self.jetton_master_address is not None
-            jetton_wallet_address = await get_wallet_address_get_method(
-                client=wallet.client,
-                address=self.jetton_master_address,
-                owner_address=wallet.address,
-            )
+            jetton_wallet_address = await wallet.get_jetton_wallet_address(self.jetton_master_address)
         body = JettonTransferBody(
             destination=self.destination,
             jetton_amount=self.jetton_amount,
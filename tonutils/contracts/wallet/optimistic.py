@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+import typing as t
+
+from ton_core import DEFAULT_SENDMODE, AddressLike, SendMode
+
+from tonutils.contracts.wallet.messages import TONTransferBuilder
+from tonutils.exceptions import ContractError
+
+if t.TYPE_CHECKING:
+    from ton_core import Cell, StateInit, Transaction, WalletMessage
+
+    from tonutils.contracts.wallet.base import BaseWallet
+    from tonutils.contracts.wallet.messages import BaseMessageBuilder, ExternalMessage
+    from tonutils.tools.delivery_tracker import DeliveryTracker
+
+
+class OptimisticSender:
+    """Wallet sender with a locally tracked seqno.
+
+    Loads the wallet state once, then signs each send with the next
+    local seqno instead of refreshing the wallet first. The local state
+    is dropped and re-read from the chain on the next send when:
+
+    - a send raises;
+    - the state is older than ``max_age`` seconds;
+    - with a ``DeliveryTracker``, a sent message is not delivered in
+      ``timeout`` seconds or its transaction was aborted (the wallet
+      state, and therefore its seqno, was not committed).
+
+    :param wallet: Wallet with ``seqno`` in its state data (v1-v5).
+    :param tracker: Running delivery tracker, or ``None``.
+    :param timeout: Delivery wait time in seconds per message.
+    :param max_age: Seconds after which the local state is re-read from the chain.
+    :raises ContractError: If the wallet does not use ``seqno``.
+    """
+
+    def __init__(
+        self,
+        wallet: BaseWallet[t.Any, t.Any, t.Any],
+        tracker: DeliveryTracker | None = None,
+        timeout: float = 60.0,
+        max_age: float = 60.0,
+    ) -> None:
+        if not hasattr(wallet, "seqno"):
+            raise ContractError(
+                wallet,
+                "Wallet does not support `seqno` get-method.",
+                hint="OptimisticSender works with v1-v5 wallets. Highload wallets use HighloadSender instead.",
+            )
+        self._wallet = wallet
+        self._tracker = tracker
+        self._timeout = timeout
+        self._max_age = max_age
+        self._lock = asyncio.Lock()
+
+        self._seqno: int | None = None
+        self._synced_at = 0.0
+        self._epoch = 0
+        self._watchers: set[asyncio.Task[None]] = set()
+
+    @property
+    def seqno(self) -> int | None:
+        """Seqno for the next send, or ``None`` until the next sync."""
+        return self._seqno
+
+    def invalidate(self) -> None:
+        """Drop the local state so the next send re-reads it from the chain."""
+        self._seqno = None
+        self._epoch += 1
+
+    async def sync(self) -> None:
+        """Read the wallet state and seqno from the chain."""
+        await self._wallet.refresh()
+        self._seqno = self._wallet.state_data.seqno if self._wallet.is_active else 0
+        self._synced_at = time.monotonic()
+        self._epoch += 1
+
+    async def _watch(self, tracker: DeliveryTracker, message: ExternalMessage, epoch: int) -> None:
+        """Invalidate the local state if a sent message is not applied."""
+        try:
+            transaction: Transaction = await tracker.wait(message, self._timeout)
+        except Exception:
+            diverged = True
+        else:
+            diverged = bool(getattr(transaction.description, "aborted", False))
+        if diverged and self._epoch == epoch:
+            self.invalidate()
+
+    async def batch_transfer_message(
+        self,
+        messages: t.Sequence[WalletMessage | BaseMessageBuilder],
+        params: t.Any | None = None,
+    ) -> ExternalMessage:
+        """Sign with the local seqno and send a batch transfer.
+
+        :param messages: Internal messages or message builders.
+        :param params: Transaction parameters, or ``None``; ``seqno`` is overwritten.
+        :return: Sent ``ExternalMessage``.
+        """
+        async with self._lock:
+            if self._seqno is None or time.monotonic() - self._synced_at > self._max_age:
+                await self.sync()
+
+            params = copy.copy(params) if params is not None else self._wallet._params_model()
+            params.seqno = self._seqno
+            try:
+                message = await self._wallet.build_external_message(messages, params, refresh=False)
+                await self._wallet.client.send_message(message.as_hex)
+            except BaseException:
+                self.invalidate()
+                raise
+
+            self._seqno = t.cast("int", self._seqno) + 1
+            if self._tracker is not None:
+                watcher = asyncio.create_task(self._watch(self._tracker, message, self._epoch))
+                self._watchers.add(watcher)
+                watcher.add_done_callback(self._watchers.discard)
+            return message
+
+    async def transfer_message(
+        self,
+        message: WalletMessage | BaseMessageBuilder,
+        params: t.Any | None = None,
+    ) -> ExternalMessage:
+        """Sign with the local seqno and send a single transfer.
+
+        :param message: Internal message or message builder.
+        :param params: Transaction parameters, or ``None``; ``seqno`` is overwritten.
+        :return: Sent ``ExternalMessage``.
+        """
+        return await self.batch_transfer_message([message], params)
+
+    async def transfer(
+        self,
+        destination: AddressLike,
+        amount: int,
+        body: Cell | str | None = None,
+        state_init: StateInit | None = None,
+        send_mode: SendMode | int = DEFAULT_SENDMODE,
+        bounce: bool | None = None,
+        params: t.Any | None = None,
+    ) -> ExternalMessage:
+        """Sign with the local seqno and send a simple TON transfer.
+
+        :param destination: Recipient address.
+        :param amount: Amount in nanotons.
+        :param body: Message body (``Cell`` or text comment), or ``None``.
+        :param state_init: ``StateInit`` for deployment, or ``None``.
+        :param send_mode: Send mode flags.
+        :param bounce: Bounce on error, or ``None`` for auto-detect.
+        :param params: Transaction parameters, or ``None``; ``seqno`` is overwritten.
+        :return: Sent ``ExternalMessage``.
+        """
+        message = TONTransferBuilder(
+            destination=destination,
+            amount=amount,
+            body=body,
+            state_init=state_init,
+            send_mode=send_mode,
+            bounce=bounce,
+        )
+        return await self.transfer_message(message, params)
+
+    async def close(self) -> None:
+        """Cancel pending delivery watchers."""
+        watchers, self._watchers = self._watchers, set()
+        for watcher in watchers:
+            watcher.cancel()
+        await asyncio.gather(*watchers, return_exceptions=True)
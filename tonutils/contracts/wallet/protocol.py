@@ -7,7 +7,7 @@ from ton_core import DEFAULT_SENDMODE, WorkchainID
 from tonutils.contracts.protocol import ContractProtocol
 
 if t.TYPE_CHECKING:
-    from ton_core import AddressLike, Cell, PrivateKey, PublicKey, SendMode, StateInit, WalletMessage
+    from ton_core import Address, AddressLike, Cell, PrivateKey, PublicKey, SendMode, StateInit, WalletMessage
 
     from tonutils.clients.protocol import ClientProtocol
     from tonutils.contracts.wallet.messages import (
@@ -107,15 +107,24 @@ class WalletProtocol(ContractProtocol[_D], t.Protocol[_D, _C, _P]):
         :return: Tuple of (wallet, public_key, private_key, mnemonic_list).
         """
 
+    async def get_jetton_wallet_address(self, jetton_master_address: AddressLike) -> Address:
+        """Resolve this wallet's jetton wallet address for a jetton master.
+
+        :param jetton_master_address: Jetton master address.
+        :return: Jetton wallet address owned by this wallet.
+        """
+
     async def build_external_message(
         self,
         messages: t.Sequence[WalletMessage | BaseMessageBuilder],
         params: _P | None = None,
+        refresh: bool = True,
     ) -> ExternalMessage:
         """Build a signed external message.
 
         :param messages: Internal messages or message builders.
         :param params: Transaction parameters, or ``None``.
+        :param refresh: Refresh wallet state first; ``False`` uses the loaded state.
         :return: Signed ``ExternalMessage``.
         """
 
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing as t
+
+from ton_core import DEFAULT_SENDMODE, HashMap, SendMode, WalletHighloadV3Params
+
+from tonutils.exceptions import ContractError
+
+if t.TYPE_CHECKING:
+    from ton_core import Cell, Slice, WalletMessage
+
+    from tonutils.contracts.wallet.messages import BaseMessageBuilder, ExternalMessage
+    from tonutils.contracts.wallet.versions import WalletHighloadV3R1
+
+QUERY_ID_BITS: t.Final[int] = 23
+"""Bit length of a highload v3 ``query_id``."""
+
+BIT_NUMBER_BITS: t.Final[int] = 10
+"""Low ``query_id`` bits selecting a bit within a ``queries`` dictionary value."""
+
+MAX_BIT_NUMBER: t.Final[int] = 1022
+"""Largest bit number accepted by the contract (values hold 1023 bits)."""
+
+
+class HighloadSender:
+    """Pipelined sender for ``WalletHighloadV3R1``.
+
+    Allocates unique query_ids sequentially and signs and sends batches
+    concurrently. A query_id is reused only once its previous message
+    has expired (``created_at`` older than the wallet ``timeout``) and
+    the wallet's ``queries`` / ``old_queries`` dictionaries no longer
+    hold it, which ``sync()`` reads from the on-chain state.
+
+    :param wallet: Highload v3 wallet with a private key.
+    :param concurrency: Maximum number of batches signed and sent at once.
+    :param query_id: First query_id to allocate (e.g. ``next_query_id``
+        persisted by a previous run).
+    :param sync_margin: Extra seconds beyond ``timeout`` before a used
+        query_id is considered for reuse, covering clock skew and the
+        age of the synced state.
+    :raises ContractError: If ``concurrency`` or ``query_id`` is out of range.
+    """
+
+    def __init__(
+        self,
+        wallet: WalletHighloadV3R1,
+        concurrency: int = 16,
+        query_id: int = 0,
+        sync_margin: int = 60,
+    ) -> None:
+        if concurrency < 1:
+            raise ContractError(wallet, f"Invalid concurrency: {concurrency}. Expected >= 1.")
+        if not (0 <= query_id < (1 << QUERY_ID_BITS)):
+            raise ContractError(
+                wallet,
+                f"Invalid query_id: {query_id}. Expected 0..{(1 << QUERY_ID_BITS) - 1} (unsigned 23-bit).",
+            )
+        self._wallet = wallet
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._lock = asyncio.Lock()
+        self._sync_margin = sync_margin
+
+        self._cursor = self._normalize(query_id)
+        self._used: dict[int, int] = {}
+        self._blocked: set[int] = set()
+        self._synced = False
+
+    @property
+    def next_query_id(self) -> int:
+        """Next query_id candidate; persist it to resume after a restart."""
+        return self._cursor
+
+    @property
+    def in_flight(self) -> int:
+        """Number of query_ids that are not yet known to be expired."""
+        return len(self._used)
+
+    @staticmethod
+    def _normalize(query_id: int) -> int:
+        """Wrap a query_id into range, skipping the reserved bit number."""
+        query_id %= 1 << QUERY_ID_BITS
+        if query_id & ((1 << BIT_NUMBER_BITS) - 1) > MAX_BIT_NUMBER:
+            query_id = (query_id + 1) % (1 << QUERY_ID_BITS)
+        return query_id
+
+    @staticmethod
+    def _parse_queries(queries: Cell | None) -> set[int]:
+        """Decode a ``queries`` dictionary into the set of query_ids it holds.
+
+        :param queries: Dictionary cell keyed by ``query_id >> 10``, or ``None``.
+        :return: Stored query_ids.
+        """
+        if queries is None:
+            return set()
+
+        result: set[int] = set()
+        parsed = HashMap.parse(queries.begin_parse(), 13) or {}
+        for shift, value in t.cast("dict[int, Slice]", parsed).items():
+            size = value.remaining_bits
+            bitmap = value.preload_uint(size) if size else 0
+            for bit_number in range(size):
+                if bitmap >> (size - 1 - bit_number) & 1:
+                    result.add(shift << BIT_NUMBER_BITS | bit_number)
+        return result
+
+    async def sync(self) -> None:
+        """Reconcile allocation state with the on-chain wallet.
+
+        Reads the ``queries`` / ``old_queries`` dictionaries and drops
+        locally used query_ids whose messages can no longer be accepted.
+
+        :raises ContractError: If the on-chain ``timeout`` differs from the wallet config.
+        """
+        await self._wallet.refresh()
+        now = int(time.time())
+        timeout = self._wallet.config.timeout
+
+        blocked: set[int] = set()
+        if self._wallet.is_active:
+            data = self._wallet.state_data
+            if data.timeout != timeout:
+                raise ContractError(
+                    self._wallet,
+                    f"On-chain timeout {data.timeout} s does not match config timeout {timeout} s.",
+                    hint="Create the wallet with the same WalletHighloadV3Config(timeout=...) it was deployed with.",
+                )
+            blocked = self._parse_queries(data.old_queries) | self._parse_queries(data.queries)
+
+        horizon = now - timeout - self._sync_margin
+        self._used = {q: created_at for q, created_at in self._used.items() if created_at > horizon}
+        self._blocked = blocked
+        self._synced = True
+
+    async def allocate(
+        self,
+        value_to_send: int | None = None,
+        send_mode: SendMode | int = DEFAULT_SENDMODE,
+    ) -> WalletHighloadV3Params:
+        """Allocate a unique query_id and return transaction parameters.
+
+        :param value_to_send: Total value in nanotons, or ``None`` to sum messages.
+        :param send_mode: Send mode of the internal transfer to the wallet itself.
+        :return: ``WalletHighloadV3Params`` with ``query_id`` and ``created_at`` set.
+        :raises ContractError: If every query_id is still in use.
+        """
+        async with self._lock:
+            if not self._synced:
+                await self.sync()
+
+            params = WalletHighloadV3Params(value_to_send=value_to_send, send_mode=send_mode)
+            created_at = t.cast("int", params.created_at)
+            resynced = False
+
+            for _ in range(1 << QUERY_ID_BITS):
+                query_id = self._cursor
+                used_at = self._used.get(query_id)
+                if used_at is not None:
+                    horizon = int(time.time()) - self._wallet.config.timeout - self._sync_margin
+                    if resynced or used_at > horizon:
+                        break
+                    await self.sync()
+                    resynced = True
+                    continue
+
+                self._cursor = self._normalize(query_id + 1)
+                if query_id in self._blocked:
+                    continue
+
+                self._used[query_id] = created_at
+                params.query_id = query_id
+                return params
+
+        raise ContractError(
+            self._wallet,
+            f"No free query_id: {len(self._used)} sent within the last "
+            f"{self._wallet.config.timeout + self._sync_margin} s.",
+            hint="Send fewer, larger batches or wait for earlier messages to expire.",
+        )
+
+    async def send(
+        self,
+        messages: t.Sequence[WalletMessage | BaseMessageBuilder],
+        value_to_send: int | None = None,
+        send_mode: SendMode | int = DEFAULT_SENDMODE,
+    ) -> ExternalMessage:
+        """Sign and send one batch under a freshly allocated query_id.
+
+        :param messages: Internal messages or message builders.
+        :param value_to_send: Total value in nanotons, or ``None`` to sum messages.
+        :param send_mode: Send mode of the internal transfer to the wallet itself.
+        :return: Sent ``ExternalMessage``.
+        """
+        async with self._semaphore:
+            params = await self.allocate(value_to_send, send_mode)
+            return await self._wallet.batch_transfer_message(messages, params)
+
+    async def send_many(
+        self,
+        batches: t.Iterable[t.Sequence[WalletMessage | BaseMessageBuilder]],
+        send_mode: SendMode | int = DEFAULT_SENDMODE,
+    ) -> list[ExternalMessage]:
+        """Sign and send batches concurrently, one query_id per batch.
+
+        :param batches: Batches of internal messages or message builders.
+        :param send_mode: Send mode of the internal transfer to the wallet itself.
+        :return: Sent ``ExternalMessage`` objects in batch order.
+        """
+        return list(await asyncio.gather(*(self.send(batch, send_mode=send_mode) for batch in batches)))
+
+    async def is_processed(self, query_id: int) -> bool:
+        """Check whether the wallet has processed a query_id.
+
+        :param query_id: Query identifier returned in the send parameters.
+        :return: ``True`` if the query is recorded as processed.
+        """
+        return await self._wallet.processed(query_id, need_clean=False)
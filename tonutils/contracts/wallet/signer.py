@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import typing as t
+
+from ton_core import WalletMessage
+
+from tonutils.contracts.hashing import map_in_processes
+from tonutils.contracts.wallet.messages import ExternalMessage
+from tonutils.exceptions import ClientError, ContractError
+
+if t.TYPE_CHECKING:
+    from ton_core import Address, BaseWalletConfig, BaseWalletParams, NetworkGlobalID, PrivateKey, StateInit
+
+    from tonutils.contracts.wallet.base import BaseWallet
+    from tonutils.contracts.wallet.messages import BaseMessageBuilder
+    from tonutils.types import ContractInfo
+
+SigningJob = tuple[
+    "BaseWallet[t.Any, t.Any, t.Any]",
+    t.Sequence["WalletMessage | BaseMessageBuilder"],
+    "BaseWalletParams | None",
+]
+"""Wallet, its messages, and transaction parameters to sign."""
+
+_SigningTask = tuple[
+    "type[BaseWallet[t.Any, t.Any, t.Any]]",
+    "NetworkGlobalID",
+    "Address",
+    "StateInit | None",
+    "ContractInfo | None",
+    "BaseWalletConfig",
+    "PrivateKey",
+    "list[WalletMessage]",
+    "BaseWalletParams | None",
+]
+
+
+class _OfflineClient:
+    """Client stand-in for worker processes: exposes only the network."""
+
+    def __init__(self, network: NetworkGlobalID) -> None:
+        self.network = network
+
+    def __getattr__(self, name: str) -> t.Any:
+        raise ClientError(
+            f"Offline signing has no network access (`{name}` requested).",
+            hint="Load wallet state with refresh() or pass explicit params before signing.",
+        )
+
+
+async def _sign_tasks_async(tasks: list[_SigningTask]) -> list[bytes]:
+    """Rebuild each wallet offline and serialize its signed external message."""
+    result: list[bytes] = []
+    for wallet_class, network, address, state_init, info, config, private_key, messages, params in tasks:
+        client = t.cast("t.Any", _OfflineClient(network))
+        wallet = wallet_class(client, address, state_init, info, config, private_key)
+        body = await wallet._build_signed_msg_cell(messages, params)
+        active = info is not None and wallet.is_active
+        message = ExternalMessage(dest=address, body=body, state_init=None if active else state_init)
+        result.append(message.to_boc())
+    return result
+
+
+def _sign_tasks(tasks: list[_SigningTask]) -> list[bytes]:
+    """Sign a chunk of tasks in a worker process.
+
+    :param tasks: Picklable signing tasks.
+    :return: External message BoCs in task order.
+    """
+    return asyncio.run(_sign_tasks_async(tasks))
+
+
+async def sign_external_messages(
+    jobs: t.Sequence[SigningJob],
+    processes: int | None = None,
+) -> list[bytes]:
+    """Build and sign external messages for many wallets in a process pool.
+
+    Message builders are resolved on the calling event loop; cell
+    building, hashing and ed25519 signing run in worker processes.
+    Nothing is fetched from the network: seqno comes from ``params``
+    or from the wallet state already loaded with ``refresh()``, and
+    wallets without loaded state get their ``state_init`` attached.
+
+    :param jobs: ``(wallet, messages, params)`` tuples. Wallets must hold a private key.
+    :param processes: Number of worker processes, or ``None`` for all cores.
+    :return: Serialized ``ExternalMessage`` BoCs in job order, ready for ``send_message``.
+    :raises ContractError: If a wallet has no private key or a job fails validation.
+    """
+    if not jobs:
+        return []
+
+    resolved = await asyncio.gather(*(wallet._resolve_messages(messages) for wallet, messages, _ in jobs))
+
+    tasks: list[_SigningTask] = []
+    for (wallet, _, params), messages in zip(jobs, resolved):
+        if wallet.private_key is None:
+            raise ContractError(
+                wallet,
+                f"Cannot sign message: `private_key` is not set for wallet `{wallet.VERSION!r}`.",
+                hint="Use .from_mnemonic() or .from_private_key() to create a wallet with signing capability.",
+            )
+        wallet._validate_message_count(messages)
+        wallet._validate_params_type(params)
+        tasks.append(
+            (
+                type(wallet),
+                wallet.client.network,
+                wallet.address,
+                wallet.state_init,
+                wallet._info,
+                wallet.config,
+                wallet.private_key,
+                messages,
+                params,
+            )
+        )
+
+    processes = min(processes or os.cpu_count() or 1, len(tasks))
+    if processes == 1:
+        return await asyncio.to_thread(_sign_tasks, tasks)
+    return await asyncio.to_thread(map_in_processes, _sign_tasks, tasks, processes)
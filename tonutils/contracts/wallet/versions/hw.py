@@ -6,7 +6,6 @@ from ton_core import (
     ContractVersion,
     HashMap,
     OpCode,
-    OutActionSendMsg,
     WalletHighloadV2Config,
     WalletHighloadV2Data,
     WalletHighloadV2Params,
@@ -105,7 +104,7 @@ class WalletHighloadV3R1(
     GetLastCleanTimeGetMethod,
     GetTimeoutGetMethod,
 ):
-    """Highload Wallet v3 Revision 1 -- recursive out-action packing, up to 64516 messages per transaction."""
+    """Highload Wallet v3 Revision 1 -- nested out-action packing, up to 64516 messages per transaction."""
 
     _data_model = WalletHighloadV3Data
     _config_model = WalletHighloadV3Config
@@ -130,14 +129,33 @@ class WalletHighloadV3R1(
         cell.store_ref(actions_cell)
         return cell.end_cell()
 
+    @staticmethod
+    def _build_actions_cell(messages: list[WalletMessage]) -> Cell:
+        """Build the out-actions list, each action referencing the previous one.
+
+        :param messages: Wallet messages to serialize as send actions.
+        :return: Serialized out-actions ``Cell``.
+        """
+        actions_cell = Cell.empty()
+        for msg in messages:
+            cell = begin_cell()
+            cell.store_ref(actions_cell)
+            cell.store_uint(OpCode.OUT_ACTION_SEND_MSG, 32)
+            cell.store_uint(msg.send_mode, 8)
+            cell.store_ref(msg.message.serialize())
+            actions_cell = cell.end_cell()
+        return actions_cell
+
     def _build_msg_to_send(
         self,
         messages: list[WalletMessage],
         params: WalletHighloadV3Params,
     ) -> WalletMessage:
-        """Build recursive message structure for large batches.
+        """Build nested message structure for large batches.
 
-        Splits messages into packs of 253 with nested internal transfers.
+        Splits messages into packs of 253 and builds them bottom-up, the
+        last pack first; every earlier pack carries the internal transfer
+        of the next one as its final action.
 
         :param messages: Wallet messages to pack.
         :param params: Transaction parameters.
@@ -145,25 +163,25 @@ class WalletHighloadV3R1(
         """
         msgs_per_pack = 253
 
-        if len(messages) > msgs_per_pack:
-            rest = self._build_msg_to_send(messages[msgs_per_pack:], params)
-            messages = [*messages[:msgs_per_pack], rest]
-
-        actions_cell, amount = Cell.empty(), 0
-        for msg in messages:
-            action = OutActionSendMsg(msg)
-            action_cell = begin_cell()
-            action_cell.store_ref(actions_cell)
-            action_cell.store_cell(action.serialize())
-            actions_cell = action_cell.end_cell()
-            info = msg.message.info
-            if hasattr(info, "value"):
-                amount += info.value.grams
-
-        value = amount if params.value_to_send is None else params.value_to_send
-        body = self._build_internal_transfer(actions_cell, params)
-        message = InternalMessage(dest=self.address, value=value, body=body)
-        return WalletMessage(send_mode=params.send_mode, message=message)
+        msg_to_send: WalletMessage | None = None
+        for start in reversed(range(0, len(messages), msgs_per_pack)):
+            pack = messages[start : start + msgs_per_pack]
+            if msg_to_send is not None:
+                pack.append(msg_to_send)
+
+            amount = 0
+            for msg in pack:
+                info = msg.message.info
+                if hasattr(info, "value"):
+                    amount += info.value.grams
+
+            value = amount if params.value_to_send is None else params.value_to_send
+            body = self._build_internal_transfer(self._build_actions_cell(pack), params)
+            message = InternalMessage(dest=self.address, value=value, body=body)
+            msg_to_send = WalletMessage(send_mode=params.send_mode, message=message)
+
+        assert msg_to_send is not None
+        return msg_to_send
 
     async def _build_msg_cell(
         self,
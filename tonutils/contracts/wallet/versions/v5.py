@@ -41,7 +41,7 @@ from tonutils.contracts.wallet.methods import (
     IsSignatureAllowedGetMethod,
     SeqnoGetMethod,
 )
-from tonutils.exceptions import ClientError, StateNotLoadedError
+from tonutils.exceptions import ClientError
 from tonutils.providers.http.tonapi.models import (
     BlockchainMessagePayload,
     GaslessConfigResult,
@@ -370,18 +370,12 @@ class WalletV5R1(
     _params_model = WalletV5Params
     VERSION = ContractVersion.WalletV5R1
 
-    @property
-    def state_data(self) -> WalletV5Data:
-        """Decoded on-chain wallet state data."""
-        if not (self._info and self._info.data):
-            raise StateNotLoadedError(self, missing="state_data")
-
+    def _decode_state_data(self, data: Cell) -> WalletV5Data:
+        """Deserialize wallet data using the client network for the subwallet ID."""
         network = self.client.network
         if network == NetworkGlobalID.TETRA:
             network = NetworkGlobalID.MAINNET
-
-        cs = self._info.data.begin_parse()
-        return self._data_model.deserialize(cs, network)
+        return self._data_model.deserialize(data.begin_parse(), network)
 
     async def _build_msg_cell(
         self,
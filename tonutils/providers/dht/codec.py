@@ -4,6 +4,7 @@ import hashlib
 import socket
 import struct
 import typing as t
+from collections import OrderedDict
 
 from nacl.signing import SigningKey, VerifyKey
 from ton_core import AdnlAddressListConfig, PublicKey, TlGenerator, get_random
@@ -29,9 +30,22 @@ class DhtCodec:
     Owns the ``TlGenerator`` schema registry.  Every TL operation
     in the DHT stack goes through this class so that no other layer
     needs to import or know about TL.
+
+    Successful Ed25519 verifications are remembered in a bounded LRU
+    keyed by ``(public key, signature, SHA-256 of the signed payload)``,
+    so node and value records returned by many peers are verified once.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, signature_cache_size: int = 4096) -> None:
+        """Initialize the codec.
+
+        :param signature_cache_size: Maximum number of remembered verified
+            signatures; ``0`` disables the cache.
+        """
+        self._verified: OrderedDict[tuple[bytes, bytes, bytes], None] = OrderedDict()
+        self._verified_max = signature_cache_size
+        self._cache_hits = 0
+        self._cache_misses = 0
         self.tl = TlGenerator.with_default_schemas().generate()
 
         def _s(name: str) -> TlSchema:
@@ -55,6 +69,40 @@ class DhtCodec:
         self._s_pub_overlay: TlSchema = _s("pub.overlay")
         self._s_overlay_to_sign: TlSchema = _s("overlay.node.toSign")
 
+    @property
+    def signature_cache_hits(self) -> int:
+        """Signature checks answered from the cache."""
+        return self._cache_hits
+
+    @property
+    def signature_cache_misses(self) -> int:
+        """Signature checks that ran Ed25519 verification."""
+        return self._cache_misses
+
+    @property
+    def signature_cache_hit_rate(self) -> float:
+        """Share of signature checks answered from the cache."""
+        total = self._cache_hits + self._cache_misses
+        return self._cache_hits / total if total else 0.0
+
+    def _verify(self, pub_key: bytes, message: bytes, signature: bytes) -> None:
+        """Verify an Ed25519 signature, skipping already verified ones.
+
+        :raises nacl.exceptions.BadSignatureError: If the signature is invalid.
+        """
+        cache_key = (pub_key, signature, hashlib.sha256(message).digest())
+        if cache_key in self._verified:
+            self._cache_hits += 1
+            self._verified.move_to_end(cache_key)
+            return
+
+        self._cache_misses += 1
+        VerifyKey(pub_key).verify(message, signature)
+        if self._verified_max > 0:
+            self._verified[cache_key] = None
+            if len(self._verified) > self._verified_max:
+                self._verified.popitem(last=False)
+
     def serialize_find_node(self, key: bytes, k: int) -> bytes:
         """Serialize ``dht.findNode`` query."""
         return self.tl.serialize(self._s_find_node, {"key": key.hex(), "k": k})
@@ -107,7 +155,7 @@ class DhtCodec:
             node_copy["signature"] = b""
             schema = self._s_node
             signed_msg = self.tl.serialize(schema, node_copy)
-            VerifyKey(pub_key).verify(signed_msg, signature)
+            self._verify(pub_key, signed_msg, signature)
 
             addr_list = node_tl.get("addr_list", {})
             addrs = addr_list.get("addrs", [])
@@ -127,11 +175,28 @@ class DhtCodec:
                 host = str(ip_int)
 
             adnl_id = compute_key_id(pub_key)
-            return DhtNode(adnl_id=adnl_id, addr=f"{host}:{port}", server_key=pub_key)
+            return DhtNode(adnl_id=adnl_id, addr=f"{host}:{port}", server_key=pub_key, record=node_tl)
 
         except Exception:
             return None
 
+    def serialize_node(self, node_tl: dict[str, t.Any]) -> bytes:
+        """Serialize a signed ``dht.node`` TL dict."""
+        return self.tl.serialize(self._s_node, node_tl)
+
+    def parse_node_bytes(self, data: bytes) -> DhtNode | None:
+        """Deserialize and verify a signed ``dht.node`` record.
+
+        Returns ``None`` on any validation failure.
+        """
+        try:
+            node_tl, _ = self.deserialize(data)
+        except Exception:
+            return None
+        if not isinstance(node_tl, dict):
+            return None
+        return self.parse_node(node_tl)
+
     def parse_value(self, data: dict[str, t.Any]) -> DhtValue | None:
         """Parse ``dht.value`` TL dict into a ``DhtValue`` model."""
         try:
@@ -350,7 +415,6 @@ class DhtCodec:
         if not pub_key:
             raise ValueError("no public key for signature verification")
 
-        vk = VerifyKey(pub_key)
         id_tl: dict[str, t.Any] = {"@type": "pub.ed25519", "key": pub_key.hex()}
         key_tl: dict[str, t.Any] = {
             "id": kd.key.id.hex(),
@@ -374,7 +438,7 @@ class DhtCodec:
                 "signature": b"",
             }
             signed_data = self.tl.serialize(self._s_value, value_tl)
-            vk.verify(signed_data, dht_value.signature)
+            self._verify(pub_key, signed_data, dht_value.signature)
 
         if kd.signature:
             desc_tl: dict[str, t.Any] = {
@@ -384,7 +448,7 @@ class DhtCodec:
                 "signature": b"",
             }
             signed_data = self.tl.serialize(self._s_key_desc, desc_tl)
-            vk.verify(signed_data, kd.signature)
+            self._verify(pub_key, signed_data, kd.signature)
 
     def _verify_overlay_nodes(self, dht_value: DhtValue) -> None:
         """Verify overlay node signatures.
@@ -430,7 +494,7 @@ class DhtCodec:
                     "version": node_data.get("version", 0),
                 },
             )
-            VerifyKey(pub_key_raw).verify(to_sign, signature)
+            self._verify(pub_key_raw, to_sign, signature)
 
     @staticmethod
     def _parse_key_description(data: dict[str, t.Any]) -> DhtKeyDescription:
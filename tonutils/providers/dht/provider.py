@@ -37,6 +37,8 @@ class DhtProvider:
         k: int = 7,
         connect_timeout: float = 5.0,
         request_timeout: float = 3.0,
+        sockets: int = 1,
+        reuse_port: bool = False,
     ) -> None:
         """Initialize the DHT provider.
 
@@ -44,15 +46,18 @@ class DhtProvider:
         :param k: Kademlia replication parameter.
         :param connect_timeout: Timeout in seconds for initial node connection.
         :param request_timeout: Timeout in seconds for a single DHT query.
+        :param sockets: Number of UDP sockets; peers are sharded across
+            them and each socket gets its own reader.
+        :param reuse_port: Share one port between the sockets with ``SO_REUSEPORT``.
         """
         self._config_nodes = list(nodes)
         self._k = k
         self._connect_timeout = connect_timeout
         self._request_timeout = request_timeout
 
-        self._transport = AdnlUdpTransport()
+        self._transport = AdnlUdpTransport(sockets=sockets, reuse_port=reuse_port)
         self._codec = DhtCodec()
-        self._reader = DhtReaderWorker(self)
+        self._readers = [DhtReaderWorker(self, shard=shard) for shard in range(sockets)]
 
         self._pending: dict[str, asyncio.Future[t.Any]] = {}
         self._loop: asyncio.AbstractEventLoop | None = None
@@ -104,11 +109,14 @@ class DhtProvider:
 
         self._loop = asyncio.get_running_loop()
         await self._transport.bind()
-        await self._reader.start()
+        for reader in self._readers:
+            await reader.start()
 
-    async def connect(self) -> list[tuple[bytes, DhtNode]]:
+    async def connect(self, lazy: bool = False) -> list[tuple[bytes, DhtNode]]:
         """Bind UDP socket, start reader, connect to initial nodes.
 
+        :param lazy: Skip channel establishment and return every config
+            node; channels are then opened on first query.
         :return: List of ``(adnl_id, DhtNode)`` pairs for successfully
             connected nodes.
         """
@@ -117,6 +125,10 @@ class DhtProvider:
 
         await self.bind()
 
+        if lazy:
+            self._connected = True
+            return [(dht_node.adnl_id, dht_node) for dht_node in map(self._config_node, self._config_nodes)]
+
         tasks = [self._connect_initial_node(node) for node in self._config_nodes]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -127,6 +139,18 @@ class DhtProvider:
 
         return connected_nodes
 
+    @staticmethod
+    def _config_node(node: DhtNodeConfig) -> DhtNode:
+        """Build a ``DhtNode`` from a config entry without connecting."""
+        from tonutils.clients.dht.models import DhtNode as _DhtNode
+        from tonutils.clients.dht.models import compute_key_id
+
+        return _DhtNode(
+            adnl_id=compute_key_id(node.pub_key),
+            addr=f"{node.host}:{node.port}",
+            server_key=node.pub_key,
+        )
+
     async def _connect_initial_node(
         self,
         node: DhtNodeConfig,
@@ -137,19 +161,11 @@ class DhtProvider:
         :return: ``(adnl_id, DhtNode)`` on success, ``None`` on failure.
         """
         try:
-            from tonutils.clients.dht.models import DhtNode as _DhtNode
-            from tonutils.clients.dht.models import compute_key_id
-
             host = node.host
             port = node.port
             pub_key = node.pub_key
-            adnl_id = compute_key_id(pub_key)
-
-            dht_node = _DhtNode(
-                adnl_id=adnl_id,
-                addr=f"{host}:{port}",
-                server_key=pub_key,
-            )
+            dht_node = self._config_node(node)
+            adnl_id = dht_node.adnl_id
 
             query_payload = self._codec.serialize_get_signed_address_list()
             query_id = get_random(32)
@@ -187,7 +203,8 @@ class DhtProvider:
     async def close(self) -> None:
         """Stop reader, cancel pending queries, and close transport."""
         self._connected = False
-        await self._reader.stop()
+        for reader in self._readers:
+            await reader.stop()
 
         for fut in self._pending.values():
             if not fut.done():
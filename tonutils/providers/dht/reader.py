@@ -20,14 +20,20 @@ class DhtReaderWorker(BaseWorker):
 
     - ``confirmChannel`` → transport (channel pending futures)
     - ``answer`` → provider (query pending futures)
+
+    Each transport socket has its own reader; all of them resolve the
+    provider's shared pending-query table. The shard 0 reader also
+    handles channel datagrams inline.
     """
 
-    def __init__(self, provider: DhtProvider) -> None:
+    def __init__(self, provider: DhtProvider, shard: int = 0) -> None:
         """Initialize the reader worker.
 
         :param provider: Parent DHT provider.
+        :param shard: Index of the transport socket to drain.
         """
         super().__init__(provider)
+        self._shard = shard
         self._parts: dict[str, dict[int, bytes]] = {}
         self._part_totals: dict[str, int] = {}
         self._part_timestamps: dict[str, float] = {}
@@ -180,44 +186,75 @@ class DhtReaderWorker(BaseWorker):
                 if inner:
                     self._dispatch_message(inner[0])
 
-    async def _run(self) -> None:
-        """Continuously read UDP datagrams, decrypt, and dispatch."""
+    def _process(self, raw: bytes, addr: tuple[str, int]) -> None:
+        """Decrypt, deserialize and dispatch one datagram.
+
+        :param raw: Raw datagram bytes.
+        :param addr: Sender ``(host, port)`` tuple.
+        """
+        if len(raw) < 64:
+            return
+
         transport = self.provider.transport
-        codec = self.provider.codec
+        try:
+            plaintext, peer_state = transport.decrypt_incoming(raw)
+        except ValueError:
+            return
+        if not plaintext:
+            return
 
-        while self.running:
-            try:
-                raw, addr = await transport.recv_raw()
-            except OSError:
-                continue
+        if peer_state is None:
+            endpoint = f"{addr[0]}:{addr[1]}"
+            peer_state = transport.get_peer(endpoint)
 
-            if len(raw) < 64:
-                continue
+        try:
+            root = self.provider.codec.deserialize(plaintext)
+        except (ValueError, struct.error):
+            return
 
-            plaintext, peer_state = transport.decrypt_incoming(raw)
-            if not plaintext:
-                continue
+        if not root:
+            return
 
-            if peer_state is None:
-                endpoint = f"{addr[0]}:{addr[1]}"
-                peer_state = transport.get_peer(endpoint)
+        packet = root[0]
+        tl_type = packet.get("@type", "")
 
-            try:
-                root = codec.deserialize(plaintext)
-            except (ValueError, struct.error):
-                continue
+        if "packetContents" in tl_type:
+            if peer_state is not None:
+                self._update_peer_state(peer_state, packet)
 
-            if not root:
-                continue
+            for msg in self._extract_messages(packet):
+                self._dispatch_message(msg)
+        else:
+            self._dispatch_message(packet)
+
+    def _process_inline(self, raw: bytes, addr: tuple[str, int]) -> None:
+        """Process a channel datagram from the protocol callback without raising."""
+        try:
+            self._process(raw, addr)
+        except Exception:
+            return
 
-            packet = root[0]
-            tl_type = packet.get("@type", "")
+    async def start(self) -> None:
+        """Start the reader; the shard 0 reader also handles channel datagrams inline."""
+        await super().start()
+        if self._shard == 0:
+            self.provider.transport.set_inline_handler(self._process_inline)
 
-            if "packetContents" in tl_type:
-                if peer_state is not None:
-                    self._update_peer_state(peer_state, packet)
+    async def stop(self) -> None:
+        """Stop inline handling and the reader."""
+        if self._shard == 0:
+            self.provider.transport.set_inline_handler(None)
+        await super().stop()
+
+    async def _run(self) -> None:
+        """Drain queued UDP datagrams in batches, decrypt, and dispatch."""
+        transport = self.provider.transport
+
+        while self.running:
+            try:
+                batch = await transport.recv_batch(self._shard)
+            except OSError:
+                continue
 
-                for msg in self._extract_messages(packet):
-                    self._dispatch_message(msg)
-            else:
-                self._dispatch_message(packet)
+            for raw, addr in batch:
+                self._process(raw, addr)
@@ -21,7 +21,6 @@ from ton_core import (
     VmStack,
     WorkchainID,
     begin_cell,
-    cell_to_hex,
     check_account_proof,
     crc16,
     deserialize_shard_hashes,
@@ -111,6 +110,15 @@ class LiteProvider:
         """Last known masterchain block ID, or ``None`` if not yet fetched."""
         return self.updater.last_mc_block
 
+    @property
+    def wait_timeout_ms(self) -> int:
+        """Server-side ``waitMasterchainSeqno`` timeout in milliseconds.
+
+        Half of ``request_timeout``, so the server answers before the
+        client-side timeout fires.
+        """
+        return int(self.request_timeout * 1000) // 2
+
     @property
     def last_ping_age(self) -> float | None:
         """Seconds since the last successful ping, or ``None``."""
@@ -246,19 +254,23 @@ class LiteProvider:
             self._retry_policy,
         )
 
-    async def send_liteserver_query(
+    def _build_liteserver_query(
         self,
         method: str,
         data: dict[str, t.Any] | None = None,
         *,
-        priority: bool = False,
-    ) -> dict[str, t.Any]:
-        """Send a lite-server query by TL method name.
+        wait_seqno: int | None = None,
+        wait_timeout_ms: int | None = None,
+    ) -> bytes:
+        """Serialize a ``liteServer.query`` wrapper for a TL method.
 
         :param method: Method name without ``liteServer.`` prefix.
         :param data: Method arguments.
-        :param priority: Use priority slot in the limiter.
-        :return: Decoded response dictionary.
+        :param wait_seqno: Masterchain seqno to prefix with
+            ``waitMasterchainSeqno``, or ``None`` for no prefix.
+        :param wait_timeout_ms: Server-side wait timeout in milliseconds,
+            or ``None`` for ``wait_timeout_ms``.
+        :return: Encoded ADNL TL-query bytes.
         """
         if data is None:
             data = {}
@@ -267,11 +279,45 @@ class LiteProvider:
         assert schema is not None
         inner = self.tl_schemas.serialize(schema, data)
 
+        if wait_seqno is not None:
+            wait_schema = self.tl_schemas.get_by_name("liteServer.waitMasterchainSeqno")
+            assert wait_schema is not None
+            if wait_timeout_ms is None:
+                wait_timeout_ms = self.wait_timeout_ms
+            wait_prefix = self.tl_schemas.serialize(
+                wait_schema,
+                {"seqno": wait_seqno, "timeout_ms": wait_timeout_ms},
+            )
+            inner = wait_prefix + inner
+
         assert self.ls_query_tl_schema is not None
-        query = self.tl_schemas.serialize(
+        return self.tl_schemas.serialize(
             self.ls_query_tl_schema,
             {"data": inner},
         )
+
+    async def send_liteserver_query(
+        self,
+        method: str,
+        data: dict[str, t.Any] | None = None,
+        *,
+        min_seqno: int | None = None,
+        priority: bool = False,
+    ) -> dict[str, t.Any]:
+        """Send a lite-server query by TL method name.
+
+        If ``min_seqno`` is set, the query is prefixed with
+        ``waitMasterchainSeqno`` so the server blocks until it has
+        applied that masterchain block instead of answering with stale
+        data or ``block is not in db``.
+
+        :param method: Method name without ``liteServer.`` prefix.
+        :param data: Method arguments.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
+        :param priority: Use priority slot in the limiter.
+        :return: Decoded response dictionary.
+        """
+        query = self._build_liteserver_query(method, data, wait_seqno=min_seqno)
         return await self.send_adnl_query(query, priority=priority)
 
     async def wait_masterchain_seqno(
@@ -292,25 +338,45 @@ class LiteProvider:
         :param priority: Use priority slot in the limiter.
         :return: Decoded response dictionary.
         """
-        if data is None:
-            data = {}
-
-        wait_schema = self.tl_schemas.get_by_name("liteServer.waitMasterchainSeqno")
-        assert wait_schema is not None
-        wait_prefix = self.tl_schemas.serialize(
-            wait_schema,
-            {"seqno": seqno, "timeout_ms": timeout_ms},
+        query = self._build_liteserver_query(
+            schema_name,
+            data,
+            wait_seqno=seqno,
+            wait_timeout_ms=timeout_ms,
         )
+        return await self.send_adnl_query(query, priority=priority)
 
-        suffix_schema = self.tl_schemas.get_by_name("liteServer." + schema_name)
-        assert suffix_schema is not None
-        suffix = self.tl_schemas.serialize(suffix_schema, data)
-        assert self.ls_query_tl_schema is not None
-        query = self.tl_schemas.serialize(
-            self.ls_query_tl_schema,
-            {"data": wait_prefix + suffix},
+    async def _resolve_mc_block(
+        self,
+        min_seqno: int | None = None,
+        *,
+        priority: bool = False,
+    ) -> BlockIdExt:
+        """Return a masterchain block to pin state queries to.
+
+        Uses the last known block; if it is behind ``min_seqno``, waits
+        server-side for that seqno and advances the updater.
+
+        :param min_seqno: Minimal masterchain seqno, or ``None``.
+        :param priority: Use priority slot in the limiter.
+        :return: Masterchain ``BlockIdExt`` with seqno ``>= min_seqno``.
+        """
+        if self.last_mc_block is None:
+            await self.updater.refresh()
+        assert self.last_mc_block is not None
+
+        if min_seqno is None or self.last_mc_block.seqno >= min_seqno:
+            return self.last_mc_block
+
+        raw = await self.wait_masterchain_seqno(
+            seqno=min_seqno,
+            timeout_ms=self.wait_timeout_ms,
+            schema_name="getMasterchainInfo",
+            priority=priority,
         )
-        return await self.send_adnl_query(query, priority=priority)
+        block = MasterchainInfo.from_dict(raw).last_block()
+        self.updater.advance(block)
+        return block
 
     async def get_time(self, *, priority: bool = False) -> int:
         """Fetch current network time from the lite-server.
@@ -367,6 +433,7 @@ class LiteProvider:
         lt: int | None = None,
         utime: int | None = None,
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> tuple[BlockIdExt, Block]:
         """Locate a block by workchain/shard and one of seqno, lt, or utime.
@@ -376,6 +443,7 @@ class LiteProvider:
         :param seqno: Block sequence number.
         :param lt: Logical time filter.
         :param utime: UNIX time filter.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: Tuple of ``BlockIdExt`` and deserialized ``Block``.
         """
@@ -404,6 +472,7 @@ class LiteProvider:
         result = await self.send_liteserver_query(
             "lookupBlock",
             data=data,
+            min_seqno=min_seqno,
             priority=priority,
         )
 
@@ -417,11 +486,13 @@ class LiteProvider:
         self,
         block: BlockIdExt,
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> tuple[BlockIdExt, Block]:
         """Fetch and deserialize a block header.
 
         :param block: Block identifier to query.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: Tuple of ``BlockIdExt`` and deserialized ``Block``.
         """
@@ -430,6 +501,7 @@ class LiteProvider:
         result = await self.send_liteserver_query(
             "getBlockHeader",
             data=data,
+            min_seqno=min_seqno,
             priority=priority,
         )
 
@@ -444,12 +516,14 @@ class LiteProvider:
         block: BlockIdExt,
         count: int = 1024,
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> list[Transaction]:
         """Fetch all transactions in a block.
 
         :param block: Target block identifier.
         :param count: Maximum transactions per request page.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: List of deserialized ``Transaction`` objects.
         """
@@ -462,6 +536,7 @@ class LiteProvider:
                 "count": count,
                 "want_proof": b"",
             },
+            min_seqno=min_seqno,
             priority=priority,
         )
 
@@ -505,23 +580,25 @@ class LiteProvider:
         self,
         block: BlockIdExt | None = None,
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> list[BlockIdExt]:
         """Fetch shard info for all workchains at a masterchain block.
 
         :param block: Masterchain block ID, or ``None`` for latest.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: List of shard ``BlockIdExt`` objects.
         """
-        if self.last_mc_block is None:
-            await self.updater.refresh()
-        block = block or self.last_mc_block
-        assert block is not None
+        if block is None:
+            block = await self._resolve_mc_block(min_seqno, priority=priority)
+            min_seqno = None
 
         data = {"id": block.to_dict()}
         result = await self.send_liteserver_query(
             method="getAllShardsInfo",
             data=data,
+            min_seqno=min_seqno,
             priority=priority,
         )
 
@@ -549,6 +626,7 @@ class LiteProvider:
         method_name: str,
         stack: list[t.Any],
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> list[t.Any]:
         """Execute a get-method on a contract.
@@ -556,13 +634,12 @@ class LiteProvider:
         :param address: Contract address.
         :param method_name: Name of the get-method.
         :param stack: TVM stack arguments.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: Decoded TVM stack result.
         :raises RunGetMethodError: If the method returns a non-zero exit code.
         """
-        if self.last_mc_block is None:
-            await self.updater.refresh()
-        assert self.last_mc_block is not None
+        mc_block = await self._resolve_mc_block(min_seqno, priority=priority)
 
         crc_id = int.from_bytes(crc16(method_name.encode()), byteorder="big")
         method_id = (crc_id & 0xFFFF) | 0x10000
@@ -570,7 +647,7 @@ class LiteProvider:
         account = address.to_tl_account_id()
 
         data = {
-            "id": self.last_mc_block.to_dict(),
+            "id": mc_block.to_dict(),
             "mode": 7,
             "account": account,
             "method_id": method_id,
@@ -599,18 +676,18 @@ class LiteProvider:
     async def get_config(
         self,
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> dict[int, t.Any]:
         """Fetch and decode full blockchain configuration.
 
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: Mapping of config parameter IDs to values.
         """
-        if self.last_mc_block is None:
-            await self.updater.refresh()
-        assert self.last_mc_block is not None
+        mc_block = await self._resolve_mc_block(min_seqno, priority=priority)
 
-        data = {"mode": 0, "id": self.last_mc_block.to_dict()}
+        data = {"mode": 0, "id": mc_block.to_dict()}
         result = await self.send_liteserver_query(
             method="getConfigAll",
             data=data,
@@ -624,20 +701,23 @@ class LiteProvider:
         self,
         address: Address,
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> ContractInfo:
         """Fetch contract state at the latest masterchain block.
 
+        With ``min_seqno`` the state is read at a masterchain block not
+        older than that seqno (read-after-write).
+
         :param address: Contract address.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: ``ContractInfo`` with balance, code, data, and last transaction.
         """
-        if self.last_mc_block is None:
-            await self.updater.refresh()
-        assert self.last_mc_block is not None
+        mc_block = await self._resolve_mc_block(min_seqno, priority=priority)
 
         data = {
-            "id": self.last_mc_block.to_dict(),
+            "id": mc_block.to_dict(),
             "account": address.to_tl_account_id(),
         }
         result = await self.send_liteserver_query(
@@ -672,6 +752,7 @@ class LiteProvider:
         from_lt: int,
         from_hash: str,
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> list[Transaction]:
         """Fetch a chain of transactions for an account.
@@ -680,6 +761,7 @@ class LiteProvider:
         :param count: Maximum transactions to return (<= 16).
         :param from_lt: Starting logical time.
         :param from_hash: Starting transaction hash.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: List of ``Transaction`` objects in reverse order.
         :raises ClientError: If ``count`` exceeds 16.
@@ -697,6 +779,7 @@ class LiteProvider:
         result = await self.send_liteserver_query(
             "getTransactions",
             data=data,
+            min_seqno=min_seqno,
             priority=priority,
         )
         cells = Cell.from_boc(result["transactions"])
@@ -722,20 +805,20 @@ class LiteProvider:
         self,
         address: Address,
         *,
+        min_seqno: int | None = None,
         priority: bool = False,
     ) -> tuple[Account | None, ShardAccount | None]:
         """Fetch account state and shard account from the lite-server.
 
         :param address: Account address.
+        :param min_seqno: Minimal masterchain seqno the server must reach, or ``None``.
         :param priority: Use priority slot in the limiter.
         :return: Tuple of (``Account`` or ``None``, ``ShardAccount`` or ``None``).
         """
-        if self.last_mc_block is None:
-            await self.updater.refresh()
-        assert self.last_mc_block is not None
+        mc_block = await self._resolve_mc_block(min_seqno, priority=priority)
 
         data = {
-            "id": self.last_mc_block.to_dict(),
+            "id": mc_block.to_dict(),
             "account": address.to_tl_account_id(),
         }
         result = await self.send_liteserver_query(
@@ -828,10 +911,8 @@ def build_contract_state_info(
     if simple_account.state is not None:
         state_init = simple_account.state.state_init
         if state_init is not None:
-            if state_init.code is not None:
-                info.code_raw = cell_to_hex(state_init.code)
-            if state_init.data is not None:
-                info.data_raw = cell_to_hex(state_init.data)
+            info.code = state_init.code
+            info.data = state_init.data
 
         info.state = ContractState(
             "uninit" if simple_account.state.type_ == "uninitialized" else simple_account.state.type_
@@ -32,6 +32,14 @@ class UpdaterWorker(BaseWorker):
         """Most recently known masterchain block."""
         return self._last_mc_block
 
+    def advance(self, block: BlockIdExt) -> None:
+        """Move the last block reference forward if ``block`` is newer.
+
+        :param block: Masterchain block observed by another query.
+        """
+        if self._last_mc_block is None or block.seqno > self._last_mc_block.seqno:
+            self._last_mc_block = block
+
     async def refresh(self) -> None:
         """Fetch current masterchain info and update the last block reference."""
         info = await self.provider.get_masterchain_info(priority=True)
@@ -1,6 +1,8 @@
-from . import block_scanner, status_monitor
+from . import block_scanner, delivery_tracker, dht_crawler, status_monitor
 
 __all__ = [
     "block_scanner",
+    "delivery_tracker",
+    "dht_crawler",
     "status_monitor",
 ]
@@ -0,0 +1,5 @@
+from .tracker import DeliveryTracker
+
+__all__ = [
+    "DeliveryTracker",
+]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+from collections import OrderedDict
+from contextlib import suppress
+
+from ton_core import Transaction, normalize_hash
+
+from tonutils.exceptions import ClientError
+from tonutils.tools.block_scanner.scanner import BlockScanner
+
+if t.TYPE_CHECKING:
+    from tonutils.clients import LiteBalancer, LiteClient
+    from tonutils.contracts.wallet.messages import ExternalMessage
+    from tonutils.tools.block_scanner.events import TransactionsEvent
+
+MessageRef = t.Union["ExternalMessage", str]
+
+
+class DeliveryTracker:
+    """Event-driven delivery confirmation for sent external messages.
+
+    Follows new shard blocks with a ``BlockScanner`` and matches the
+    inbound external message of every transaction by normalized hash.
+    Each tracked message gets a future resolved with the transaction
+    that processed it, so one scan confirms any number of messages
+    without polling the destination contracts.
+    """
+
+    def __init__(
+        self,
+        client: LiteBalancer | LiteClient,
+        *,
+        timeout: float = 60.0,
+        history: int = 4096,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """Initialize the delivery tracker.
+
+        :param client: Lite client or balancer.
+        :param timeout: Default delivery wait time in seconds.
+        :param history: Number of recently seen external message hashes
+            kept, so messages tracked after their block was scanned still resolve.
+        :param poll_interval: Masterchain poll delay in seconds.
+        """
+        self._timeout = timeout
+        self._history = history
+        self._scanner = BlockScanner(
+            client,
+            on_transactions=self._on_transactions,
+            poll_interval=poll_interval,
+        )
+
+        self._pending: dict[str, asyncio.Future[Transaction]] = {}
+        self._waiters: dict[str, int] = {}
+        self._seen: OrderedDict[str, Transaction] = OrderedDict()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """``True`` while blocks are being scanned."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        """Number of tracked messages not yet delivered."""
+        return len(self._pending)
+
+    @staticmethod
+    def _message_hash(message: MessageRef) -> str:
+        """Return the normalized hash of a message or pass a hex hash through."""
+        return message if isinstance(message, str) else message.normalized_hash
+
+    def _remember(self, msg_hash: str, transaction: Transaction) -> None:
+        """Store a seen external message hash, evicting the oldest entries."""
+        self._seen[msg_hash] = transaction
+        self._seen.move_to_end(msg_hash)
+        while len(self._seen) > self._history:
+            self._seen.popitem(last=False)
+
+    async def _on_transactions(self, event: TransactionsEvent) -> None:
+        """Resolve tracked messages delivered in a scanned shard block."""
+        for transaction in event.transactions:
+            in_msg = transaction.in_msg
+            if in_msg is None or not in_msg.is_external:
+                continue
+
+            msg_hash = normalize_hash(in_msg)
+            self._remember(msg_hash, transaction)
+
+            future = self._pending.pop(msg_hash, None)
+            self._waiters.pop(msg_hash, None)
+            if future is not None and not future.done():
+                future.set_result(transaction)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every pending future with the given error."""
+        pending, self._pending = self._pending, {}
+        self._waiters.clear()
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _discard(self, msg_hash: str, future: asyncio.Future[Transaction]) -> None:
+        """Drop one waiter of a message; stop tracking it once none are left."""
+        if self._pending.get(msg_hash) is not future:
+            return
+        waiters = self._waiters.get(msg_hash, 1) - 1
+        if waiters > 0:
+            self._waiters[msg_hash] = waiters
+            return
+        del self._pending[msg_hash]
+        self._waiters.pop(msg_hash, None)
+        future.cancel()
+
+    def track(self, message: MessageRef) -> asyncio.Future[Transaction]:
+        """Register a message and return a future for its transaction.
+
+        Concurrent registrations of the same message share one future.
+
+        :param message: Sent ``ExternalMessage`` or its normalized hash (hex).
+        :return: Future resolved with the processing ``Transaction``.
+        :raises ClientError: If the tracker is not running.
+        """
+        if not self.running:
+            raise ClientError(
+                "DeliveryTracker is not running.",
+                hint="Call start() or use `async with DeliveryTracker(...)` before sending messages.",
+            )
+
+        msg_hash = self._message_hash(message)
+        future = self._pending.get(msg_hash)
+        if future is not None:
+            self._waiters[msg_hash] += 1
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        transaction = self._seen.get(msg_hash)
+        if transaction is not None:
+            future.set_result(transaction)
+        else:
+            self._pending[msg_hash] = future
+            self._waiters[msg_hash] = 1
+        return future
+
+    async def wait(
+        self,
+        message: MessageRef,
+        timeout: float | None = None,
+    ) -> Transaction:
+        """Wait until a message is processed on-chain.
+
+        :param message: Sent ``ExternalMessage`` or its normalized hash (hex).
+        :param timeout: Wait time in seconds, or ``None`` for the tracker default.
+        :return: Transaction that processed the message.
+        :raises ClientError: If the message is not delivered in time.
+        """
+        return (await self.wait_many([message], timeout))[0]
+
+    async def wait_many(
+        self,
+        messages: t.Sequence[MessageRef],
+        timeout: float | None = None,
+    ) -> list[Transaction]:
+        """Wait until all messages are processed on-chain.
+
+        :param messages: Sent ``ExternalMessage`` objects or normalized hashes (hex).
+        :param timeout: Shared wait time in seconds, or ``None`` for the tracker default.
+        :return: Transactions in the order of ``messages``.
+        :raises ClientError: If any message is not delivered in time.
+        """
+        timeout = self._timeout if timeout is None else timeout
+        hashes = [self._message_hash(message) for message in messages]
+        futures = [self.track(msg_hash) for msg_hash in hashes]
+
+        if futures:
+            await asyncio.wait(futures, timeout=timeout)
+
+        missing = [(h, f) for h, f in zip(hashes, futures) if not f.done()]
+        if missing:
+            for msg_hash, future in missing:
+                self._discard(msg_hash, future)
+            raise ClientError(
+                f"{len(missing)} of {len(futures)} message(s) not delivered within {timeout}s "
+                f"(first: {missing[0][0]}).",
+                hint="Messages may have expired or been rejected by the wallet contract. "
+                "Check wallet balance, valid_until, and seqno on-chain.",
+            )
+        return [future.result() for future in futures]
+
+    async def _run(self) -> None:
+        """Run the block scanner and fail pending waits if it stops on error."""
+        try:
+            await self._scanner.start()
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self._fail_pending(error)
+
+    async def start(self) -> None:
+        """Start scanning new blocks in the background.
+
+        :raises RuntimeError: If already running or no masterchain block is available.
+        """
+        if self.running:
+            raise RuntimeError("DeliveryTracker already running")
+        if self._scanner.last_mc_block is None:
+            raise RuntimeError("No masterchain block available")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop scanning and cancel pending waits."""
+        await self._scanner.stop()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        pending, self._pending = self._pending, {}
+        self._waiters.clear()
+        for future in pending.values():
+            future.cancel()
+
+    async def __aenter__(self) -> DeliveryTracker:
+        """Start tracking and return self."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: t.Any | None,
+    ) -> None:
+        """Stop tracking."""
+        await self.stop()
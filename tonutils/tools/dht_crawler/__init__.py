@@ -0,0 +1,6 @@
+from .crawler import CrawlStats, DhtCrawler
+
+__all__ = [
+    "CrawlStats",
+    "DhtCrawler",
+]
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+import typing as t
+from contextlib import suppress
+from dataclasses import dataclass, field
+
+from tonutils.exceptions import NotConnectedError
+
+if t.TYPE_CHECKING:
+    from tonutils.clients.dht import DhtNetwork, DhtNode
+
+_TARGET_PREFIXES = 256
+
+
+@dataclass
+class CrawlStats:
+    """Progress counters of a ``DhtCrawler`` run."""
+
+    discovered: int = 0
+    """Unique nodes found (by ADNL ID), including the starting nodes."""
+
+    queried: int = 0
+    """``dht.findNode`` queries answered."""
+
+    failed: int = 0
+    """``dht.findNode`` queries that failed or timed out."""
+
+    verified: int = 0
+    """Node records whose signature was checked."""
+
+    duplicates: int = 0
+    """Node records skipped because they were already seen."""
+
+    started_at: float = field(default_factory=time.monotonic)
+    """Monotonic start time."""
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the crawl started."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Discovered nodes per second."""
+        elapsed = self.elapsed
+        return self.discovered / elapsed if elapsed > 0 else 0.0
+
+
+class DhtCrawler:
+    """Discover DHT nodes by walking the keyspace.
+
+    Starting from the network's routing table, every known node is
+    asked for the nodes closest to targets spread over the keyspace
+    (the first target byte rotates through all 256 prefixes). Each
+    ``dht.node`` record is verified once, nodes are deduplicated by
+    ADNL ID, and every new node is queried in turn, so the crawl fans
+    out until no unseen nodes are returned.
+
+    Discovered nodes are added to the network's routing table and,
+    with a ``sink``, written as NDJSON lines::
+
+        {"adnl_id": "...", "addr": "1.2.3.4:3333", "pub_key": "...", "via": "...", "found_at": 1700000000.0}
+    """
+
+    def __init__(
+        self,
+        network: DhtNetwork,
+        *,
+        concurrency: int = 64,
+        queries_per_node: int = 2,
+        sink: str | os.PathLike[str] | t.TextIO | None = None,
+    ) -> None:
+        """Initialize the crawler.
+
+        :param network: Connected DHT network.
+        :param concurrency: Number of ``dht.findNode`` queries in flight.
+        :param queries_per_node: Targets asked of each node.
+        :param sink: NDJSON output path (appended to) or text stream, or ``None``.
+        """
+        self._network = network
+        self._concurrency = concurrency
+        self._queries_per_node = queries_per_node
+        self._sink = sink
+
+        self._nodes: dict[bytes, DhtNode] = {}
+        self._records: set[bytes] = set()
+        self._next_prefix = 0
+        self._stats = CrawlStats()
+
+    @property
+    def nodes(self) -> list[DhtNode]:
+        """Nodes discovered so far."""
+        return list(self._nodes.values())
+
+    @property
+    def stats(self) -> CrawlStats:
+        """Counters of the current or last crawl."""
+        return self._stats
+
+    def _next_target(self) -> bytes:
+        """Return a random target whose first byte rotates through all prefixes."""
+        prefix = self._next_prefix
+        self._next_prefix = (prefix + 1) % _TARGET_PREFIXES
+        return bytes([prefix]) + os.urandom(31)
+
+    def _accept(self, node_tl: dict[str, t.Any]) -> DhtNode | None:
+        """Verify a ``dht.node`` record once and return it if the node is new.
+
+        A signature is remembered only after the record verifies, so a
+        forged copy carrying a genuine signature cannot shadow the real record.
+        """
+        signature = node_tl.get("signature", b"")
+        record_id = signature if isinstance(signature, bytes) else str(signature).encode()
+        if record_id in self._records:
+            self._stats.duplicates += 1
+            return None
+
+        self._stats.verified += 1
+        dht_node = self._network.provider.codec.parse_node(node_tl)
+        if dht_node is None:
+            return None
+        self._records.add(record_id)
+        if dht_node.adnl_id in self._nodes:
+            self._stats.duplicates += 1
+            return None
+        return dht_node
+
+    async def crawl(
+        self,
+        timeout: float | None = None,
+        max_nodes: int | None = None,
+        on_progress: t.Callable[[CrawlStats], None] | None = None,
+    ) -> CrawlStats:
+        """Crawl until no new nodes appear, or a limit is reached.
+
+        :param timeout: Crawl time limit in seconds, or ``None``.
+        :param max_nodes: Stop after this many unique nodes, or ``None``.
+        :param on_progress: Called with the stats after each answered query.
+        :return: Final ``CrawlStats``.
+        :raises NotConnectedError: If the network is not connected.
+        """
+        network = self._network
+        if not network.connected:
+            raise NotConnectedError(component="DhtCrawler", operation="crawl")
+
+        provider = network.provider
+        self._stats = stats = CrawlStats()
+        queue: asyncio.Queue[DhtNode] = asyncio.Queue()
+        done = asyncio.Event()
+
+        sink, owns_sink = self._open_sink()
+
+        def discover(dht_node: DhtNode, via: DhtNode | None) -> None:
+            self._nodes[dht_node.adnl_id] = dht_node
+            stats.discovered += 1
+            for _ in range(self._queries_per_node):
+                queue.put_nowait(dht_node)
+            if sink is not None:
+                sink.write(
+                    json.dumps(
+                        {
+                            "adnl_id": dht_node.adnl_id.hex(),
+                            "addr": dht_node.addr,
+                            "pub_key": dht_node.server_key.hex(),
+                            "via": via.adnl_id.hex() if via is not None else None,
+                            "found_at": time.time(),
+                        }
+                    )
+                    + "\n"
+                )
+            if max_nodes is not None and stats.discovered >= max_nodes:
+                done.set()
+
+        async def worker() -> None:
+            while True:
+                node = await queue.get()
+                try:
+                    if done.is_set():
+                        continue
+                    try:
+                        found = await provider.find_nodes(node, self._next_target(), provider.k)
+                    except Exception:
+                        stats.failed += 1
+                        continue
+                    stats.queried += 1
+                    for node_tl in found:
+                        dht_node = self._accept(node_tl)
+                        if dht_node is not None and not done.is_set():
+                            network.routing_table.add(dht_node)
+                            discover(dht_node, node)
+                    if on_progress is not None:
+                        with suppress(Exception):
+                            on_progress(stats)
+                finally:
+                    queue.task_done()
+
+        for dht_node in network.routing_table.get_nodes():
+            if dht_node.adnl_id not in self._nodes:
+                discover(dht_node, None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self._concurrency)]
+        drained = asyncio.create_task(queue.join())
+        stopped = asyncio.create_task(done.wait())
+        try:
+            await asyncio.wait({drained, stopped}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (*workers, drained, stopped):
+                task.cancel()
+            await asyncio.gather(*workers, drained, stopped, return_exceptions=True)
+            if sink is not None:
+                sink.flush()
+                if owns_sink:
+                    sink.close()
+        return stats
+
+    def _open_sink(self) -> tuple[t.TextIO | None, bool]:
+        """Return the NDJSON output stream and whether the crawler opened it."""
+        if self._sink is None:
+            return None, False
+        if isinstance(self._sink, (str, os.PathLike)):
+            return open(self._sink, "a"), True
+        return self._sink, False
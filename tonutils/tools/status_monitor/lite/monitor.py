@@ -4,12 +4,7 @@ import asyncio
 import time
 import typing as t
 
-from ton_core import (
-    MAINNET_GENESIS_UTIME,
-    MASTERCHAIN_SHARD,
-    NetworkGlobalID,
-    WorkchainID,
-)
+from ton_core import NetworkGlobalID
 
 from tonutils.clients import LiteClient
 from tonutils.tools.status_monitor.base import BaseMonitor
@@ -231,55 +226,8 @@ class LiteServerMonitor(BaseMonitor[LiteClient, LiteServerStatus]):
         """Binary-search for the earliest archived block timestamp."""
         try:
             now = int(time.time())
-            result = await self._find_archive_depth(client, now, self._archive_cache.get(index))
+            result = await client.find_archive_depth(now, self._archive_cache.get(index))
             self._archive_cache[index] = result
             await self._set_status(index, archive_from=result)
         except Exception as e:
             await self._set_status(index, last_error=str(e))
-
-    @staticmethod
-    async def _find_archive_depth(
-        client: LiteClient,
-        now: int,
-        cached: int | None = None,
-    ) -> int:
-        """Find the earliest archive timestamp via binary search.
-
-        :param client: Liteserver client.
-        :param now: Current unix timestamp.
-        :param cached: Previously found timestamp, or ``None``.
-        :return: Earliest archive unix timestamp.
-        """
-        seconds_per_day = 86400
-        seconds_diff = now - MAINNET_GENESIS_UTIME
-        right = seconds_diff // seconds_per_day
-
-        if cached is not None:
-            cached_days = (now - cached) // seconds_per_day
-            left = cached_days
-            best_days = cached_days
-        else:
-            left = 0
-            best_days = 0
-
-        async def probe(days: int) -> bool:
-            utime = now - days * seconds_per_day
-            try:
-                _, block = await client.provider.lookup_block(
-                    workchain=WorkchainID.MASTERCHAIN,
-                    shard=MASTERCHAIN_SHARD,
-                    utime=utime,
-                )
-                return abs(block.info.gen_utime - utime) <= seconds_per_day
-            except Exception:
-                return False
-
-        while left <= right:
-            mid = (left + right) // 2
-            if await probe(mid):
-                best_days = mid
-                left = mid + 1
-            else:
-                right = mid - 1
-
-        return now - best_days * seconds_per_day
@@ -1,9 +1,10 @@
 from .channel import AdnlChannel
 from .tcp import AdnlTcpTransport
-from .udp import AdnlUdpTransport
+from .udp import AdnlUdpTransport, UdpReceiveStats
 
 __all__ = [
     "AdnlChannel",
     "AdnlTcpTransport",
     "AdnlUdpTransport",
+    "UdpReceiveStats",
 ]
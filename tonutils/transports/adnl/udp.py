@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import time
 import typing as t
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 
 from ton_core import (
@@ -26,6 +28,15 @@ _PUB_ED25519_PREFIX = b"\xc6\xb4\x13\x48"
 """TL constructor prefix for ``pub.ed25519`` (0x4813b4c6 LE)."""
 
 
+_SHARED_KEY_CACHE_SIZE = 4096
+"""Maximum number of per-peer X25519 shared keys kept by a transport."""
+
+
+def _tl_bytes_size(length: int) -> int:
+    """Return the padded TL ``bytes`` size for a short (< 254) payload."""
+    return (length + 4) // 4 * 4
+
+
 def _compute_key_id(pub_key: bytes) -> bytes:
     """Compute ADNL key ID from Ed25519 public key.
 
@@ -69,21 +80,57 @@ class _PeerState:
     dst_reinit_date: int = 0
     """Remote reinitialization timestamp."""
 
+    shard: int = 0
+    """Index of the socket used for this peer."""
+
     def __post_init__(self) -> None:
         """Set default ``endpoint`` from ``host`` and ``port`` if empty."""
         if not self.endpoint:
             self.endpoint = f"{self.host}:{self.port}"
 
 
+@dataclass
+class UdpReceiveStats:
+    """Receive path counters of an ``AdnlUdpTransport``."""
+
+    received: int = 0
+    """Datagrams delivered by the socket."""
+
+    inline: int = 0
+    """Channel datagrams handled directly in the protocol callback."""
+
+    queued: int = 0
+    """Datagrams placed in the receive ring."""
+
+    dropped: int = 0
+    """Datagrams discarded because the receive ring was full."""
+
+
+class _UdpShard:
+    """One UDP socket of a transport with its own receive ring."""
+
+    def __init__(self, index: int, ring_size: int) -> None:
+        """Initialize an unbound shard.
+
+        :param index: Shard index.
+        :param ring_size: Capacity of the receive ring in datagrams.
+        """
+        self.index = index
+        self.ring: deque[tuple[bytes, tuple[str, int]]] = deque()
+        self.ring_size = ring_size
+        self.ready = asyncio.Event()
+        self.udp: asyncio.DatagramTransport | None = None
+
+
 class _UdpProtocol(asyncio.DatagramProtocol):
-    """Asyncio DatagramProtocol adapter that queues incoming datagrams."""
+    """Asyncio DatagramProtocol adapter that hands datagrams to the transport."""
 
-    def __init__(self, incoming: asyncio.Queue[tuple[bytes, tuple[str, int]]]) -> None:
+    def __init__(self, on_datagram: t.Callable[[bytes, tuple[str, int]], None]) -> None:
         """Initialize the UDP protocol adapter.
 
-        :param incoming: Queue for received datagrams.
+        :param on_datagram: Callback for each received datagram.
         """
-        self._incoming = incoming
+        self._on_datagram = on_datagram
         self.transport: asyncio.DatagramTransport | None = None
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
@@ -99,7 +146,7 @@ class _UdpProtocol(asyncio.DatagramProtocol):
         :param data: Raw datagram bytes.
         :param addr: Sender ``(host, port)`` tuple.
         """
-        self._incoming.put_nowait((data, addr))
+        self._on_datagram(data, addr)
 
     def error_received(self, exc: Exception | None) -> None:
         """Handle protocol error.
@@ -119,20 +166,54 @@ class AdnlUdpTransport:
 
     Manages a single UDP socket with per-peer channel-based encryption.
     Uses Ed25519 for packet signing and Curve25519 ECDH for key exchange.
+
+    Datagrams for established channels go straight to the inline
+    handler, if one is set; everything else lands in a bounded receive
+    ring that readers drain in batches. When the ring is full, new
+    datagrams are dropped, so channel traffic (query answers) keeps
+    flowing under overload.
+
+    With ``sockets > 1`` the transport binds several sockets and pins
+    each peer to one of them by its ADNL ID. Every socket has its own
+    receive ring, drained by its own reader.
     """
 
-    def __init__(self) -> None:
-        """Initialize the ADNL UDP transport with a fresh Ed25519 key pair."""
+    def __init__(
+        self,
+        receive_buffer: int = 4096,
+        sockets: int = 1,
+        reuse_port: bool = False,
+    ) -> None:
+        """Initialize the ADNL UDP transport with a fresh Ed25519 key pair.
+
+        :param receive_buffer: Capacity of each receive ring in datagrams.
+        :param sockets: Number of UDP sockets to bind.
+        :param reuse_port: Bind every socket to the same port with
+            ``SO_REUSEPORT`` (Linux), so several processes can share it.
+        :raises ValueError: If ``sockets`` is below 1.
+        """
+        if sockets < 1:
+            raise ValueError(f"sockets must be at least 1, got {sockets}")
+
         self._client = Client(Client.generate_ed25519_private_key())
         self._local_pub = bytes(self._client.ed25519_public)
         self._local_key_id = _compute_key_id(self._local_pub)
+        self._local_key_id_hex = self._local_key_id.hex()
 
         self.tl_schemas = TlGenerator.with_default_schemas().generate()
         self._pkt_schema = self.tl_schemas.get_by_name("adnl.packetContents")
 
-        self._incoming: asyncio.Queue[tuple[bytes, tuple[str, int]]] = asyncio.Queue()
-        self._protocol: _UdpProtocol | None = None
-        self._udp_transport: asyncio.DatagramTransport | None = None
+        pub_schema = self.tl_schemas.get_by_name("pub.ed25519")
+        if pub_schema is None:
+            raise RuntimeError("TL schema 'pub.ed25519' not found")
+        self._local_from = self.tl_schemas.serialize(pub_schema, {"key": self._local_pub.hex()})
+        self._x25519_private = self._client.x25519_private.encode()
+        self._shared_keys: OrderedDict[bytes, bytes] = OrderedDict()
+
+        self._shards = [_UdpShard(index, receive_buffer) for index in range(sockets)]
+        self._reuse_port = reuse_port
+        self._inline_handler: t.Callable[[bytes, tuple[str, int]], None] | None = None
+        self._stats = UdpReceiveStats()
 
         self._peers: dict[str, _PeerState] = {}
         self._channels: dict[bytes, _PeerState] = {}
@@ -150,6 +231,42 @@ class AdnlUdpTransport:
         """``True`` if the UDP socket is bound."""
         return self._bound
 
+    @property
+    def shard_count(self) -> int:
+        """Number of UDP sockets."""
+        return len(self._shards)
+
+    @property
+    def receive_stats(self) -> UdpReceiveStats:
+        """Receive path counters."""
+        return self._stats
+
+    def set_inline_handler(self, handler: t.Callable[[bytes, tuple[str, int]], None] | None) -> None:
+        """Handle channel datagrams directly in the protocol callback.
+
+        The handler runs synchronously on the event loop for every
+        datagram addressed to an established channel and must not raise.
+
+        :param handler: Callback taking ``(raw datagram, sender address)``, or ``None``.
+        """
+        self._inline_handler = handler
+
+    def _on_datagram(self, shard: _UdpShard, data: bytes, addr: tuple[str, int]) -> None:
+        """Route a received datagram inline or into its shard's receive ring."""
+        stats = self._stats
+        stats.received += 1
+        handler = self._inline_handler
+        if handler is not None and data[:32] in self._channels:
+            stats.inline += 1
+            handler(data, addr)
+            return
+        if len(shard.ring) >= shard.ring_size:
+            stats.dropped += 1
+            return
+        shard.ring.append((data, addr))
+        stats.queued += 1
+        shard.ready.set()
+
     @staticmethod
     def _get_rand() -> bytes:
         """Generate random padding for ADNL packets.
@@ -162,23 +279,49 @@ class AdnlUdpTransport:
         return rand[1:8]
 
     async def bind(self, host: str = "0.0.0.0", port: int = 0) -> None:
-        """Bind the UDP socket.
+        """Bind the UDP sockets.
 
         :param host: Local bind address.
-        :param port: Local bind port (0 for ephemeral).
+        :param port: Local bind port (0 for ephemeral). With ``reuse_port``,
+            all sockets share the port picked for the first one.
         """
         if self._bound:
             return
 
         loop = asyncio.get_running_loop()
-        transport, protocol = await loop.create_datagram_endpoint(
-            lambda: _UdpProtocol(self._incoming),
-            local_addr=(host, port),
-        )
-        self._udp_transport = transport
-        self._protocol = protocol
+        try:
+            for shard in self._shards:
+                udp, _ = await loop.create_datagram_endpoint(
+                    functools.partial(self._make_protocol, shard),
+                    local_addr=(host, port),
+                    reuse_port=self._reuse_port or None,
+                )
+                shard.udp = udp
+                if self._reuse_port and port == 0:
+                    port = udp.get_extra_info("sockname")[1]
+        except BaseException:
+            self._close_sockets()
+            raise
         self._bound = True
 
+    def _make_protocol(self, shard: _UdpShard) -> _UdpProtocol:
+        """Create the protocol adapter for a shard's socket."""
+        return _UdpProtocol(lambda data, addr: self._on_datagram(shard, data, addr))
+
+    def _socket(self, peer: _PeerState) -> asyncio.DatagramTransport:
+        """Return the bound socket for a peer."""
+        udp = self._shards[peer.shard].udp
+        if not self._bound or udp is None:
+            raise NotConnectedError(component="AdnlUdpTransport", operation="send")
+        return udp
+
+    def _close_sockets(self) -> None:
+        """Close all bound sockets."""
+        for shard in self._shards:
+            if shard.udp is not None:
+                shard.udp.close()
+                shard.udp = None
+
     def get_or_create_peer_raw(
         self,
         *,
@@ -203,6 +346,7 @@ class AdnlUdpTransport:
             port=port,
             pub_key=pub_key,
             peer_id=peer_id,
+            shard=int.from_bytes(peer_id[:4], "big") % len(self._shards),
         )
         self._peers[key] = peer
         return peer
@@ -252,6 +396,52 @@ class AdnlUdpTransport:
             raise RuntimeError("TL schema 'adnl.packetContents' not found")
         return self.tl_schemas.serialize(self._pkt_schema, self._compute_flags(data))
 
+    @staticmethod
+    def _with_signature(serialized: bytes, rand1_len: int, rand2_len: int, signature: bytes) -> bytes:
+        """Turn a serialized unsigned packet into the signed one.
+
+        ``signature`` is the last optional field before ``rand2``, so the
+        signed packet is the unsigned one with flag bit 11 set and the
+        TL-encoded signature spliced in front of ``rand2``.
+
+        :param serialized: Serialized packet without a signature.
+        :param rand1_len: Length of ``rand1`` in bytes.
+        :param rand2_len: Length of ``rand2`` in bytes.
+        :param signature: 64-byte Ed25519 signature.
+        :return: Serialized signed packet.
+        """
+        flags_at = 4 + _tl_bytes_size(rand1_len)
+        rand2_at = len(serialized) - _tl_bytes_size(rand2_len)
+        flags = int.from_bytes(serialized[flags_at : flags_at + 4], "little") | 1 << 11
+        signature_tl = bytes([len(signature)]) + signature + bytes(_tl_bytes_size(len(signature)) - 1 - len(signature))
+        return b"".join(
+            (
+                serialized[:flags_at],
+                flags.to_bytes(4, "little"),
+                serialized[flags_at + 4 : rand2_at],
+                signature_tl,
+                serialized[rand2_at:],
+            )
+        )
+
+    def _shared_key(self, pub_key: bytes) -> bytes:
+        """Return the X25519 shared key with a peer, cached per public key.
+
+        :param pub_key: Peer Ed25519 public key (32 bytes).
+        :return: 32-byte shared key.
+        """
+        shared_key = self._shared_keys.get(pub_key)
+        if shared_key is not None:
+            self._shared_keys.move_to_end(pub_key)
+            return shared_key
+
+        peer_server = Server("", 0, pub_key)
+        shared_key = get_shared_key(self._x25519_private, peer_server.x25519_public.encode())
+        self._shared_keys[pub_key] = shared_key
+        if len(self._shared_keys) > _SHARED_KEY_CACHE_SIZE:
+            self._shared_keys.popitem(last=False)
+        return shared_key
+
     async def send_init_packet_raw(
         self,
         *,
@@ -268,7 +458,7 @@ class AdnlUdpTransport:
         :param messages: ADNL message dicts (with ``@type``).
         :return: Peer state.
         """
-        if not self._bound or self._udp_transport is None:
+        if not self._bound:
             raise NotConnectedError(
                 component="AdnlUdpTransport",
                 operation="send_init_packet",
@@ -282,17 +472,10 @@ class AdnlUdpTransport:
         sending_seqno = peer.seqno + 1
 
         ts = int(time.time())
-        pub_schema = self.tl_schemas.get_by_name("pub.ed25519")
-        if pub_schema is None:
-            raise RuntimeError("TL schema 'pub.ed25519' not found")
-        from_bytes = self.tl_schemas.serialize(
-            pub_schema,
-            {"key": self._local_pub.hex()},
-        )
-
+        rand1, rand2 = self._get_rand(), self._get_rand()
         data: dict[str, t.Any] = {
-            "rand1": self._get_rand(),
-            "from": from_bytes,
+            "rand1": rand1,
+            "from": self._local_from,
             "messages": messages,
             "address": {
                 "addrs": [],
@@ -306,20 +489,15 @@ class AdnlUdpTransport:
             "recv_addr_list_version": ts,
             "reinit_date": ts,
             "dst_reinit_date": 0,
-            "rand2": self._get_rand(),
+            "rand2": rand2,
         }
 
         serialized_unsigned = self._serialize_packet(data)
         signature = self._client.sign(serialized_unsigned)
-        data["signature"] = signature
-        serialized_signed = self._serialize_packet(data)
+        serialized_signed = self._with_signature(serialized_unsigned, len(rand1), len(rand2), signature)
 
         checksum = hashlib.sha256(serialized_signed).digest()
-        peer_server = Server(host, port, pub_key)
-        shared_key = get_shared_key(
-            self._client.x25519_private.encode(),
-            peer_server.x25519_public.encode(),
-        )
+        shared_key = self._shared_key(pub_key)
         cipher = create_aes_ctr_cipher(
             shared_key[0:16] + checksum[16:32],
             checksum[0:4] + shared_key[20:32],
@@ -327,7 +505,7 @@ class AdnlUdpTransport:
         encrypted = aes_ctr_encrypt(cipher, serialized_signed)
 
         packet = peer.peer_id + self._local_pub + checksum + encrypted
-        self._udp_transport.sendto(packet, (host, port))
+        self._socket(peer).sendto(packet, (host, port))
         peer.seqno = sending_seqno
         return peer
 
@@ -341,7 +519,7 @@ class AdnlUdpTransport:
         :param peer: Target peer.
         :param data: Packet contents fields (messages, etc).
         """
-        if not self._bound or self._udp_transport is None:
+        if not self._bound:
             raise NotConnectedError(
                 component="AdnlUdpTransport",
                 operation="send_channel_packet",
@@ -355,14 +533,14 @@ class AdnlUdpTransport:
 
         sending_seqno = peer.seqno + 1
         data["rand1"] = self._get_rand()
-        data["from_short"] = {"id": self._local_key_id.hex()}
+        data["from_short"] = {"id": self._local_key_id_hex}
         data["rand2"] = self._get_rand()
         data["seqno"] = sending_seqno
         data["confirm_seqno"] = peer.confirm_seqno
 
         serialized = self._serialize_packet(data)
         packet = peer.channel.encrypt(serialized)
-        self._udp_transport.sendto(packet, (peer.host, peer.port))
+        self._socket(peer).sendto(packet, (peer.host, peer.port))
         peer.seqno = sending_seqno
 
     def set_channel(self, peer: _PeerState, channel: AdnlChannel) -> None:
@@ -407,7 +585,7 @@ class AdnlUdpTransport:
         """
         from tonutils.transports.adnl.channel import AdnlChannel as _AdnlChannel
 
-        if not self._bound or self._udp_transport is None:
+        if not self._bound:
             raise NotConnectedError(
                 component="AdnlUdpTransport",
                 operation="establish_channel",
@@ -526,11 +704,7 @@ class AdnlUdpTransport:
             checksum = data[64:96]
             encrypted = data[96:]
 
-            peer_server = Server("", 0, sender_pub)
-            shared_key = get_shared_key(
-                self._client.x25519_private.encode(),
-                peer_server.x25519_public.encode(),
-            )
+            shared_key = self._shared_key(sender_pub)
             cipher = create_aes_ctr_cipher(
                 shared_key[0:16] + checksum[16:32],
                 checksum[0:4] + shared_key[20:32],
@@ -542,12 +716,36 @@ class AdnlUdpTransport:
 
         return b"", None
 
-    async def recv_raw(self) -> tuple[bytes, tuple[str, int]]:
-        """Receive a raw datagram from the UDP socket.
+    @staticmethod
+    async def _wait_ready(shard: _UdpShard) -> None:
+        """Wait until a shard's receive ring holds at least one datagram."""
+        while not shard.ring:
+            shard.ready.clear()
+            await shard.ready.wait()
+
+    async def recv_raw(self, shard: int = 0) -> tuple[bytes, tuple[str, int]]:
+        """Receive a raw datagram from a UDP socket.
 
+        :param shard: Socket index.
         :return: Tuple of (raw bytes, sender address).
         """
-        return await self._incoming.get()
+        udp_shard = self._shards[shard]
+        await self._wait_ready(udp_shard)
+        return udp_shard.ring.popleft()
+
+    async def recv_batch(self, shard: int = 0) -> list[tuple[bytes, tuple[str, int]]]:
+        """Receive every datagram queued on a socket since the last call.
+
+        Waits for at least one datagram.
+
+        :param shard: Socket index.
+        :return: List of (raw bytes, sender address) tuples in arrival order.
+        """
+        udp_shard = self._shards[shard]
+        await self._wait_ready(udp_shard)
+        batch = list(udp_shard.ring)
+        udp_shard.ring.clear()
+        return batch
 
     def get_peer(self, endpoint: str) -> _PeerState | None:
         """Retrieve peer state by endpoint.
@@ -568,9 +766,7 @@ class AdnlUdpTransport:
                 fut.cancel()
         self._channel_pending.clear()
 
-        if self._udp_transport is not None:
-            self._udp_transport.close()
-            self._udp_transport = None
-            self._protocol = None
-
-        self._incoming = asyncio.Queue()
+        self._close_sockets()
+        for shard in self._shards:
+            shard.ring.clear()
+            shard.ready = asyncio.Event()
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
-from dataclasses import asdict, dataclass, fields
+from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
 
 from ton_core import BlockIdExt, BlockRef, Cell, ContractState, StateInit
 
 from tonutils.exceptions import CDN_CHALLENGE_MARKERS
 
+if t.TYPE_CHECKING:
+    from tonutils.clients.base import BaseClient
+
 __all__ = [
     "DEFAULT_ADNL_RETRY_POLICY",
     "DEFAULT_CONNECT_TIMEOUT",
@@ -18,6 +22,7 @@ __all__ = [
     "LITESERVER_BLOCK_NOT_IN_DB_CODE",
     "LITESERVER_RATE_LIMIT_CODES",
     "BaseModel",
+    "BroadcastResult",
     "ClientType",
     "ContractInfo",
     "MasterchainInfo",
@@ -82,7 +87,11 @@ class ClientType(str, Enum):
 
 
 class ContractInfo:
-    """TON smart-contract on-chain state snapshot."""
+    """TON smart-contract on-chain state snapshot.
+
+    Code and data are kept as raw BoC strings and/or parsed cells; each
+    form is produced from the other at most once, on first access.
+    """
 
     def __init__(
         self,
@@ -92,6 +101,8 @@ class ContractInfo:
         state: ContractState = ContractState.NONEXIST,
         last_transaction_lt: int | None = None,
         last_transaction_hash: str | None = None,
+        code: Cell | None = None,
+        data: Cell | None = None,
     ) -> None:
         """Initialize contract info.
 
@@ -101,23 +112,69 @@ class ContractInfo:
         :param state: Current lifecycle state.
         :param last_transaction_lt: Logical time of last transaction.
         :param last_transaction_hash: Hash of last transaction.
+        :param code: Parsed contract code, used instead of ``code_raw`` if set.
+        :param data: Parsed contract data, used instead of ``data_raw`` if set.
         """
-        self.code_raw = code_raw
-        self.data_raw = data_raw
+        self._code_raw = code_raw
+        self._data_raw = data_raw
+        self._code = code
+        self._data = data
         self.balance = balance
         self.state = state
         self.last_transaction_lt = last_transaction_lt
         self.last_transaction_hash = last_transaction_hash
 
+    @property
+    def code_raw(self) -> str | None:
+        """BoC of contract code, or ``None`` if absent."""
+        if self._code_raw is None and self._code is not None:
+            self._code_raw = self._code.to_boc().hex()
+        return self._code_raw
+
+    @code_raw.setter
+    def code_raw(self, value: str | None) -> None:
+        """Set the code BoC and drop the parsed cell."""
+        self._code_raw = value
+        self._code = None
+
+    @property
+    def data_raw(self) -> str | None:
+        """BoC of contract data, or ``None`` if absent."""
+        if self._data_raw is None and self._data is not None:
+            self._data_raw = self._data.to_boc().hex()
+        return self._data_raw
+
+    @data_raw.setter
+    def data_raw(self, value: str | None) -> None:
+        """Set the data BoC and drop the parsed cell."""
+        self._data_raw = value
+        self._data = None
+
     @property
     def code(self) -> Cell | None:
         """Parsed ``Cell`` from ``code_raw``, or ``None`` if absent."""
-        return Cell.one_from_boc(self.code_raw) if self.code_raw else None
+        if self._code is None and self._code_raw:
+            self._code = Cell.one_from_boc(self._code_raw)
+        return self._code
+
+    @code.setter
+    def code(self, value: Cell | None) -> None:
+        """Set the parsed code cell and drop the raw BoC."""
+        self._code = value
+        self._code_raw = None
 
     @property
     def data(self) -> Cell | None:
         """Parsed ``Cell`` from ``data_raw``, or ``None`` if absent."""
-        return Cell.one_from_boc(self.data_raw) if self.data_raw else None
+        if self._data is None and self._data_raw:
+            self._data = Cell.one_from_boc(self._data_raw)
+        return self._data
+
+    @data.setter
+    def data(self, value: Cell | None) -> None:
+        """Set the parsed data cell and drop the raw BoC."""
+        self._data = value
+        self._data_raw = None
 
     @property
     def state_init(self) -> StateInit:
@@ -129,7 +186,15 @@ class ContractInfo:
 
         :return: String with all field values.
         """
-        parts = " ".join(f"{k}: {v!r}" for k, v in vars(self).items())
+        values = {
+            "code_raw": self.code_raw,
+            "data_raw": self.data_raw,
+            "balance": self.balance,
+            "state": self.state,
+            "last_transaction_lt": self.last_transaction_lt,
+            "last_transaction_hash": self.last_transaction_hash,
+        }
+        parts = " ".join(f"{k}: {v!r}" for k, v in values.items())
         return f"< {self.__class__.__name__} {parts} >"
 
 
@@ -309,3 +374,36 @@ class MasterchainInfo:
     def init_block(self) -> BlockIdExt:
         """Return the genesis block as ``BlockIdExt``."""
         return self._parse_raw_block(self.init)
+
+
+@dataclass
+class BroadcastResult:
+    """Outcome of an external message broadcast to several servers.
+
+    Returned as soon as the first server accepts the message; sends to
+    the remaining servers keep running and fill ``latencies`` and
+    ``errors`` as they complete (see ``wait()``).
+    """
+
+    accepted_by: BaseClient | None = None
+    """Client that accepted the message first."""
+
+    latencies: dict[BaseClient, float] = field(default_factory=dict)
+    """Acceptance latency in seconds per client."""
+
+    errors: dict[BaseClient, BaseException] = field(default_factory=dict)
+    """Send error per client."""
+
+    tasks: set[asyncio.Task[None]] = field(default_factory=set, repr=False)
+    """Per-client send tasks."""
+
+    @property
+    def latency(self) -> float | None:
+        """Acceptance latency of the first accepting client in seconds, or ``None``."""
+        if self.accepted_by is None:
+            return None
+        return self.latencies.get(self.accepted_by)
+
+    async def wait(self) -> None:
+        """Wait until every per-client send has completed."""
+        await asyncio.gather(*self.tasks, return_exceptions=True)